@@ -2,15 +2,24 @@
 
 from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
+import base64
+import binascii
+import functools
+import json
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 import os
+import re
 import sys
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import DB_PATH
+from config import API_CACHE_MAX_ENTRIES, API_CACHE_TTL, DB_PATH
+from database import Database
 
 # Serve frontend static files in production
 FRONTEND_DIR = Path(__file__).parent.parent / 'frontend' / 'dist'
@@ -18,6 +27,9 @@ FRONTEND_DIR = Path(__file__).parent.parent / 'frontend' / 'dist'
 app = Flask(__name__, static_folder=str(FRONTEND_DIR), static_url_path='')
 CORS(app)
 
+# Bring the schema up to date (e.g. compacted price history) before serving
+Database(DB_PATH).close()
+
 
 @app.route('/')
 def serve_frontend():
@@ -45,6 +57,214 @@ def dict_from_row(row):
     return dict(zip(row.keys(), row))
 
 
+class ResponseCache:
+    """Values computed from the database (JSON bodies of aggregate
+    endpoints, product counts), valid until the database changes.
+
+    The change token is `PRAGMA data_version` read on a long-lived
+    connection: SQLite bumps it whenever another connection (a scrape,
+    in this or another process) commits, so any ingest invalidates every
+    cached value. Values also expire after `ttl` seconds, since some of
+    them depend on the current date ("last 7 days"), and at most
+    `max_size` keys are kept (least recently used evicted first).
+    """
+
+    def __init__(self, ttl=API_CACHE_TTL, max_size=API_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._conn = None
+        self._lock = threading.Lock()
+        self._version = None
+        self._values = OrderedDict()
+
+    def _data_version(self):
+        """Current change token of the database (call with the lock held)."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        return self._conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def get(self, key, compute):
+        """Return the cached value for `key`, computing it if stale.
+
+        Args:
+            key: Cache key (e.g. request path and query string)
+            compute: Callable returning the value
+        """
+        with self._lock:
+            version = self._data_version()
+            if version != self._version:
+                self._version = version
+                self._values.clear()
+            cached = self._values.get(key)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                self._values.move_to_end(key)
+                return cached[1]
+
+        value = compute()
+        with self._lock:
+            # Drop the value if a scrape committed while it was computed
+            if self._version == version:
+                self._values[key] = (time.monotonic(), value)
+                self._values.move_to_end(key)
+                if len(self._values) > self.max_size:
+                    self._values.popitem(last=False)
+        return value
+
+
+response_cache = ResponseCache()
+count_cache = ResponseCache()
+
+
+def cached(view):
+    """Serve a JSON endpoint from `response_cache`."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        body = response_cache.get(request.full_path,
+                                  lambda: view(*args, **kwargs).get_data())
+        return app.response_class(body, mimetype='application/json')
+    return wrapper
+
+
+# Price of each product before its first change of the last N days (bound
+# parameter), read from the price_changes events recorded at ingest. SQLite
+# takes old_price from the row holding MIN(id), i.e. the earliest change.
+PRICE_BEFORE_WINDOW = '''
+    SELECT product_id, old_price, MIN(id) as first_change
+    FROM price_changes
+    WHERE detected_at >= datetime('now', '-' || ? || ' days')
+    GROUP BY product_id
+'''
+
+# Sort keys of /api/products (each has an index on products)
+SORT_FIELDS = ['name', 'brand', 'current_price', 'last_updated', 'first_seen']
+PRODUCTS_MAX_PER_PAGE = 500
+
+
+def encode_cursor(value, row_id):
+    """Opaque pagination cursor pointing after the row (sort value, id)."""
+    raw = json.dumps([value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor from `encode_cursor`.
+
+    Raises ValueError when the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, row_id = json.loads(raw)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+    if not isinstance(row_id, int) or not (value is None or isinstance(value, (str, int, float))):
+        raise ValueError(f'Invalid cursor: {cursor}')
+    return value, row_id
+
+
+def keyset_condition(column, descending, value, row_id):
+    """SQL condition selecting the products after (value, id) in sort order.
+
+    Rows are ordered by (column, id), both in the same direction. SQLite
+    sorts NULLs first in ascending order and last in descending order.
+
+    Returns (sql, params).
+    """
+    op = '<' if descending else '>'
+    if value is None:
+        if descending:
+            return f'(pr.{column} IS NULL AND pr.id < ?)', [row_id]
+        return f'((pr.{column} IS NULL AND pr.id > ?) OR pr.{column} IS NOT NULL)', [row_id]
+    sql = f'(pr.{column} {op} ? OR (pr.{column} = ? AND pr.id {op} ?)'
+    if descending:
+        sql += f' OR pr.{column} IS NULL'
+    return sql + ')', [value, value, row_id]
+
+
+def fts_query(text):
+    """Build an FTS5 prefix query from user input.
+
+    Every word must match (accents are folded by the index tokenizer),
+    the last one as a prefix for search-as-you-type. Words are quoted so
+    FTS5 operators typed by the user are searched literally.
+
+    Returns None when the input has no searchable word.
+    """
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    return ' '.join(f'"{word}"' for word in words) + '*'
+
+
+def has_search_index(conn):
+    """Whether the products_fts index exists (SQLite built without FTS5
+    leaves it out)."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'products_fts'"
+    ).fetchone() is not None
+
+
+def search_condition(conn, text):
+    """SQL condition on `pr` matching a search, with its parameters.
+
+    Uses the FTS5 index, or a LIKE on name and brand when the index is
+    missing. Returns None when the input has no searchable word.
+    """
+    match = fts_query(text)
+    if not match:
+        return None
+    if has_search_index(conn):
+        return 'pr.id IN (SELECT rowid FROM products_fts WHERE products_fts MATCH ?)', [match]
+    term = f'%{text}%'
+    return '(LOWER(pr.name) LIKE LOWER(?) OR LOWER(pr.brand) LIKE LOWER(?))', [term, term]
+
+
+# Batch price history: products per request and points per series
+HISTORY_MAX_IDS = 50
+HISTORY_DEFAULT_POINTS = 200
+HISTORY_MAX_POINTS = 2000
+
+
+def parse_timestamp(text):
+    """Normalize an ISO date/datetime to the format stored by SQLite.
+
+    Raises ValueError when the text is not an ISO date.
+    """
+    return datetime.fromisoformat(text).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def downsample(points, max_points):
+    """Reduce a time series to at most `max_points`, keeping its extremes.
+
+    The series is cut into buckets of equal duration; each bucket keeps
+    its lowest and highest price, in time order, so drops and spikes
+    survive. The first and last points are always kept.
+
+    Args:
+        points: List of (datetime, timestamp, price), sorted by time
+        max_points: Maximum number of points (at least 4)
+    """
+    if len(points) <= max_points:
+        return points
+
+    first, last = points[0], points[-1]
+    buckets = (max_points - 2) // 2
+    span = (last[0] - first[0]).total_seconds() or 1
+
+    extremes = {}
+    for point in points[1:-1]:
+        index = min(int((point[0] - first[0]).total_seconds() / span * buckets), buckets - 1)
+        low, high = extremes.get(index, (point, point))
+        extremes[index] = (min(low, point, key=lambda p: p[2]),
+                           max(high, point, key=lambda p: p[2]))
+
+    result = [first]
+    for index in sorted(extremes):
+        low, high = extremes[index]
+        result.extend(sorted({low, high}))
+    result.append(last)
+    return result
+
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint."""
@@ -52,6 +272,7 @@ def health():
 
 
 @app.route('/api/stats', methods=['GET'])
+@cached
 def get_stats():
     """Get global statistics."""
     conn = get_db_connection()
@@ -73,45 +294,22 @@ def get_stats():
     ).fetchone()['count']
 
     # Average price
-    avg_price = conn.execute('''
-        SELECT AVG(p.price) as avg_price
-        FROM prices p
-        INNER JOIN (
-            SELECT product_id, MAX(timestamp) as max_ts
-            FROM prices
-            GROUP BY product_id
-        ) latest ON p.product_id = latest.product_id AND p.timestamp = latest.max_ts
-    ''').fetchone()['avg_price']
+    avg_price = conn.execute(
+        'SELECT AVG(current_price) as avg_price FROM products'
+    ).fetchone()['avg_price']
 
     # Price range
-    price_range = conn.execute('''
-        SELECT MIN(p.price) as min_price, MAX(p.price) as max_price
-        FROM prices p
-        INNER JOIN (
-            SELECT product_id, MAX(timestamp) as max_ts
-            FROM prices
-            GROUP BY product_id
-        ) latest ON p.product_id = latest.product_id AND p.timestamp = latest.max_ts
-    ''').fetchone()
+    price_range = conn.execute(
+        'SELECT MIN(current_price) as min_price, MAX(current_price) as max_price FROM products'
+    ).fetchone()
 
     # Products with promotions (price decreased)
-    promotions = conn.execute('''
-        SELECT COUNT(DISTINCT p1.product_id) as count
-        FROM prices p1
-        INNER JOIN (
-            SELECT product_id, MAX(timestamp) as max_ts
-            FROM prices
-            GROUP BY product_id
-        ) latest ON p1.product_id = latest.product_id AND p1.timestamp = latest.max_ts
-        INNER JOIN (
-            SELECT product_id, price as old_price
-            FROM prices p2
-            WHERE timestamp < datetime('now', '-7 days')
-            GROUP BY product_id
-            HAVING timestamp = MAX(timestamp)
-        ) old ON p1.product_id = old.product_id
-        WHERE p1.price < old.old_price
-    ''').fetchone()['count']
+    promotions = conn.execute(f'''
+        SELECT COUNT(*) as count
+        FROM ({PRICE_BEFORE_WINDOW}) old
+        INNER JOIN products pr ON pr.id = old.product_id
+        WHERE pr.current_price < old.old_price
+    ''', (7,)).fetchone()['count']
 
     conn.close()
 
@@ -128,6 +326,7 @@ def get_stats():
 
 
 @app.route('/api/brands', methods=['GET'])
+@cached
 def get_brands():
     """Get brand statistics."""
     conn = get_db_connection()
@@ -136,20 +335,11 @@ def get_brands():
         SELECT
             pr.brand,
             COUNT(DISTINCT pr.id) as product_count,
-            AVG(p.price) as avg_price,
-            MIN(p.price) as min_price,
-            MAX(p.price) as max_price,
+            AVG(pr.current_price) as avg_price,
+            MIN(pr.current_price) as min_price,
+            MAX(pr.current_price) as max_price,
             GROUP_CONCAT(DISTINCT pr.site) as sites
         FROM products pr
-        LEFT JOIN (
-            SELECT p1.product_id, p1.price
-            FROM prices p1
-            INNER JOIN (
-                SELECT product_id, MAX(timestamp) as max_ts
-                FROM prices
-                GROUP BY product_id
-            ) latest ON p1.product_id = latest.product_id AND p1.timestamp = latest.max_ts
-        ) p ON pr.id = p.product_id
         WHERE pr.brand IS NOT NULL
         GROUP BY pr.brand
         ORDER BY product_count DESC
@@ -174,10 +364,18 @@ def get_brands():
 
 @app.route('/api/products', methods=['GET'])
 def get_products():
-    """Get products with filters and pagination."""
+    """Get products with filters and pagination.
+
+    Pass `cursor` (empty for the first page, then the returned
+    `next_cursor`) for keyset pagination, whose cost does not grow with
+    depth; `page` keeps numbered pages. The total is cached per filter set
+    until the data changes, and skipped with `with_total=false`.
+    """
     # Query parameters
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
+    cursor = request.args.get('cursor', None)
+    with_total = request.args.get('with_total', 'true').lower() not in ('0', 'false')
     brand = request.args.get('brand', None)
     site = request.args.get('site', None)
     min_price = request.args.get('min_price', None, type=float)
@@ -186,71 +384,100 @@ def get_products():
     sort_by = request.args.get('sort_by', 'last_updated')
     sort_order = request.args.get('sort_order', 'DESC')
 
-    conn = get_db_connection()
+    page = max(page, 1)
+    per_page = max(1, min(per_page, PRODUCTS_MAX_PER_PAGE))
+    if sort_by not in SORT_FIELDS:
+        sort_by = 'last_updated'
+    descending = sort_order.upper() != 'ASC'
 
-    # Build query
-    query = '''
-        SELECT
-            pr.id,
-            pr.site,
-            pr.product_id,
-            pr.name,
-            pr.brand,
-            pr.category,
-            pr.url,
-            pr.image_url,
-            pr.first_seen,
-            pr.last_updated,
-            p.price as current_price,
-            p.currency
-        FROM products pr
-        LEFT JOIN (
-            SELECT p1.product_id, p1.price, p1.currency
-            FROM prices p1
-            INNER JOIN (
-                SELECT product_id, MAX(timestamp) as max_ts
-                FROM prices
-                GROUP BY product_id
-            ) latest ON p1.product_id = latest.product_id AND p1.timestamp = latest.max_ts
-        ) p ON pr.id = p.product_id
-        WHERE 1=1
-    '''
+    if cursor:
+        try:
+            value, row_id = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
 
+    conn = get_db_connection()
+
+    # Build filters
+    where = '1=1'
     params = []
 
     if brand:
-        query += ' AND LOWER(pr.brand) = LOWER(?)'
+        where += ' AND LOWER(pr.brand) = LOWER(?)'
         params.append(brand)
 
     if site:
-        query += ' AND LOWER(pr.site) = LOWER(?)'
+        where += ' AND LOWER(pr.site) = LOWER(?)'
         params.append(site)
 
     if min_price is not None:
-        query += ' AND p.price >= ?'
+        where += ' AND pr.current_price >= ?'
         params.append(min_price)
 
     if max_price is not None:
-        query += ' AND p.price <= ?'
+        where += ' AND pr.current_price <= ?'
         params.append(max_price)
 
     if search:
-        query += ' AND (LOWER(pr.name) LIKE LOWER(?) OR LOWER(pr.brand) LIKE LOWER(?))'
-        search_term = f'%{search}%'
-        params.extend([search_term, search_term])
+        condition = search_condition(conn, search)
+        if condition:
+            where += f' AND {condition[0]}'
+            params.extend(condition[1])
+        else:
+            # No searchable word: nothing matches (as in /api/search)
+            where += ' AND 0'
+
+    # Count total (once per filter set and data version)
+    total = None
+    if with_total:
+        total = count_cache.get(repr((where, params)), lambda: conn.execute(
+            f'SELECT COUNT(*) FROM products pr WHERE {where}', params
+        ).fetchone()[0])
+
+    query = '''
+        SELECT
+            pr.id,
+            pr.site,
+            pr.product_id,
+            pr.name,
+            pr.brand,
+            pr.category,
+            pr.url,
+            pr.image_url,
+            pr.first_seen,
+            pr.last_updated,
+            pr.current_price,
+            pr.current_currency as currency
+        FROM products pr
+        WHERE ''' + where
+
+    if cursor:
+        condition, condition_params = keyset_condition(sort_by, descending, value, row_id)
+        query += f' AND {condition}'
+        params.extend(condition_params)
 
-    # Add sorting
-    valid_sort_fields = ['name', 'brand', 'current_price', 'last_updated', 'first_seen']
-    if sort_by in valid_sort_fields:
-        query += f' ORDER BY {sort_by} {sort_order}'
+    # Sort by the requested key, id breaking ties (stable pages)
+    direction = 'DESC' if descending else 'ASC'
+    query += f' ORDER BY pr.{sort_by} {direction}, pr.id {direction}'
 
-    # Count total
-    count_query = f'SELECT COUNT(*) as total FROM ({query})'
-    total = conn.execute(count_query, params).fetchone()['total']
+    if cursor is not None:
+        # One extra row tells whether there is a next page
+        products = conn.execute(query + ' LIMIT ?', params + [per_page + 1]).fetchall()
+        conn.close()
+
+        last = products[per_page - 1] if len(products) > per_page else None
+        return jsonify({
+            'products': [dict_from_row(row) for row in products[:per_page]],
+            'pagination': {
+                'per_page': per_page,
+                'total': total,
+                'next_cursor': encode_cursor(last[sort_by], last['id']) if last else None
+            }
+        })
 
     # Add pagination
     offset = (page - 1) * per_page
-    query += f' LIMIT ? OFFSET ?'
+    query += ' LIMIT ? OFFSET ?'
     params.extend([per_page, offset])
 
     products = conn.execute(query, params).fetchall()
@@ -264,7 +491,7 @@ def get_products():
             'page': page,
             'per_page': per_page,
             'total': total,
-            'pages': (total + per_page - 1) // per_page
+            'pages': (total + per_page - 1) // per_page if total is not None else None
         }
     })
 
@@ -289,18 +516,9 @@ def get_new_products():
             pr.url,
             pr.image_url,
             pr.first_seen,
-            p.price as current_price,
-            p.currency
+            pr.current_price,
+            pr.current_currency as currency
         FROM products pr
-        LEFT JOIN (
-            SELECT p1.product_id, p1.price, p1.currency
-            FROM prices p1
-            INNER JOIN (
-                SELECT product_id, MAX(timestamp) as max_ts
-                FROM prices
-                GROUP BY product_id
-            ) latest ON p1.product_id = latest.product_id AND p1.timestamp = latest.max_ts
-        ) p ON pr.id = p.product_id
         WHERE pr.first_seen >= ?
     '''
 
@@ -325,7 +543,7 @@ def get_promotions():
 
     conn = get_db_connection()
 
-    query = '''
+    query = f'''
         SELECT
             pr.id,
             pr.site,
@@ -334,28 +552,13 @@ def get_promotions():
             pr.category,
             pr.url,
             pr.image_url,
-            p1.price as current_price,
+            pr.current_price,
             old.old_price,
-            ROUND(((p1.price - old.old_price) / old.old_price) * 100, 2) as discount_percent,
-            p1.currency
-        FROM products pr
-        INNER JOIN (
-            SELECT px.product_id, px.price, px.currency
-            FROM prices px
-            INNER JOIN (
-                SELECT product_id, MAX(timestamp) as max_ts
-                FROM prices
-                GROUP BY product_id
-            ) latest ON px.product_id = latest.product_id AND px.timestamp = latest.max_ts
-        ) p1 ON pr.id = p1.product_id
-        INNER JOIN (
-            SELECT product_id, price as old_price
-            FROM prices p2
-            WHERE timestamp < datetime('now', '-' || ? || ' days')
-            GROUP BY product_id
-            HAVING timestamp = MAX(timestamp)
-        ) old ON p1.product_id = old.product_id
-        WHERE p1.price < old.old_price
+            ROUND(((pr.current_price - old.old_price) / old.old_price) * 100, 2) as discount_percent,
+            pr.current_currency as currency
+        FROM ({PRICE_BEFORE_WINDOW}) old
+        INNER JOIN products pr ON pr.id = old.product_id
+        WHERE pr.current_price < old.old_price
         ORDER BY discount_percent ASC
     '''
 
@@ -382,10 +585,10 @@ def get_price_history(product_id):
 
     # Get price history
     history = conn.execute(
-        '''SELECT price, currency, timestamp
+        '''SELECT price, currency, valid_from AS timestamp, last_seen
            FROM prices
            WHERE product_id = ?
-           ORDER BY timestamp ASC''',
+           ORDER BY valid_from ASC''',
         (product_id,)
     ).fetchall()
 
@@ -397,7 +600,86 @@ def get_price_history(product_id):
     })
 
 
+@app.route('/api/price-history', methods=['GET'])
+def get_price_histories():
+    """Get the price series of several products in one request.
+
+    Query parameters: `ids` (comma-separated), `points` (maximum points
+    per series, downsampled server-side), `since` / `until` (ISO dates).
+    Each series has a point at the start of every price run in the
+    window, plus one at the end of the last run.
+    """
+    try:
+        ids = [int(value) for value in request.args.get('ids', '').split(',') if value.strip()]
+        since = request.args.get('since', None)
+        until = request.args.get('until', None)
+        since = parse_timestamp(since) if since else None
+        until = parse_timestamp(until) if until else None
+    except ValueError:
+        return jsonify({'error': 'ids must be integers, since/until ISO dates'}), 400
+
+    if not ids:
+        return jsonify({'error': 'ids is required'}), 400
+    if len(ids) > HISTORY_MAX_IDS:
+        return jsonify({'error': f'At most {HISTORY_MAX_IDS} ids per request'}), 400
+
+    points = request.args.get('points', HISTORY_DEFAULT_POINTS, type=int)
+    points = max(4, min(points, HISTORY_MAX_POINTS))
+
+    conn = get_db_connection()
+
+    placeholders = ','.join('?' * len(ids))
+    products = conn.execute(
+        f'SELECT * FROM products WHERE id IN ({placeholders})', ids
+    ).fetchall()
+
+    # Price runs overlapping the window
+    query = f'''
+        SELECT product_id, price, currency, valid_from, last_seen
+        FROM prices
+        WHERE product_id IN ({placeholders})
+    '''
+    params = list(ids)
+    if since:
+        query += ' AND last_seen >= ?'
+        params.append(since)
+    if until:
+        query += ' AND valid_from <= ?'
+        params.append(until)
+    query += ' ORDER BY product_id, valid_from, id'
+
+    runs = {}
+    for row in conn.execute(query, params):
+        runs.setdefault(row['product_id'], []).append(row)
+    conn.close()
+
+    result = {}
+    for product in products:
+        product_runs = runs.get(product['id'], [])
+        series = []
+        for run in product_runs:
+            # Runs that started before the window are shown from its start
+            timestamp = max(run['valid_from'], since) if since else run['valid_from']
+            series.append((datetime.fromisoformat(timestamp), timestamp, run['price']))
+        if product_runs:
+            last = product_runs[-1]
+            end = min(last['last_seen'], until) if until else last['last_seen']
+            if end > series[-1][1]:
+                series.append((datetime.fromisoformat(end), end, last['price']))
+
+        result[product['id']] = {
+            'product': dict_from_row(product),
+            'currency': product_runs[-1]['currency'] if product_runs else None,
+            'runs': len(product_runs),
+            'points': [{'timestamp': timestamp, 'price': price}
+                       for _, timestamp, price in downsample(series, points)]
+        }
+
+    return jsonify(result)
+
+
 @app.route('/api/sites', methods=['GET'])
+@cached
 def get_sites():
     """Get list of sites with product counts."""
     conn = get_db_connection()
@@ -420,39 +702,50 @@ def get_sites():
 
 @app.route('/api/search', methods=['GET'])
 def search():
-    """Search products by name or brand."""
+    """Search products by name, brand or category (ranked, prefix match)."""
     query = request.args.get('q', '')
     limit = request.args.get('limit', 10, type=int)
 
-    if not query:
+    match = fts_query(query)
+    if not match:
         return jsonify([])
 
     conn = get_db_connection()
 
-    sql = '''
-        SELECT
-            pr.id,
-            pr.name,
-            pr.brand,
-            pr.site,
-            pr.image_url,
-            p.price as current_price
-        FROM products pr
-        LEFT JOIN (
-            SELECT p1.product_id, p1.price
-            FROM prices p1
-            INNER JOIN (
-                SELECT product_id, MAX(timestamp) as max_ts
-                FROM prices
-                GROUP BY product_id
-            ) latest ON p1.product_id = latest.product_id AND p1.timestamp = latest.max_ts
-        ) p ON pr.id = p.product_id
-        WHERE LOWER(pr.name) LIKE LOWER(?) OR LOWER(pr.brand) LIKE LOWER(?)
-        LIMIT ?
-    '''
-
-    search_term = f'%{query}%'
-    results = conn.execute(sql, (search_term, search_term, limit)).fetchall()
+    if has_search_index(conn):
+        sql = '''
+            SELECT
+                pr.id,
+                pr.name,
+                pr.brand,
+                pr.site,
+                pr.image_url,
+                pr.current_price
+            FROM products_fts
+            JOIN products pr ON pr.id = products_fts.rowid
+            WHERE products_fts MATCH ?
+            ORDER BY products_fts.rank
+            LIMIT ?
+        '''
+        params = (match, limit)
+    else:
+        # No FTS5 in this SQLite build: unranked substring match
+        sql = '''
+            SELECT
+                pr.id,
+                pr.name,
+                pr.brand,
+                pr.site,
+                pr.image_url,
+                pr.current_price
+            FROM products pr
+            WHERE LOWER(pr.name) LIKE LOWER(?) OR LOWER(pr.brand) LIKE LOWER(?)
+            LIMIT ?
+        '''
+        search_term = f'%{query}%'
+        params = (search_term, search_term, limit)
+
+    results = conn.execute(sql, params).fetchall()
     conn.close()
 
     return jsonify([dict_from_row(row) for row in results])
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark de l'export enrichi (`ProductAnalyzer.export_enhanced_products`).
+
+Compare l'ancien enrichissement (stats de la marque, moyenne globale et
+concurrents recalculés pour chaque produit, donc quadratique) à l'analyseur
+actuel (stats par marque calculées une fois, index des prix triés et
+fenêtre par bisection) sur des produits générés, et vérifie que les deux
+donnent le même export.
+
+Usage:
+    python benchmarks/bench_analyzer.py
+    python benchmarks/bench_analyzer.py --products 100000 --legacy-max 3000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from statistics import mean
+from typing import Dict, List
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzer import ProductAnalyzer
+
+BRANDS = [
+    'Dermalogica', "Paula's Choice", 'Murad', 'SkinCeuticals', 'Clinique',
+    'La Roche-Posay', 'Avène', 'Nuxe', 'Caudalie', None,
+]
+
+
+def generate_products(count: int, seed: int = 42) -> List[Dict]:
+    """Génère `count` produits (prix entre 5 et 150 €, quelques-uns sans prix)."""
+    rng = random.Random(seed)
+    return [{
+        'id': i,
+        'name': f"Produit {i}",
+        'brand': rng.choice(BRANDS),
+        'current_price': round(rng.uniform(5, 150), 2) if rng.random() > 0.05 else None,
+        'site': rng.choice(['sephora', 'nocibe', 'marionnaud']),
+    } for i in range(count)]
+
+
+def legacy_export(analyzer: ProductAnalyzer) -> List[Dict]:
+    """Ancien `export_enhanced_products` : tout est recalculé pour chaque produit."""
+    products = analyzer.products
+    normalize = analyzer._normalize_brand
+
+    def brand_avg(brand):
+        prices = [p['current_price'] for p in analyzer.brands_data.get(normalize(brand), [])
+                  if p.get('current_price')]
+        return round(mean(prices), 2) if prices else 0
+
+    enhanced = []
+    for product in products:
+        enhanced_product = product.copy()
+        brand = normalize(product.get('brand', ''))
+        avg_price = brand_avg(brand)
+
+        enhanced_product['brand_avg_price'] = avg_price
+        all_prices = [p['current_price'] for p in products if p.get('current_price')]
+        global_avg = mean(all_prices) if all_prices else 0
+        if avg_price == 0:
+            positioning = 'unknown'
+        elif avg_price > global_avg * 1.5:
+            positioning = 'premium'
+        elif avg_price > global_avg * 0.8:
+            positioning = 'moyen'
+        else:
+            positioning = 'accessible'
+        enhanced_product['brand_positioning'] = positioning
+
+        if product.get('current_price') and avg_price > 0:
+            price_diff = product['current_price'] - avg_price
+            enhanced_product['price_vs_brand_avg'] = round(price_diff, 2)
+            enhanced_product['price_vs_brand_avg_percent'] = round((price_diff / avg_price) * 100, 1)
+
+        competitors = []
+        if product.get('current_price'):
+            for p in products:
+                if not p.get('current_price') or normalize(p.get('brand', '')) == brand:
+                    continue
+                price_diff = abs(p['current_price'] - product['current_price'])
+                if price_diff <= 5.0:
+                    competitors.append({**p, 'price_diff': round(price_diff, 2)})
+            competitors.sort(key=lambda x: x['price_diff'])
+        if competitors:
+            enhanced_product['competitors_count'] = len(competitors)
+            enhanced_product['cheapest_competitor'] = competitors[0]['name']
+            enhanced_product['cheapest_competitor_price'] = competitors[0]['current_price']
+
+        enhanced.append(enhanced_product)
+    return enhanced
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=20000,
+                        help='Produits pour l\'analyseur actuel (défaut: 20000)')
+    parser.add_argument('--legacy-max', type=int, default=2000,
+                        help='Produits pour la comparaison avec l\'ancien export (défaut: 2000)')
+    args = parser.parse_args()
+
+    # Comparaison sur un petit catalogue (l'ancien export est quadratique)
+    products = generate_products(args.legacy_max)
+    start = time.perf_counter()
+    legacy = legacy_export(ProductAnalyzer(products))
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    current = ProductAnalyzer(products).export_enhanced_products()
+    current_time = time.perf_counter() - start
+
+    print(f"{args.legacy_max} produits")
+    print(f"  ancien   {legacy_time:8.2f}s")
+    print(f"  actuel   {current_time:8.2f}s  (x{legacy_time / current_time:.0f})")
+    print(f"  export identique : {'oui' if legacy == current else 'NON'}")
+
+    products = generate_products(args.products)
+    start = time.perf_counter()
+    ProductAnalyzer(products).export_enhanced_products()
+    print(f"{args.products} produits")
+    print(f"  actuel   {time.perf_counter() - start:8.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Microbenchmark de la résolution des marques (automate vs boucle sur les alias).
+
+Compare `brands.BrandMatcher` à l'ancienne résolution (double boucle sur
+BRAND_ALIASES avec tests de sous-chaînes dans les deux sens) sur des noms de
+marques générés, et vérifie que les deux donnent la même marque canonique.
+
+Usage:
+    python benchmarks/bench_brands.py
+    python benchmarks/bench_brands.py --names 50000 --distinct 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import BRAND_ALIASES
+from brands import BrandMatcher
+
+OTHER_BRANDS = [
+    'La Roche-Posay', 'Avène', 'Nuxe', 'Caudalie', 'Bioderma', 'Vichy',
+    'Filorga', 'Kiehl\'s', 'Lancôme', 'Estée Lauder', 'Shiseido', 'Sisley',
+]
+
+
+def legacy_resolve(brand: str):
+    """Ancienne résolution (ProductAnalyzer._normalize_brand avant l'automate)."""
+    if not brand:
+        return None
+    brand_lower = brand.lower().strip()
+    for canonical, aliases in BRAND_ALIASES.items():
+        for alias in aliases:
+            if alias.lower() in brand_lower or brand_lower in alias.lower():
+                return canonical
+    return None
+
+
+def generate_names(count: int, distinct: int, seed: int = 42):
+    """Génère `count` noms de marques tirés parmi `distinct` variantes."""
+    rng = random.Random(seed)
+    known = [alias for aliases in BRAND_ALIASES.values() for alias in aliases]
+    variants = []
+    for i in range(distinct):
+        base = rng.choice(known if i % 3 else OTHER_BRANDS)
+        variants.append(rng.choice([
+            base, base.upper(), base.title(), f"{base} Paris", f"{base} {i}",
+        ]))
+    return [rng.choice(variants) for _ in range(count)]
+
+
+def timed(resolve, names):
+    """Durée de résolution de tous les noms."""
+    start = time.perf_counter()
+    results = [resolve(name) for name in names]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--names', type=int, default=20000, help='Noms à résoudre (défaut: 20000)')
+    parser.add_argument('--distinct', type=int, default=500,
+                        help='Noms distincts parmi eux (défaut: 500)')
+    args = parser.parse_args()
+
+    names = generate_names(args.names, args.distinct)
+
+    start = time.perf_counter()
+    matcher = BrandMatcher(BRAND_ALIASES)
+    compile_time = time.perf_counter() - start
+
+    legacy_time, legacy = timed(legacy_resolve, names)
+    cold_time, resolved = timed(matcher.resolve, names)
+    warm_time, _ = timed(matcher.resolve, names)
+
+    print(f"{len(names)} noms ({args.distinct} distincts), {len(BRAND_ALIASES)} marques")
+    print(f"  compilation   {compile_time * 1000:8.2f} ms")
+    for label, elapsed in (('boucle alias', legacy_time), ('automate', cold_time),
+                           ('automate (mémo)', warm_time)):
+        print(f"  {label:<15} {elapsed * 1000:8.2f} ms  {len(names) / elapsed:>12.0f} noms/s")
+
+    mismatches = [(n, a, b) for n, a, b in zip(names, legacy, resolved) if a != b]
+    if mismatches:
+        print(f"  ⚠ {len(mismatches)} résolutions différentes, ex: {mismatches[:3]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark de l'ingestion en base (produits + prix, lignes/s).
+
+Compare l'ancienne écriture (une connexion et un commit par appel, journal
+par défaut) à `Database` (connexion persistante en WAL, un commit par site)
+et à `Database.add_products_bulk` (upsert par lots) sur des produits
+générés, dans des bases temporaires.
+
+Usage:
+    python benchmarks/bench_database.py
+    python benchmarks/bench_database.py --products 20000 --sites 4
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import Database
+
+
+def generate_products(count: int, sites: int) -> Dict[str, List[Dict]]:
+    """Génère `count` produits répartis sur `sites` sites."""
+    products: Dict[str, List[Dict]] = {f"site{s}": [] for s in range(sites)}
+    for i in range(count):
+        products[f"site{i % sites}"].append({
+            'product_id': f"P{i}",
+            'name': f"Sérum hydratant {i}",
+            'brand': 'Dermalogica',
+            'category': 'soins-visage',
+            'url': f"https://example.com/p/{i}",
+            'image_url': f"https://example.com/img/{i}.jpg",
+            'price': 10 + i % 90 + 0.99,
+            'currency': 'EUR',
+        })
+    return products
+
+
+def legacy_ingest(db_path: Path, products: Dict[str, List[Dict]]):
+    """Ancienne écriture : une connexion et un commit par produit et par prix."""
+    for site, site_products in products.items():
+        for data in site_products:
+            with sqlite3.connect(db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT id FROM products WHERE site = ? AND product_id = ?",
+                               (site, data['product_id']))
+                row = cursor.fetchone()
+                if row:
+                    product_id = row[0]
+                    cursor.execute("""
+                        UPDATE products SET name = ?, brand = ?, category = ?,
+                            url = ?, image_url = ?, last_updated = CURRENT_TIMESTAMP
+                        WHERE id = ?
+                    """, (data['name'], data['brand'], data['category'], data['url'],
+                          data['image_url'], product_id))
+                else:
+                    cursor.execute("""
+                        INSERT INTO products (site, product_id, name, brand, category, url, image_url)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (site, data['product_id'], data['name'], data['brand'],
+                          data['category'], data['url'], data['image_url']))
+                    product_id = cursor.lastrowid
+                    cursor.execute("INSERT INTO new_products (product_id) VALUES (?)", (product_id,))
+                conn.commit()
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("INSERT INTO prices (product_id, price, currency) VALUES (?, ?, ?)",
+                             (product_id, data['price'], data['currency']))
+                conn.commit()
+
+
+def database_ingest(db: Database, products: Dict[str, List[Dict]]):
+    """Écriture actuelle, telle que `cli scrape` l'appelle."""
+    for site, site_products in products.items():
+        with db.transaction():
+            for data in site_products:
+                product_id = db.add_product(site, data)
+                db.add_price(product_id, data['price'], data['currency'])
+
+
+def bulk_ingest(db: Database, products: Dict[str, List[Dict]]):
+    """Écriture par lots (`add_products_bulk`), un appel par site."""
+    for site, site_products in products.items():
+        db.add_products_bulk(site, site_products)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=5000,
+                        help='Produits à ingérer (défaut: 5000)')
+    parser.add_argument('--sites', type=int, default=4, help='Nombre de sites (défaut: 4)')
+    args = parser.parse_args()
+
+    products = generate_products(args.products, args.sites)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = []
+        for label, passes in (('ancien', 2), ('Database', 2), ('bulk', 2)):
+            db = Database(Path(tmp) / f"{label}.db")
+            if label == 'ancien':
+                # Journal par défaut, comme avant (WAL est persistant dans le fichier)
+                db._connection().execute("PRAGMA journal_mode = DELETE")
+                db.close()
+            for number in range(1, passes + 1):
+                start = time.perf_counter()
+                if label == 'ancien':
+                    legacy_ingest(db.db_path, products)
+                elif label == 'Database':
+                    database_ingest(db, products)
+                else:
+                    bulk_ingest(db, products)
+                elapsed = time.perf_counter() - start
+                kind = 'insertion' if number == 1 else 'mise à jour'
+                results.append((f"{label} ({kind})", elapsed))
+            db.close()
+
+    # Chaque produit écrit une ligne produit et une ligne prix
+    rows = args.products * 2
+    print(f"{args.products} produits sur {args.sites} sites ({rows} lignes par passe)")
+    for label, elapsed in results:
+        print(f"  {label:<24} {elapsed:8.2f}s {rows / elapsed:>10.0f} lignes/s")
+
+
+if __name__ == '__main__':
+    main()
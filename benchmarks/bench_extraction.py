@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark des moteurs d'extraction des tuiles produits (lxml vs BeautifulSoup).
+
+Mesure le débit (tuiles/s) de `_extract_page` avec chaque moteur sur des pages
+de listing sauvegardées, et vérifie que les deux moteurs extraient les mêmes
+produits.
+
+Usage:
+    python benchmarks/bench_extraction.py sephora pages/sephora-*.html
+    python benchmarks/bench_extraction.py nocibe --synthetic 60 --repeat 20
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers import (
+    SephoraScraper, NocibeScraper, MarionnaudScraper,
+    LookfantasticScraper, FeeluniqueScraper
+)
+
+SCRAPERS = {
+    'sephora': SephoraScraper,
+    'nocibe': NocibeScraper,
+    'marionnaud': MarionnaudScraper,
+    'lookfantastic': LookfantasticScraper,
+    'feelunique': FeeluniqueScraper,
+}
+
+# Tuile type de chaque site, pour générer des pages quand aucune n'est fournie
+TILES = {
+    'sephora': (
+        '<div class="ProductTile-root" data-product-id="{i}">'
+        '<a href="/p/creme-hydratante-{i}"><img src="/img/{i}.jpg"/>'
+        '<span class="BrandName">Dermalogica</span>'
+        '<span class="ProductName">Crème hydratante {i}</span></a>'
+        '<span class="Price">{i},90 €</span></div>'
+    ),
+    'nocibe': (
+        '<div class="product-tile" data-product-id="{i}">'
+        '<a href="/soin-{i}.html" title="Soin {i}"><img src="//cdn.nocibe.fr/{i}.jpg"/></a>'
+        '<span class="product-brand">Murad</span><h3 class="product-name">Soin {i}</h3>'
+        '<div class="product-price">{i},50 €</div></div>'
+    ),
+    'marionnaud': (
+        '<div class="product-card" data-productid="{i}">'
+        '<a href="/soin/p/{i}"><img data-src="//media.marionnaud.fr/{i}.jpg"/></a>'
+        '<div class="manufacturer">SkinCeuticals</div>'
+        '<h2 class="product-title">Sérum {i}</h2><span class="price">{i},00 €</span></div>'
+    ),
+    'lookfantastic': (
+        '<li class="productListProducts_product">'
+        '<a class="productBlock_link" href="/dermalogica-serum/{i}.html">'
+        '<img class="productBlock_image" src="/img/{i}.jpg"/></a>'
+        '<span class="productBlock_brandName">Dermalogica</span>'
+        '<h3 class="productBlock_productName">Sérum {i}</h3>'
+        '<span class="productBlock_priceValue">{i},99 €</span></li>'
+    ),
+    'feelunique': (
+        '<div class="product-item"><a class="product-link" href="/products/serum-{i}">'
+        'Sérum {i}</a><img class="product-image" data-src="/img/{i}.jpg"/>'
+        '<span class="product-brand">Paula\'s Choice</span>'
+        '<span class="price">{i},20 €</span></div>'
+    ),
+}
+
+
+def synthetic_page(site: str, tiles: int) -> str:
+    """Génère une page de listing de `tiles` tuiles pour un site."""
+    body = ''.join(TILES[site].format(i=i) for i in range(1, tiles + 1))
+    return f'<html><head><title>{site}</title></head><body><main>{body}</main></body></html>'
+
+
+def run(scraper, engine: str, pages: List[str], repeat: int) -> Dict:
+    """Extrait toutes les pages `repeat` fois avec un moteur.
+
+    Returns:
+        Statistiques du moteur (tuiles, durée, produits extraits)
+    """
+    scraper.extraction_engine = engine
+    products = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        products = []
+        for number, html in enumerate(pages, 1):
+            products.extend(scraper._extract_page(html, number) or [])
+    elapsed = time.perf_counter() - start
+
+    tiles = sum(len(scraper._extract_items(html)[0] or []) for html in pages) * repeat
+    return {'engine': engine, 'tiles': tiles, 'seconds': elapsed, 'products': products}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('site', choices=sorted(SCRAPERS))
+    parser.add_argument('pages', nargs='*', type=Path, help='Pages de listing sauvegardées')
+    parser.add_argument('--synthetic', type=int, default=48,
+                        help='Tuiles par page générée si aucune page fournie (défaut: 48)')
+    parser.add_argument('--repeat', type=int, default=10, help='Répétitions (défaut: 10)')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    if args.pages:
+        pages = [path.read_text(encoding='utf-8', errors='replace') for path in args.pages]
+    else:
+        pages = [synthetic_page(args.site, args.synthetic)]
+
+    scraper = SCRAPERS[args.site]()
+    scraper.http_cache = None
+    try:
+        results = [run(scraper, engine, pages, args.repeat) for engine in ('bs4', 'lxml')]
+    finally:
+        scraper.close()
+
+    print(f"{args.site}: {len(pages)} page(s) x {args.repeat}")
+    for result in results:
+        rate = result['tiles'] / result['seconds'] if result['seconds'] else float('inf')
+        print(f"  {result['engine']:<5} {result['tiles']:>7} tuiles "
+              f"{result['seconds']:>8.3f}s {rate:>10.0f} tuiles/s")
+
+    bs4, lxml = results
+    print(f"  speedup: x{bs4['seconds'] / lxml['seconds']:.1f}")
+    if bs4['products'] != lxml['products']:
+        print("  ⚠ les deux moteurs n'extraient pas les mêmes produits")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Résolution des noms de marques vers leur identifiant canonique.
+
+Les alias de config.BRAND_ALIASES sont compilés une fois en automate
+d'Aho-Corasick : un nom de marque est résolu en un seul parcours de ses
+caractères, quel que soit le nombre d'alias, et les résultats sont mémorisés.
+Partagé par les scrapers (filtrage des marques) et l'analyseur (regroupement).
+"""
+
+import unicodedata
+from collections import deque
+from typing import Dict, List, Optional
+
+from config import BRAND_ALIASES
+
+# Longueur minimale d'un nom pour qu'il soit reconnu comme fragment d'alias
+# (ex: "Drunk" -> drunk elephant)
+MIN_FRAGMENT_LENGTH = 3
+
+
+def normalize_brand(name: Optional[str]) -> str:
+    """Normalise un nom de marque pour la comparaison.
+
+    Args:
+        name: Nom de la marque
+
+    Returns:
+        Nom normalisé (minuscules, sans accents, espaces et apostrophes
+        uniformisés)
+    """
+    if not name:
+        return ''
+    name = unicodedata.normalize('NFKD', name.lower().replace('’', "'"))
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    return ' '.join(name.split())
+
+
+class BrandMatcher:
+    """Automate de résolution des marques.
+
+    Un nom est résolu vers la marque canonique dont un alias apparaît dans
+    le nom ("Dermalogica France" -> dermalogica), ou dont un alias contient
+    le nom entier ("Drunk" -> drunk elephant). En cas d'ambiguïté, l'ordre
+    de déclaration des marques fait foi.
+    """
+
+    def __init__(self, aliases: Dict[str, List[str]]):
+        """Compile les alias.
+
+        Args:
+            aliases: Alias par marque canonique ({marque: [alias]})
+        """
+        self.brands = list(aliases)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Optional[int]] = [None]  # Meilleure marque par état
+        self._fragments: Dict[str, int] = {}
+        self._cache: Dict[str, Optional[str]] = {}
+
+        for rank, (canonical, names) in enumerate(aliases.items()):
+            for alias in {canonical, *names}:
+                alias = normalize_brand(alias)
+                if alias:
+                    self._add(alias, rank)
+        self._link()
+
+    def _add(self, alias: str, rank: int):
+        """Ajoute un alias à l'arbre et à la table des fragments."""
+        state = 0
+        for char in alias:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._out[state] = self._best(self._out[state], rank)
+
+        for start in range(len(alias)):
+            for end in range(start + MIN_FRAGMENT_LENGTH, len(alias) + 1):
+                fragment = alias[start:end]
+                self._fragments[fragment] = self._best(self._fragments.get(fragment), rank)
+
+    def _link(self):
+        """Calcule les liens d'échec (parcours en largeur)."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._best(self._out[child], self._out[self._fail[child]])
+
+    @staticmethod
+    def _best(a: Optional[int], b: Optional[int]) -> Optional[int]:
+        """Marque prioritaire (déclarée en premier) parmi deux candidates."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return min(a, b)
+
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        """Résout un nom de marque vers son identifiant canonique.
+
+        Args:
+            name: Nom de la marque tel que scrapé
+
+        Returns:
+            Marque canonique (clé de BRAND_ALIASES) ou None si inconnue
+        """
+        if not name:
+            return None
+        if name in self._cache:
+            return self._cache[name]
+
+        text = normalize_brand(name)
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            best = self._best(best, self._out[state])
+
+        if best is None:
+            best = self._fragments.get(text)
+
+        canonical = self.brands[best] if best is not None else None
+        self._cache[name] = canonical
+        return canonical
+
+
+# Instance unique compilée depuis la configuration
+brand_matcher = BrandMatcher(BRAND_ALIASES)
@@ -10,11 +10,15 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Import des modules
-from config import DB_PATH, EXPORT_DIR, LOGS_DIR, LOG_FORMAT, LOG_LEVEL, TARGET_BRANDS
+from config import (
+    DB_PATH, EXPORT_DIR, LOGS_DIR, LOG_FORMAT, LOG_LEVEL, TARGET_BRANDS, PREFETCH_PAGES,
+    SITES, INCREMENTAL_STOP_PAGES
+)
 from database import Database
 from scrapers import (
     SephoraScraper, NocibeScraper, MarionnaudScraper,
-    LookfantasticScraper, FeeluniqueScraper
+    LookfantasticScraper, FeeluniqueScraper, ShopifyScraper, scrape_sites, enrich_products,
+    hybrid_fetcher
 )
 from exporters import JSONExporter, CSVExporter
 from src.analyzer import ProductAnalyzer
@@ -33,9 +37,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+RETAILERS = ['sephora', 'nocibe', 'marionnaud', 'lookfantastic', 'feelunique']
+
+# Catalogues de marques lus via products.json
+SHOPIFY_SITES = [
+    name for name, site in SITES.items()
+    if site['method'] == 'shopify_json' and site['enabled']
+]
+
 
 def get_scraper(site_name: str):
     """Retourne le scraper approprié."""
+    if site_name in SHOPIFY_SITES:
+        return ShopifyScraper(site_name)
+
     scrapers = {
         'sephora': SephoraScraper,
         'nocibe': NocibeScraper,
@@ -54,15 +69,28 @@ def cli():
 
 
 @cli.command()
-@click.option('--site', type=click.Choice(['sephora', 'nocibe', 'marionnaud', 'lookfantastic', 'feelunique', 'all']),
+@click.option('--site', type=click.Choice(RETAILERS + SHOPIFY_SITES + ['all']),
               default='all', help='Site à scraper')
 @click.option('--category', default='nouveautes', help='Catégorie à scraper')
 @click.option('--max-pages', default=3, type=int, help='Nombre max de pages')
 @click.option('--brands', help='Marques à filtrer (séparées par virgules)')
-def scrape(site, category, max_pages, brands):
+@click.option('--prefetch', default=PREFETCH_PAGES, type=int,
+              help="Pages téléchargées d'avance pendant le parsing (0 = séquentiel)")
+@click.option('--incremental', is_flag=True,
+              help="S'arrêter dès que les pages ne contiennent plus rien de nouveau")
+@click.option('--stop-after', default=INCREMENTAL_STOP_PAGES, type=int,
+              help='Pages consécutives sans changement avant arrêt (avec --incremental)')
+@click.option('--details', is_flag=True,
+              help='Compléter chaque produit avec sa fiche (description, prix manquant)')
+@click.option('--no-browser', is_flag=True,
+              help='Ne jamais rendre les pages JavaScript dans un navigateur (HTTP seul)')
+def scrape(site, category, max_pages, brands, prefetch, incremental, stop_after, details,
+           no_browser):
     """Scraper les produits depuis un ou plusieurs sites."""
     db = Database(DB_PATH)
-    sites = ['sephora', 'nocibe', 'marionnaud', 'lookfantastic', 'feelunique'] if site == 'all' else [site]
+    if no_browser:
+        hybrid_fetcher.mode = 'http'
+    sites = RETAILERS + SHOPIFY_SITES if site == 'all' else [site]
 
     # Parser les marques
     brand_list = None
@@ -70,33 +98,55 @@ def scrape(site, category, max_pages, brands):
         brand_list = [b.strip() for b in brands.split(',')]
         console.print(f"[dim]Filtrage marques: {', '.join(brand_list)}[/dim]")
 
+    # Produits déjà connus (crawl incrémental)
+    known = None
+    if incremental:
+        known = db.get_known_prices()
+        console.print(f"[dim]Incrémental: {len(known)} produits connus[/dim]")
+
     console.print(f"\n[bold cyan]🔍 Scraping en cours...[/bold cyan]")
     console.print(f"Catégorie: {category} | Max pages: {max_pages}\n")
 
     total_products = 0
 
-    for site_name in sites:
-        try:
-            console.print(f"[yellow]⏳ {site_name.upper()}...[/yellow]")
+    # Les sites sont scrapés en parallèle, l'écriture en base reste séquentielle
+    console.print(f"[yellow]⏳ {', '.join(s.upper() for s in sites)}...[/yellow]")
+    scrapers = [get_scraper(site_name) for site_name in sites]
+    results = scrape_sites(
+        scrapers, category=category, max_pages=max_pages, brands=brand_list, prefetch=prefetch,
+        known=known, stop_after=stop_after
+    )
+
+    # Fiches produits des revendeurs (les catalogues Shopify sont déjà complets)
+    if details:
+        retailers = {scraper.site_name: scraper for scraper in scrapers
+                     if scraper.site_name in RETAILERS}
+        console.print(f"[yellow]⏳ Fiches produits...[/yellow]")
+        enriched = enrich_products(retailers, results)
+        console.print(f"[dim]{len(enriched)} fiches récupérées[/dim]")
+
+    for scraper in scrapers:
+        site_name = scraper.site_name
+        products = results[site_name]
 
-            scraper = get_scraper(site_name)
-            products = scraper.scrape_products(category=category, max_pages=max_pages, brands=brand_list)
+        try:
+            if isinstance(products, Exception):
+                raise products
 
-            # Sauvegarder en DB
-            for product_data in products:
-                product_id = db.add_product(site_name, product_data)
-                if product_data.get('price'):
-                    db.add_price(product_id, product_data['price'])
+            # Sauvegarder en DB (produits, prix et nouveautés en une transaction)
+            db.add_products_bulk(site_name, products)
 
             total_products += len(products)
             console.print(f"[green]✓ {site_name.upper()}: {len(products)} produits[/green]")
 
-            scraper.close()
-
         except Exception as e:
             console.print(f"[red]❌ Erreur {site_name}: {e}[/red]")
             logger.error(f"Erreur scraping {site_name}: {e}", exc_info=True)
 
+        finally:
+            scraper.close()
+
+    hybrid_fetcher.close()
     console.print(f"\n[bold green]✓ Total: {total_products} produits scrapés[/bold green]\n")
 
 
@@ -368,13 +418,15 @@ def history(product_id):
 
     # Table
     table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("Date", style="cyan", width=20)
+    table.add_column("Depuis", style="cyan", width=20)
+    table.add_column("Dernier relevé", style="cyan", width=20)
     table.add_column("Prix", style="green", justify="right")
     table.add_column("Devise", style="dim")
 
     for record in history:
         table.add_row(
-            record['timestamp'][:19],
+            record['valid_from'][:19],
+            record['last_seen'][:19],
             f"{record['price']:.2f}",
             record['currency']
         )
@@ -6,6 +6,8 @@ from pathlib import Path
 # Chemins
 BASE_DIR = Path(__file__).parent
 DB_PATH = BASE_DIR / "database" / "cosmetique.db"
+DB_CACHE_SIZE_KB = 64 * 1024  # Cache de pages SQLite par connexion
+DB_MMAP_SIZE = 256 * 1024 * 1024  # Lecture de la base en mmap (octets)
 LOGS_DIR = BASE_DIR / "logs"
 EXPORT_DIR = BASE_DIR / "exports"
 
@@ -13,6 +15,42 @@ EXPORT_DIR = BASE_DIR / "exports"
 REQUEST_DELAY = 2
 REQUEST_TIMEOUT = 30
 
+# Token bucket par hôte : rafale autorisée, surcharges par hôte
+# (ex: {'www.sephora.fr': {'delay': 4, 'burst': 1}}) et pause max après 429/503
+RATE_LIMIT_BURST = 3
+RATE_LIMIT_HOSTS = {}
+RATE_LIMIT_MAX_BACKOFF = 120
+
+# Cache HTTP conditionnel (ETag / Last-Modified) des pages scrapées
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = BASE_DIR / "cache" / "http_cache.db"
+HTTP_CACHE_MAX_AGE_DAYS = 7
+
+# Pages de listing téléchargées d'avance pendant le parsing (0 = séquentiel)
+PREFETCH_PAGES = 1
+
+# Crawl incrémental : arrêt après N pages consécutives sans nouveauté ni
+# changement de prix
+INCREMENTAL_STOP_PAGES = 2
+
+# Enrichissement des fiches produits : requêtes simultanées par site
+# (le rate limiter par hôte reste appliqué)
+DETAILS_WORKERS_PER_SITE = 2
+
+# Moteur d'extraction des tuiles produits : 'lxml' (XPath compilés) ou 'bs4'
+EXTRACTION_ENGINE = 'lxml'
+
+# Récupération des pages : 'hybrid' = HTTP d'abord, navigateur (Playwright)
+# seulement pour les pages rendues côté client ; 'http' = jamais de navigateur
+FETCH_MODE = 'hybrid'
+FETCH_MODES_PATH = BASE_DIR / "cache" / "fetch_modes.db"  # Décision mémorisée par motif d'URL
+RENDER_WORKERS = 2  # Navigateurs du pool de rendu
+
+# API : réponses agrégées (stats, marques, sites) gardées en cache tant que la
+# base ne change pas, au plus N secondes (fenêtres "7 derniers jours")
+API_CACHE_TTL = 300
+API_CACHE_MAX_ENTRIES = 1000  # Entrées par cache (totaux par filtre inclus), LRU
+
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 5
@@ -25,6 +63,19 @@ TARGET_BRANDS = [
     'skinceuticals',
 ]
 
+# Alias des marques (canonique -> variantes rencontrées sur les sites),
+# compilés par brands.BrandMatcher
+BRAND_ALIASES = {
+    'dermalogica': ['dermalogica'],
+    "paula's choice": ["paula's choice", 'paulas choice', 'paula choice'],
+    'murad': ['murad'],
+    'skinceuticals': ['skinceuticals', 'skin ceuticals'],
+    'drunk elephant': ['drunk elephant', 'drunkelephant'],
+    'the ordinary': ['the ordinary', 'ordinary'],
+    'dr. dennis gross': ['dr. dennis gross', 'dr dennis gross', 'dennis gross'],
+    'clinique': ['clinique'],
+}
+
 # Sites (Dermalogica + concurrents)
 SITES = {
     'dermalogica': {
@@ -2,16 +2,31 @@
 
 import sqlite3
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 import json
 
+from config import DB_CACHE_SIZE_KB, DB_MMAP_SIZE
+
 logger = logging.getLogger(__name__)
 
+# Produits par requête INSERT multi-lignes (7 paramètres par produit, sous
+# la limite historique de 999 variables SQLite)
+BULK_CHUNK_SIZE = 100
+
 
 class Database:
-    """Gestion de la base de données SQLite."""
+    """Gestion de la base de données SQLite.
+
+    Chaque thread garde sa propre connexion, ouverte une fois (journal WAL,
+    `synchronous=NORMAL`, cache et mmap agrandis) : les requêtes préparées
+    restent en cache d'un appel à l'autre. Les écritures sont faites dans des
+    transactions explicites ; `transaction()` permet d'en grouper plusieurs
+    (ex: toute une page de produits) en un seul commit.
+    """
 
     def __init__(self, db_path: Path):
         """Initialise la connexion à la base de données.
@@ -21,11 +36,67 @@ class Database:
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._init_db()
 
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connexion du thread courant (ouverte et configurée au premier appel)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit : les transactions sont ouvertes explicitement
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA cache_size = -{int(DB_CACHE_SIZE_KB)}")
+            conn.execute(f"PRAGMA mmap_size = {int(DB_MMAP_SIZE)}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transaction explicite, validée à la sortie du bloc le plus externe.
+
+        Les appels imbriqués (ex: `add_product` dans un bloc `transaction()`)
+        rejoignent la transaction en cours au lieu de valider chacun.
+
+        Yields:
+            Connexion du thread courant
+        """
+        conn = self._connection()
+        if self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.execute("COMMIT")
+
+    def close(self):
+        """Ferme la connexion du thread courant."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
         """Crée les tables si elles n'existent pas."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
 
             # Table produits
@@ -41,21 +112,29 @@ class Database:
                     image_url TEXT,
                     first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    current_price REAL,
+                    current_currency TEXT,
+                    price_updated_at TIMESTAMP,
                     UNIQUE(site, product_id)
                 )
             """)
 
-            # Table prix (historique)
+            # Table prix (historique par plages : une ligne par changement de
+            # prix, prolongée via last_seen tant que le prix ne bouge pas)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS prices (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     product_id INTEGER NOT NULL,
                     price REAL NOT NULL,
                     currency TEXT DEFAULT 'EUR',
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    valid_from TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (product_id) REFERENCES products (id)
                 )
             """)
+            self._compact_prices(conn)
+            self._materialize_current_prices(conn)
+            self._create_price_changes(conn)
 
             # Table nouveautés
             cursor.execute("""
@@ -74,15 +153,241 @@ class Database:
             """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_prices_product
-                ON prices(product_id, timestamp)
+                ON prices(product_id, valid_from)
             """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_new_products_detected
                 ON new_products(detected_at)
             """)
+            # Clés de tri de l'API produits (pagination par curseur ; l'id
+            # implicite de l'index départage les ex aequo)
+            for column in ('name', 'brand', 'current_price', 'first_seen', 'last_updated'):
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_products_{column}
+                    ON products({column})
+                """)
+
+            self._create_search_index(conn)
+
+        logger.info(f"Base de données initialisée: {self.db_path}")
+
+    def _create_search_index(self, conn: sqlite3.Connection):
+        """Crée l'index plein texte des produits (FTS5) et ses triggers.
+
+        L'index couvre nom, marque et catégorie, sans accents
+        (`remove_diacritics`) et avec des index de préfixes pour la
+        recherche à la frappe. Il ne stocke pas le texte (contenu externe :
+        la table products) ; les triggers le tiennent à jour.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'products_fts'"
+        ).fetchone()
+
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+                    name, brand, category,
+                    content='products', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Recherche plein texte indisponible (FTS5) : {e}")
+            return
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON products BEGIN
+                INSERT INTO products_fts (rowid, name, brand, category)
+                VALUES (new.id, new.name, new.brand, new.category);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON products BEGIN
+                INSERT INTO products_fts (products_fts, rowid, name, brand, category)
+                VALUES ('delete', old.id, old.name, old.brand, old.category);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS products_fts_update
+            AFTER UPDATE OF name, brand, category ON products
+            WHEN old.name IS NOT new.name OR old.brand IS NOT new.brand
+                OR old.category IS NOT new.category
+            BEGIN
+                INSERT INTO products_fts (products_fts, rowid, name, brand, category)
+                VALUES ('delete', old.id, old.name, old.brand, old.category);
+                INSERT INTO products_fts (rowid, name, brand, category)
+                VALUES (new.id, new.name, new.brand, new.category);
+            END
+        """)
+
+        if not exists:
+            conn.execute("INSERT INTO products_fts (products_fts) VALUES ('rebuild')")
+            logger.info("Index plein texte des produits construit")
+
+    def _compact_prices(self, conn: sqlite3.Connection):
+        """Migre l'ancien historique (une ligne par scraping) en plages.
+
+        Les relevés consécutifs d'un produit au même prix et dans la même
+        devise deviennent une seule ligne (valid_from = premier relevé,
+        last_seen = dernier). Sans effet si la table est déjà migrée.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(prices)")}
+        if 'valid_from' in columns:
+            return
+
+        before = conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+        conn.execute("""
+            CREATE TABLE prices_compacted (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                product_id INTEGER NOT NULL,
+                price REAL NOT NULL,
+                currency TEXT DEFAULT 'EUR',
+                valid_from TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (product_id) REFERENCES products (id)
+            )
+        """)
+        # Une plage commence à chaque relevé dont le prix ou la devise
+        # diffère du relevé précédent du même produit
+        conn.execute("""
+            INSERT INTO prices_compacted (id, product_id, price, currency, valid_from, last_seen)
+            SELECT MIN(id), product_id, price, currency, MIN(timestamp), MAX(timestamp)
+            FROM (
+                SELECT *, SUM(changed) OVER (
+                    PARTITION BY product_id ORDER BY timestamp, id
+                ) AS run
+                FROM (
+                    SELECT *, CASE
+                        WHEN price IS LAG(price) OVER w AND currency IS LAG(currency) OVER w
+                        THEN 0 ELSE 1
+                    END AS changed
+                    FROM prices
+                    WINDOW w AS (PARTITION BY product_id ORDER BY timestamp, id)
+                )
+            )
+            GROUP BY product_id, run
+            ORDER BY MIN(id)
+        """)
+        conn.execute("DROP TABLE prices")
+        conn.execute("ALTER TABLE prices_compacted RENAME TO prices")
 
-            conn.commit()
-            logger.info(f"Base de données initialisée: {self.db_path}")
+        after = conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+        logger.info(f"Historique des prix compacté : {before} -> {after} lignes")
+
+    def _materialize_current_prices(self, conn: sqlite3.Connection):
+        """Ajoute le prix courant à `products` et le remplit depuis l'historique.
+
+        Sans effet si les colonnes existent déjà (elles sont ensuite tenues
+        à jour par `_record_price`).
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(products)")}
+        if 'current_price' in columns:
+            return
+
+        conn.execute("ALTER TABLE products ADD COLUMN current_price REAL")
+        conn.execute("ALTER TABLE products ADD COLUMN current_currency TEXT")
+        conn.execute("ALTER TABLE products ADD COLUMN price_updated_at TIMESTAMP")
+        conn.execute("""
+            UPDATE products
+            SET (current_price, current_currency, price_updated_at) = (
+                SELECT price, currency, valid_from FROM prices
+                WHERE prices.product_id = products.id
+                ORDER BY valid_from DESC, id DESC LIMIT 1
+            )
+        """)
+        logger.info("Prix courant matérialisé dans products")
+
+    def _create_price_changes(self, conn: sqlite3.Connection):
+        """Crée la table des changements de prix et la remplit depuis l'historique.
+
+        Un événement est enregistré à chaque nouvelle plage de prix dans la
+        même devise (ancien prix, nouveau prix, variation en %). Sans effet
+        si la table existe déjà (elle est ensuite tenue à jour par
+        `_record_price`).
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'price_changes'"
+        ).fetchone()
+        if exists:
+            return
+
+        conn.execute("""
+            CREATE TABLE price_changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                product_id INTEGER NOT NULL,
+                old_price REAL NOT NULL,
+                new_price REAL NOT NULL,
+                percent REAL,
+                detected_at TIMESTAMP NOT NULL,
+                FOREIGN KEY (product_id) REFERENCES products (id)
+            )
+        """)
+        conn.execute("""
+            INSERT INTO price_changes (product_id, old_price, new_price, percent, detected_at)
+            SELECT product_id, old_price, price,
+                   ROUND((price - old_price) / old_price * 100, 2), valid_from
+            FROM (
+                SELECT product_id, price, currency, valid_from, id,
+                       LAG(price) OVER w AS old_price,
+                       LAG(currency) OVER w AS old_currency
+                FROM prices
+                WINDOW w AS (PARTITION BY product_id ORDER BY valid_from, id)
+            )
+            WHERE old_price IS NOT NULL AND currency IS old_currency AND price != old_price
+            ORDER BY valid_from, id
+        """)
+        conn.execute("CREATE INDEX idx_price_changes_detected ON price_changes(detected_at)")
+        count = conn.execute("SELECT COUNT(*) FROM price_changes").fetchone()[0]
+        logger.info(f"Table des changements de prix créée ({count} depuis l'historique)")
+
+    @staticmethod
+    def _record_price(conn: sqlite3.Connection, product_id: int, price: float,
+                      currency: str = 'EUR'):
+        """Prolonge la plage de prix en cours ou en ouvre une nouvelle.
+
+        Quand une plage s'ouvre, le prix courant de `products`
+        (current_price, current_currency, price_updated_at) est mis à jour
+        et la variation par rapport au prix précédent (même devise) est
+        enregistrée dans `price_changes`.
+
+        Args:
+            conn: Connexion (dans une transaction)
+            product_id: ID du produit
+            price: Prix relevé
+            currency: Devise
+        """
+        cursor = conn.execute("""
+            UPDATE prices SET last_seen = CURRENT_TIMESTAMP
+            WHERE id = (
+                SELECT id FROM prices WHERE product_id = ?
+                ORDER BY valid_from DESC, id DESC LIMIT 1
+            ) AND price = ? AND currency = ?
+        """, (product_id, price, currency))
+
+        if cursor.rowcount == 0:
+            old_price, old_currency = conn.execute(
+                "SELECT current_price, current_currency FROM products WHERE id = ?",
+                (product_id,)
+            ).fetchone() or (None, None)
+            valid_from = conn.execute("""
+                INSERT INTO prices (product_id, price, currency)
+                VALUES (?, ?, ?)
+                RETURNING valid_from
+            """, (product_id, price, currency)).fetchone()[0]
+            conn.execute("""
+                UPDATE products
+                SET current_price = ?, current_currency = ?, price_updated_at = ?
+                WHERE id = ?
+            """, (price, currency, valid_from, product_id))
+
+            if old_price is not None and old_currency == currency and old_price != price:
+                percent = round((price - old_price) / old_price * 100, 2) if old_price else None
+                conn.execute("""
+                    INSERT INTO price_changes
+                        (product_id, old_price, new_price, percent, detected_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (product_id, old_price, price, percent, valid_from))
 
     def add_product(self, site: str, product_data: Dict) -> int:
         """Ajoute ou met à jour un produit.
@@ -94,7 +399,7 @@ class Database:
         Returns:
             ID du produit dans la base
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
 
             # Vérifier si le produit existe
@@ -144,25 +449,88 @@ class Database:
                     INSERT INTO new_products (product_id)
                     VALUES (?)
                 """, (product_id,))
-
-            conn.commit()
             return product_id
 
     def add_price(self, product_id: int, price: float, currency: str = 'EUR'):
-        """Ajoute un prix au historique.
+        """Ajoute un prix à l'historique.
+
+        Un prix identique au dernier relevé prolonge sa plage (last_seen)
+        au lieu d'ajouter une ligne.
 
         Args:
             product_id: ID du produit
             price: Prix
             currency: Devise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO prices (product_id, price, currency)
-                VALUES (?, ?, ?)
-            """, (product_id, price, currency))
-            conn.commit()
+        with self.transaction() as conn:
+            self._record_price(conn, product_id, price, currency)
+
+    def add_products_bulk(self, site: str, products: List[Dict]) -> List[int]:
+        """Ajoute ou met à jour une série de produits et leurs prix.
+
+        Tout est écrit dans une seule transaction : les produits sont
+        upsertés par lots (`INSERT ... ON CONFLICT DO UPDATE ... RETURNING`),
+        et les identifiants renvoyés par ce même statement servent à
+        enregistrer les prix et à marquer les nouveautés (identifiants
+        au-delà du maximum existant avant l'insertion).
+
+        Args:
+            site: Nom du site
+            products: Dictionnaires de produits (comme pour `add_product`) ;
+                le prix est enregistré si `price` est renseigné
+
+        Returns:
+            IDs des produits dans la base, dans l'ordre de `products`
+        """
+        # Un même produit ne peut pas être upserté deux fois dans un statement
+        latest = {p['product_id']: p for p in products}
+        rows = list(latest.values())
+        ids: Dict[str, int] = {}
+
+        with self.transaction() as conn:
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM products").fetchone()[0]
+            now = datetime.now()
+
+            for start in range(0, len(rows), BULK_CHUNK_SIZE):
+                chunk = rows[start:start + BULK_CHUNK_SIZE]
+                params = []
+                for data in chunk:
+                    params.extend((
+                        site,
+                        data['product_id'],
+                        data['name'],
+                        data.get('brand'),
+                        data.get('category'),
+                        data.get('url'),
+                        data.get('image_url')
+                    ))
+                params.append(now)
+
+                cursor = conn.execute(f"""
+                    INSERT INTO products
+                    (site, product_id, name, brand, category, url, image_url)
+                    VALUES {', '.join(['(?, ?, ?, ?, ?, ?, ?)'] * len(chunk))}
+                    ON CONFLICT(site, product_id) DO UPDATE SET
+                        name = excluded.name, brand = excluded.brand,
+                        category = excluded.category, url = excluded.url,
+                        image_url = excluded.image_url, last_updated = ?
+                    RETURNING id, product_id
+                """, params)
+                ids.update((product_id, row_id) for row_id, product_id in cursor.fetchall())
+
+            # Marquer les nouveautés
+            conn.executemany("""
+                INSERT INTO new_products (product_id)
+                VALUES (?)
+            """, [(row_id,) for row_id in ids.values() if row_id > max_id])
+
+            for data in products:
+                if data.get('price'):
+                    self._record_price(
+                        conn, ids[data['product_id']], data['price'], data.get('currency', 'EUR')
+                    )
+
+        return [ids[data['product_id']] for data in products]
 
     def get_products(self, site: Optional[str] = None,
                      limit: Optional[int] = None) -> List[Dict]:
@@ -175,30 +543,55 @@ class Database:
         Returns:
             Liste de dictionnaires avec les produits
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        conn = self._connection()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        query = """
+            SELECT p.*
+            FROM products p
+        """
+        params = []
 
-            query = """
-                SELECT p.*,
-                       (SELECT price FROM prices
-                        WHERE product_id = p.id
-                        ORDER BY timestamp DESC LIMIT 1) as current_price
-                FROM products p
-            """
-            params = []
+        if site:
+            query += " WHERE p.site = ?"
+            params.append(site)
+
+        query += " ORDER BY p.last_updated DESC"
+
+        if limit:
+            query += f" LIMIT {limit}"
+
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_known_prices(self, site: Optional[str] = None) -> Set[Tuple[str, str, Optional[float]]]:
+        """Récupère les produits connus avec leur dernier prix.
+
+        Sert au crawl incrémental : un produit scrapé dont le tuple est dans
+        cet ensemble n'est ni nouveau ni modifié.
+
+        Args:
+            site: Filtrer par site (optionnel)
 
-            if site:
-                query += " WHERE p.site = ?"
-                params.append(site)
+        Returns:
+            Ensemble de tuples (site, product_id, dernier prix ou None)
+        """
+        conn = self._connection()
+        cursor = conn.cursor()
 
-            query += " ORDER BY p.last_updated DESC"
+        query = """
+            SELECT p.site, p.product_id, p.current_price
+            FROM products p
+        """
+        params = []
 
-            if limit:
-                query += f" LIMIT {limit}"
+        if site:
+            query += " WHERE p.site = ?"
+            params.append(site)
 
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        cursor.execute(query, params)
+        return set(cursor.fetchall())
 
     def get_price_history(self, product_id: int) -> List[Dict]:
         """Récupère l'historique des prix d'un produit.
@@ -207,20 +600,21 @@ class Database:
             product_id: ID du produit
 
         Returns:
-            Liste des prix avec timestamps
+            Liste des plages de prix (valid_from, last_seen), la plus
+            récente en premier
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        conn = self._connection()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
-            cursor.execute("""
-                SELECT price, currency, timestamp
-                FROM prices
-                WHERE product_id = ?
-                ORDER BY timestamp DESC
-            """, (product_id,))
+        cursor.execute("""
+            SELECT price, currency, valid_from, last_seen
+            FROM prices
+            WHERE product_id = ?
+            ORDER BY valid_from DESC
+        """, (product_id,))
 
-            return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_new_products(self, days: int = 7) -> List[Dict]:
         """Récupère les nouveautés récentes.
@@ -231,22 +625,19 @@ class Database:
         Returns:
             Liste des nouveaux produits
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        conn = self._connection()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
-            cursor.execute("""
-                SELECT p.*, np.detected_at,
-                       (SELECT price FROM prices
-                        WHERE product_id = p.id
-                        ORDER BY timestamp DESC LIMIT 1) as current_price
-                FROM products p
-                JOIN new_products np ON p.id = np.product_id
-                WHERE datetime(np.detected_at) > datetime('now', '-' || ? || ' days')
-                ORDER BY np.detected_at DESC
-            """, (days,))
-
-            return [dict(row) for row in cursor.fetchall()]
+        cursor.execute("""
+            SELECT p.*, np.detected_at
+            FROM products p
+            JOIN new_products np ON p.id = np.product_id
+            WHERE datetime(np.detected_at) > datetime('now', '-' || ? || ' days')
+            ORDER BY np.detected_at DESC
+        """, (days,))
+
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_stats(self) -> Dict:
         """Récupère les statistiques de la base.
@@ -254,35 +645,35 @@ class Database:
         Returns:
             Dictionnaire avec les stats
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Total produits par site
-            cursor.execute("""
-                SELECT site, COUNT(*) as count
-                FROM products
-                GROUP BY site
-            """)
-            products_by_site = dict(cursor.fetchall())
-
-            # Total produits
-            cursor.execute("SELECT COUNT(*) FROM products")
-            total_products = cursor.fetchone()[0]
-
-            # Nouveautés 7 derniers jours
-            cursor.execute("""
-                SELECT COUNT(*) FROM new_products
-                WHERE datetime(detected_at) > datetime('now', '-7 days')
-            """)
-            new_last_week = cursor.fetchone()[0]
-
-            # Total prix enregistrés
-            cursor.execute("SELECT COUNT(*) FROM prices")
-            total_prices = cursor.fetchone()[0]
-
-            return {
-                'total_products': total_products,
-                'products_by_site': products_by_site,
-                'new_last_week': new_last_week,
-                'total_prices': total_prices
-            }
+        conn = self._connection()
+        cursor = conn.cursor()
+
+        # Total produits par site
+        cursor.execute("""
+            SELECT site, COUNT(*) as count
+            FROM products
+            GROUP BY site
+        """)
+        products_by_site = dict(cursor.fetchall())
+
+        # Total produits
+        cursor.execute("SELECT COUNT(*) FROM products")
+        total_products = cursor.fetchone()[0]
+
+        # Nouveautés 7 derniers jours
+        cursor.execute("""
+            SELECT COUNT(*) FROM new_products
+            WHERE datetime(detected_at) > datetime('now', '-7 days')
+        """)
+        new_last_week = cursor.fetchone()[0]
+
+        # Total prix enregistrés
+        cursor.execute("SELECT COUNT(*) FROM prices")
+        total_prices = cursor.fetchone()[0]
+
+        return {
+            'total_products': total_products,
+            'products_by_site': products_by_site,
+            'new_last_week': new_last_week,
+            'total_prices': total_prices
+        }
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { Link } from 'react-router-dom'
 import { Search, X, Plus, Package, ExternalLink, ArrowLeft } from 'lucide-react'
-import { searchProducts, fetchPriceHistory } from '../utils/api'
+import { searchProducts, fetchPriceHistories } from '../utils/api'
 
 const BRAND_COLORS = {
   'Dermalogica': { bg: 'bg-gray-900 text-white dark:bg-white dark:text-gray-900', accent: '#1f2937' },
@@ -39,19 +39,33 @@ const ProductCompare = () => {
     }
   }
 
-  const addProduct = async (product) => {
+  // Load every compared product in one batch request when the selection changes
+  useEffect(() => {
+    if (selectedProducts.length === 0) return
+    let cancelled = false
+    const loadDetails = async () => {
+      try {
+        const data = await fetchPriceHistories(selectedProducts, { points: 100 })
+        if (cancelled) return
+        const details = {}
+        Object.values(data).forEach(({ product, points, runs }) => {
+          details[product.id] = { ...product, history: points, history_runs: runs }
+        })
+        setProductDetails(details)
+      } catch (error) {
+        console.error('Error loading product detail:', error)
+      }
+    }
+    loadDetails()
+    return () => { cancelled = true }
+  }, [selectedProducts])
+
+  const addProduct = (product) => {
     if (selectedProducts.length >= 4) return
     setSelectedProducts(prev => [...prev, product.id])
     setSearchQuery('')
     setSearchResults([])
     setShowSearch(false)
-
-    try {
-      const data = await fetchPriceHistory(product.id)
-      setProductDetails(prev => ({ ...prev, [product.id]: { ...data.product, history: data.history, current_price: product.current_price } }))
-    } catch (error) {
-      console.error('Error loading product detail:', error)
-    }
   }
 
   const removeProduct = (id) => {
@@ -207,7 +221,7 @@ const ProductCompare = () => {
             { label: 'Marque', render: p => <span className="text-sm text-gray-700 dark:text-gray-300">{p.brand}</span> },
             { label: 'Catégorie', render: p => <span className="text-sm text-gray-700 dark:text-gray-300">{p.category || 'N/A'}</span> },
             { label: 'Site', render: p => <span className="text-sm text-gray-700 dark:text-gray-300">{p.site}</span> },
-            { label: 'Historique prix', render: p => <span className="text-sm text-gray-700 dark:text-gray-300">{p.history?.length || 0} enregistrement(s)</span> },
+            { label: 'Historique prix', render: p => <span className="text-sm text-gray-700 dark:text-gray-300">{p.history_runs || 0} enregistrement(s)</span> },
             { label: 'Lien', render: p => p.url ? (
               <a href={p.url} target="_blank" rel="noopener noreferrer" className="inline-flex items-center text-xs text-gray-500 hover:text-gray-900 dark:hover:text-white transition-colors">
                 Voir <ExternalLink className="h-3 w-3 ml-1" />
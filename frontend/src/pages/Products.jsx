@@ -1,14 +1,20 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Search, Filter } from 'lucide-react'
 import ProductCard from '../components/ProductCard'
 import { fetchProducts, fetchBrands, fetchSites } from '../utils/api'
 
+const PER_PAGE = 20
+
 const Products = () => {
   const [products, setProducts] = useState([])
   const [brands, setBrands] = useState([])
   const [sites, setSites] = useState([])
   const [loading, setLoading] = useState(true)
-  const [pagination, setPagination] = useState({ page: 1, per_page: 20, total: 0, pages: 0 })
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [total, setTotal] = useState(0)
+  const [nextCursor, setNextCursor] = useState(null)
+  const requestId = useRef(0)
+  const sentinel = useRef(null)
 
   const [filters, setFilters] = useState({
     brand: '',
@@ -26,7 +32,17 @@ const Products = () => {
 
   useEffect(() => {
     loadProducts()
-  }, [filters, pagination.page])
+  }, [filters])
+
+  // Infinite scroll: load the next page when the end of the grid is visible
+  useEffect(() => {
+    if (!sentinel.current || !nextCursor) return
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) loadMore()
+    }, { rootMargin: '400px' })
+    observer.observe(sentinel.current)
+    return () => observer.disconnect()
+  }, [nextCursor, loadingMore, loading])
 
   const loadBrandsAndSites = async () => {
     try {
@@ -38,31 +54,49 @@ const Products = () => {
     }
   }
 
+  // Keyset pagination: the server returns a cursor to the next page
+  const buildParams = (cursor) => {
+    const params = { ...filters }
+    Object.keys(params).forEach((key) => {
+      if (params[key] === '') delete params[key]
+    })
+    return { ...params, per_page: PER_PAGE, cursor }
+  }
+
   const loadProducts = async () => {
+    const id = ++requestId.current
     setLoading(true)
     try {
-      const params = { page: pagination.page, per_page: pagination.per_page, ...filters }
-      Object.keys(params).forEach((key) => {
-        if (params[key] === '') delete params[key]
-      })
-      const data = await fetchProducts(params)
+      const data = await fetchProducts(buildParams(''))
+      if (id !== requestId.current) return
       setProducts(data.products)
-      setPagination(data.pagination)
+      setTotal(data.pagination.total)
+      setNextCursor(data.pagination.next_cursor)
     } catch (error) {
       console.error('Error loading products:', error)
     } finally {
-      setLoading(false)
+      if (id === requestId.current) setLoading(false)
     }
   }
 
-  const handleFilterChange = (key, value) => {
-    setFilters({ ...filters, [key]: value })
-    setPagination({ ...pagination, page: 1 })
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return
+    const id = requestId.current
+    setLoadingMore(true)
+    try {
+      const data = await fetchProducts({ ...buildParams(nextCursor), with_total: false })
+      if (id !== requestId.current) return
+      setProducts((current) => [...current, ...data.products])
+      setNextCursor(data.pagination.next_cursor)
+    } catch (error) {
+      console.error('Error loading products:', error)
+    } finally {
+      setLoadingMore(false)
+    }
   }
 
-  const handlePageChange = (newPage) => {
-    setPagination({ ...pagination, page: newPage })
-    window.scrollTo({ top: 0, behavior: 'smooth' })
+  const handleFilterChange = (key, value) => {
+    setFilters({ ...filters, [key]: value })
   }
 
   const selectClass = "w-full px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg text-sm focus:ring-2 focus:ring-gray-900 dark:focus:ring-white dark:bg-gray-800 dark:text-white"
@@ -72,7 +106,7 @@ const Products = () => {
       <div>
         <h1 className="text-3xl font-bold text-gray-900 dark:text-white">Produits</h1>
         <p className="text-gray-500 dark:text-gray-400 mt-1">
-          Explorez {pagination.total} produits
+          Explorez {total} produits
         </p>
       </div>
 
@@ -166,49 +200,17 @@ const Products = () => {
             ))}
           </div>
 
-          {pagination.pages > 1 && (
-            <div className="flex justify-center items-center space-x-2 mt-8">
+          <div ref={sentinel} className="flex justify-center mt-8">
+            {nextCursor && (
               <button
-                onClick={() => handlePageChange(pagination.page - 1)}
-                disabled={pagination.page === 1}
+                onClick={loadMore}
+                disabled={loadingMore}
                 className="px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg text-sm disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-100 dark:hover:bg-gray-700 dark:text-white transition-colors"
               >
-                Précédent
+                {loadingMore ? 'Chargement...' : 'Afficher plus'}
               </button>
-
-              <div className="flex space-x-1">
-                {[...Array(pagination.pages)].map((_, i) => {
-                  const page = i + 1
-                  if (page === 1 || page === pagination.pages || (page >= pagination.page - 1 && page <= pagination.page + 1)) {
-                    return (
-                      <button
-                        key={page}
-                        onClick={() => handlePageChange(page)}
-                        className={`px-3 py-2 rounded-lg text-sm ${
-                          page === pagination.page
-                            ? 'bg-gray-900 dark:bg-white text-white dark:text-gray-900'
-                            : 'border border-gray-300 dark:border-gray-600 hover:bg-gray-100 dark:hover:bg-gray-700 dark:text-white'
-                        }`}
-                      >
-                        {page}
-                      </button>
-                    )
-                  } else if (page === pagination.page - 2 || page === pagination.page + 2) {
-                    return <span key={page} className="px-2 dark:text-white text-sm">...</span>
-                  }
-                  return null
-                })}
-              </div>
-
-              <button
-                onClick={() => handlePageChange(pagination.page + 1)}
-                disabled={pagination.page === pagination.pages}
-                className="px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg text-sm disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-100 dark:hover:bg-gray-700 dark:text-white transition-colors"
-              >
-                Suivant
-              </button>
-            </div>
-          )}
+            )}
+          </div>
         </>
       )}
     </div>
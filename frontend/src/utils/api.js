@@ -40,6 +40,11 @@ export const fetchPriceHistory = async (productId) => {
   return data
 }
 
+export const fetchPriceHistories = async (ids, params = {}) => {
+  const { data } = await api.get('/api/price-history', { params: { ids: ids.join(','), ...params } })
+  return data
+}
+
 export const fetchSites = async () => {
   const { data } = await api.get('/api/sites')
   return data
@@ -51,4 +56,4 @@ export const searchProducts = async (query) => {
   return data
 }
 
-export default { fetchStats, fetchBrands, fetchProducts, fetchNewProducts, fetchPromotions, fetchPriceHistory, fetchSites, searchProducts }
+export default { fetchStats, fetchBrands, fetchProducts, fetchNewProducts, fetchPromotions, fetchPriceHistory, fetchPriceHistories, fetchSites, searchProducts }
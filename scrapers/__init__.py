@@ -5,11 +5,23 @@ from .nocibe import NocibeScraper
 from .marionnaud import MarionnaudScraper
 from .lookfantastic import LookfantasticScraper
 from .feelunique import FeeluniqueScraper
+from .shopify import ShopifyScraper
+from .fetcher import HybridFetcher, hybrid_fetcher
+from .engine import (
+    scrape_sites, scrape_sites_async, enrich_products, enrich_products_async
+)
 
 __all__ = [
     'SephoraScraper',
     'NocibeScraper',
     'MarionnaudScraper',
     'LookfantasticScraper',
-    'FeeluniqueScraper'
+    'FeeluniqueScraper',
+    'ShopifyScraper',
+    'HybridFetcher',
+    'hybrid_fetcher',
+    'scrape_sites',
+    'scrape_sites_async',
+    'enrich_products',
+    'enrich_products_async'
 ]
@@ -1,31 +1,54 @@
 """Classe de base pour tous les scrapers."""
 
+import asyncio
+import queue
+import threading
 import time
 import logging
-import random
-from typing import Dict, List, Optional
+from contextlib import aclosing, closing, suppress
+from functools import partial
+from typing import (
+    Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
+)
+from urllib.parse import urlsplit
 import requests
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 
+from config import (
+    HTTP_CACHE_ENABLED, HTTP_CACHE_PATH, HTTP_CACHE_MAX_AGE_DAYS, PREFETCH_PAGES,
+    EXTRACTION_ENGINE, INCREMENTAL_STOP_PAGES
+)
+from brands import brand_matcher, normalize_brand
+from .extraction import ExtractionSpec
+from .fetcher import hybrid_fetcher
+from .http_cache import ResponseCache
+from .rate_limiter import rate_limiter, THROTTLE_STATUSES
+
 logger = logging.getLogger(__name__)
 
 
 class BaseScraper:
     """Classe de base pour tous les scrapers."""
 
+    # Spécification lxml des tuiles produits (compilée une fois par site)
+    EXTRACTION_SPEC: Optional[ExtractionSpec] = None
+
     def __init__(self, site_name: str, base_url: str,
                  request_delay: float = 2.0,
                  timeout: int = 10,
-                 max_retries: int = 3):
+                 max_retries: int = 3,
+                 use_cache: bool = HTTP_CACHE_ENABLED):
         """Initialise le scraper.
 
         Args:
             site_name: Nom du site
             base_url: URL de base du site
-            request_delay: Délai entre requêtes (secondes)
+            request_delay: Délai moyen entre requêtes vers un même hôte
+                (secondes), sauf surcharge dans RATE_LIMIT_HOSTS
             timeout: Timeout des requêtes (secondes)
             max_retries: Nombre max de tentatives
+            use_cache: Revalider les pages via le cache HTTP conditionnel
         """
         self.site_name = site_name
         self.base_url = base_url
@@ -34,6 +57,11 @@ class BaseScraper:
         self.max_retries = max_retries
         self.ua = UserAgent()
         self.session = requests.Session()
+        self.http_cache = (
+            ResponseCache(HTTP_CACHE_PATH, HTTP_CACHE_MAX_AGE_DAYS) if use_cache else None
+        )
+        self.extraction_engine = EXTRACTION_ENGINE
+        self.fetcher = hybrid_fetcher
 
     def _get_headers(self) -> Dict:
         """Génère des headers avec User-Agent aléatoire.
@@ -50,6 +78,44 @@ class BaseScraper:
             'Upgrade-Insecure-Requests': '1'
         }
 
+    def _send(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
+        """Envoie une requête via la session, sans retry ni attente.
+
+        La réponse est signalée au rate limiter, qui ralentit l'hôte en cas
+        de 429/503 ou de `Retry-After`.
+
+        Args:
+            url: URL à requêter
+            method: Méthode HTTP
+            **kwargs: Arguments supplémentaires pour requests
+
+        Returns:
+            Réponse HTTP
+        """
+        headers = {**self._get_headers(), **kwargs.pop('headers', {})}
+        response = self.session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            timeout=self.timeout,
+            **kwargs
+        )
+        rate_limiter.observe(
+            urlsplit(url).netloc, response.status_code, response.headers.get('Retry-After')
+        )
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _should_backoff(error: requests.exceptions.RequestException) -> bool:
+        """Indique si un échec doit être suivi d'un backoff local.
+
+        Les 429/503 sont déjà pris en charge par le rate limiter (pause par
+        hôte), inutile d'attendre une seconde fois.
+        """
+        response = getattr(error, 'response', None)
+        return response is None or response.status_code not in THROTTLE_STATUSES
+
     def _make_request(self, url: str, method: str = 'GET',
                      **kwargs) -> Optional[requests.Response]:
         """Effectue une requête HTTP avec retry et rate limiting.
@@ -64,19 +130,45 @@ class BaseScraper:
         """
         for attempt in range(self.max_retries):
             try:
-                # Rate limiting
-                time.sleep(self.request_delay + random.uniform(0, 0.5))
-
-                # Requête
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    headers=self._get_headers(),
-                    timeout=self.timeout,
-                    **kwargs
+                # Rate limiting par hôte
+                rate_limiter.acquire(urlsplit(url).netloc, self.request_delay)
+
+                response = self._send(url, method, **kwargs)
+                logger.debug(f"Requête réussie: {url}")
+                return response
+
+            except requests.exceptions.RequestException as e:
+                logger.warning(
+                    f"Erreur requête (tentative {attempt + 1}/{self.max_retries}): {e}"
                 )
+                if attempt < self.max_retries - 1:
+                    if self._should_backoff(e):
+                        time.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error(f"Échec après {self.max_retries} tentatives: {url}")
+                    return None
 
-                response.raise_for_status()
+    async def _make_request_async(self, url: str, method: str = 'GET',
+                                  **kwargs) -> Optional[requests.Response]:
+        """Version awaitable de `_make_request`.
+
+        Les attentes (rate limiting, backoff) sont awaitables et
+        l'appel réseau bloquant est délégué à un thread : la boucle reste
+        libre pour les requêtes des autres sites.
+
+        Args:
+            url: URL à requêter
+            method: Méthode HTTP
+            **kwargs: Arguments supplémentaires pour requests
+
+        Returns:
+            Réponse HTTP ou None si échec
+        """
+        for attempt in range(self.max_retries):
+            try:
+                await rate_limiter.acquire_async(urlsplit(url).netloc, self.request_delay)
+
+                response = await asyncio.to_thread(self._send, url, method, **kwargs)
                 logger.debug(f"Requête réussie: {url}")
                 return response
 
@@ -85,7 +177,8 @@ class BaseScraper:
                     f"Erreur requête (tentative {attempt + 1}/{self.max_retries}): {e}"
                 )
                 if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    if self._should_backoff(e):
+                        await asyncio.sleep(2 ** attempt)
                 else:
                     logger.error(f"Échec après {self.max_retries} tentatives: {url}")
                     return None
@@ -114,9 +207,7 @@ class BaseScraper:
         Returns:
             Nom normalisé (minuscules, sans accents)
         """
-        if not brand:
-            return ''
-        return brand.lower().strip()
+        return normalize_brand(brand)
 
     def _match_brands(self, brand: str, target_brands: Optional[List[str]] = None) -> bool:
         """Vérifie si une marque correspond aux marques cibles.
@@ -134,31 +225,472 @@ class BaseScraper:
         if not brand:
             return False
 
-        from config import BRAND_ALIASES
-
-        brand_normalized = self._normalize_brand(brand)
+        brand_id = brand_matcher.resolve(brand)
 
-        # Vérifier les correspondances avec les alias
         for target in target_brands:
+            target_id = brand_matcher.resolve(target)
+            if target_id:
+                if target_id == brand_id:
+                    return True
+                continue
+
+            # Marque absente de BRAND_ALIASES : comparaison directe
+            brand_normalized = self._normalize_brand(brand)
             target_normalized = self._normalize_brand(target)
-            aliases = BRAND_ALIASES.get(target_normalized, [target_normalized])
+            if target_normalized in brand_normalized or brand_normalized in target_normalized:
+                return True
+
+        return False
+
+    def _category_url(self, category: str) -> str:
+        """Construit l'URL d'une catégorie (surchargeable par site).
+
+        Args:
+            category: Catégorie à scraper
+
+        Returns:
+            URL de la catégorie, sans pagination
+        """
+        return f"{self.base_url}/{category}"
+
+    def _page_url(self, category_url: str, page: int) -> str:
+        """Construit l'URL d'une page de listing.
+
+        Args:
+            category_url: URL de la catégorie
+            page: Numéro de page (commence à 1)
+
+        Returns:
+            URL de la page
+        """
+        return f"{category_url}?page={page}"
+
+    def _find_product_items(self, soup: BeautifulSoup) -> List:
+        """Trouve les tuiles produits d'une page (moteur BeautifulSoup).
+        À implémenter dans les sous-classes.
+
+        Args:
+            soup: Page parsée
+
+        Returns:
+            Liste d'éléments produit
+        """
+        raise NotImplementedError("À implémenter dans les sous-classes")
+
+    def _extract_item_fields(self, item) -> Dict[str, Any]:
+        """Extrait les champs bruts d'une tuile (moteur BeautifulSoup).
+        À implémenter dans les sous-classes, avec les mêmes champs que
+        `EXTRACTION_SPEC`.
+
+        Args:
+            item: Élément produit BeautifulSoup
+
+        Returns:
+            Dictionnaire {champ: valeur}
+        """
+        raise NotImplementedError("À implémenter dans les sous-classes")
+
+    def _build_product(self, fields: Dict[str, Any]) -> Optional[Dict]:
+        """Construit un produit à partir des champs bruts d'une tuile.
+        À implémenter dans les sous-classes.
+
+        Args:
+            fields: Champs extraits (quel que soit le moteur)
+
+        Returns:
+            Dictionnaire avec les données du produit, ou None si incomplet
+        """
+        raise NotImplementedError("À implémenter dans les sous-classes")
+
+    def _extract_items(self, html: str) -> Tuple[Optional[List], Callable[[Any], Dict]]:
+        """Trouve les tuiles d'une page avec le moteur d'extraction configuré.
+
+        Args:
+            html: HTML de la page
+
+        Returns:
+            (tuiles ou None si le parsing échoue, extracteur de champs)
+        """
+        spec = self.EXTRACTION_SPEC
+        if self.extraction_engine == 'lxml' and spec:
+            return spec.find_items(spec.parse(html)), spec.extract_item
+
+        soup = self._parse_html(html)
+        if not soup:
+            return None, self._extract_item_fields
+        return self._find_product_items(soup), self._extract_item_fields
 
-            for alias in aliases:
-                if self._normalize_brand(alias) in brand_normalized or brand_normalized in self._normalize_brand(alias):
+    def _extract_page(self, html: str, page: int) -> Optional[List[Dict]]:
+        """Extrait les produits d'une page de listing (avant filtrage marques).
+
+        Args:
+            html: HTML de la page
+            page: Numéro de page (pour les logs)
+
+        Returns:
+            Produits de la page, ou None si la page n'en contient aucun
+            (fin de pagination)
+        """
+        product_items, extract_fields = self._extract_items(html)
+        if product_items is None:
+            return []
+
+        if not product_items:
+            logger.info(f"Aucun produit trouvé page {page}")
+            return None
+
+        logger.info(f"Trouvé {len(product_items)} produits page {page}")
+
+        products = []
+        for item in product_items:
+            try:
+                product = self._build_product(extract_fields(item))
+                if product:
+                    products.append(product)
+            except Exception as e:
+                logger.error(f"Erreur parsing produit: {e}")
+                continue
+
+        return products
+
+    def _filter_brands(self, products: List[Dict],
+                       brands: Optional[List[str]] = None) -> List[Dict]:
+        """Garde les produits des marques demandées.
+
+        Args:
+            products: Produits extraits
+            brands: Liste de marques à filtrer (None = toutes)
+
+        Returns:
+            Produits retenus
+        """
+        return [p for p in products if self._match_brands(p.get('brand', ''), brands)]
+
+    def _has_changes(self, products: List[Dict],
+                     known: Set[Tuple[str, str, Optional[float]]]) -> bool:
+        """Indique si une page contient un produit nouveau ou un prix changé.
+
+        Args:
+            products: Produits de la page (après filtrage marques)
+            known: Tuples (site, product_id, prix) déjà en base
+
+        Returns:
+            True si au moins un produit est absent de `known`
+        """
+        return any(
+            (self.site_name, p['product_id'], p.get('price')) not in known
+            for p in products
+        )
+
+    def _extract_and_store(self, url: str, response: requests.Response,
+                           extract: Callable[[str], Any]) -> Any:
+        """Extrait une réponse, ou reprend le résultat en cache si 304.
+
+        Args:
+            url: URL requêtée
+            response: Réponse HTTP (200 ou 304)
+            extract: Fonction d'extraction appliquée au HTML
+
+        Returns:
+            Résultat de l'extraction
+        """
+        if response.status_code == 304 and self.http_cache:
+            found, result = self.http_cache.get(url)
+            if found:
+                logger.info(f"Page inchangée (304), extraction précédente réutilisée: {url}")
+                return result
+
+        result = extract(response.text)
+        if self.http_cache:
+            self.http_cache.store(url, response, result)
+        return result
+
+    def _request_http(self, url: str) -> Optional[requests.Response]:
+        """Requête avec validateurs du cache ; retente sans eux si 304 orphelin."""
+        headers = self.http_cache.validators(url) if self.http_cache else {}
+        response = self._make_request(url, headers=headers)
+        if headers and response is not None and response.status_code == 304 \
+                and not self.http_cache.get(url)[0]:
+            response = self._make_request(url)
+        return response
+
+    def _request_conditional(self, url: str) -> Optional[requests.Response]:
+        """Récupère une page en HTTP, ou via le navigateur si elle est rendue
+        côté client (voir `HybridFetcher`)."""
+        if self.fetcher:
+            return self.fetcher.fetch(self, url)
+        return self._request_http(url)
+
+    async def _request_conditional_async(self, url: str) -> Optional[requests.Response]:
+        """Version awaitable de `_request_conditional`.
+
+        Les pages connues pour se servir en HTTP passent par
+        `_make_request_async` (rate limiting awaitable) ; la détection et le
+        rendu navigateur restent bloquants et sont délégués à un thread.
+        """
+        if self.fetcher and not self.fetcher.http_only(url):
+            return await asyncio.to_thread(self.fetcher.fetch, self, url)
+
+        headers = self.http_cache.validators(url) if self.http_cache else {}
+        response = await self._make_request_async(url, headers=headers)
+        if headers and response is not None and response.status_code == 304 \
+                and not self.http_cache.get(url)[0]:
+            response = await self._make_request_async(url)
+        return response
+
+    def _fetch_extracted(self, url: str, extract: Callable[[str], Any]) -> Tuple[bool, Any]:
+        """Télécharge (ou revalide) une page et en extrait le contenu.
+
+        Args:
+            url: URL de la page
+            extract: Fonction d'extraction appliquée au HTML
+
+        Returns:
+            (succès de la requête, résultat de l'extraction)
+        """
+        response = self._request_conditional(url)
+        if not response:
+            return False, None
+        return True, self._extract_and_store(url, response, extract)
+
+    async def _fetch_extracted_async(self, url: str,
+                                     extract: Callable[[str], Any]) -> Tuple[bool, Any]:
+        """Version awaitable de `_fetch_extracted` (extraction dans un thread)."""
+        response = await self._request_conditional_async(url)
+        if not response:
+            return False, None
+        return True, await asyncio.to_thread(self._extract_and_store, url, response, extract)
+
+    def _iter_pages(self, category_url: str, max_pages: int,
+                    prefetch: int) -> Iterator[Tuple[int, str, Optional[requests.Response]]]:
+        """Itère sur les réponses des pages de listing, dans l'ordre.
+
+        Avec `prefetch` > 0, un thread producteur télécharge les pages
+        suivantes (dans la limite du rate limiter) pendant que l'appelant
+        parse la page courante ; au plus `prefetch` pages attendent d'être
+        consommées. Fermer le générateur (`contextlib.closing`) arrête le
+        producteur.
+
+        Args:
+            category_url: URL de la catégorie
+            max_pages: Nombre max de pages
+            prefetch: Nombre de pages téléchargées d'avance (0 = séquentiel)
+
+        Yields:
+            (numéro de page, URL, réponse ou None si échec)
+        """
+        def fetch(page: int) -> Tuple[int, str, Optional[requests.Response]]:
+            url = self._page_url(category_url, page)
+            logger.info(f"Scraping page {page}/{max_pages}: {url}")
+            return page, url, self._request_conditional(url)
+
+        if prefetch <= 0:
+            for page in range(1, max_pages + 1):
+                yield fetch(page)
+            return
+
+        pages: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
                     return True
+                except queue.Full:
+                    continue
+            return False
 
-        return False
+        def produce():
+            try:
+                for page in range(1, max_pages + 1):
+                    if stop.is_set() or not put(fetch(page)):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(None)
+
+        producer = threading.Thread(
+            target=produce, name=f"prefetch-{self.site_name}", daemon=True
+        )
+        producer.start()
+        try:
+            while (item := pages.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    async def _aiter_pages(self, category_url: str, max_pages: int,
+                           prefetch: int) -> AsyncIterator[Tuple[int, str, Optional[requests.Response]]]:
+        """Version awaitable de `_iter_pages` (producteur = tâche asyncio).
+
+        À consommer dans `contextlib.aclosing` pour arrêter le producteur
+        dès la sortie de boucle.
+        """
+        async def fetch(page: int) -> Tuple[int, str, Optional[requests.Response]]:
+            url = self._page_url(category_url, page)
+            logger.info(f"Scraping page {page}/{max_pages}: {url}")
+            return page, url, await self._request_conditional_async(url)
+
+        if prefetch <= 0:
+            for page in range(1, max_pages + 1):
+                yield await fetch(page)
+            return
 
-    def scrape_products(self, **kwargs) -> List[Dict]:
-        """Scrape les produits. À implémenter dans les sous-classes.
+        pages: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def produce():
+            try:
+                for page in range(1, max_pages + 1):
+                    await pages.put(await fetch(page))
+            except Exception as e:
+                await pages.put(e)
+            await pages.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await pages.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
+    def scrape_products(self, category: str = 'nouveautes',
+                        max_pages: int = 3,
+                        brands: Optional[List[str]] = None,
+                        prefetch: int = PREFETCH_PAGES,
+                        known: Optional[Set[Tuple[str, str, Optional[float]]]] = None,
+                        stop_after: int = INCREMENTAL_STOP_PAGES) -> List[Dict]:
+        """Scrape les produits d'une catégorie.
+
+        Args:
+            category: Catégorie à scraper (nouveautes, maquillage, soins, etc.)
+            max_pages: Nombre max de pages à scraper
+            brands: Liste de marques à filtrer (optionnel)
+            prefetch: Pages téléchargées d'avance pendant le parsing
+                (0 = séquentiel)
+            known: Tuples (site, product_id, prix) déjà en base ; si fourni,
+                crawl incrémental (voir `Database.get_known_prices`)
+            stop_after: En incrémental, arrêt après ce nombre de pages
+                consécutives sans nouveauté ni changement de prix
+
+        Returns:
+            Liste de produits
+        """
+        products = []
+        unchanged = 0
+        logger.info(f"Scraping {self.site_name} - catégorie: {category}")
+        category_url = self._category_url(category)
+
+        pages = self._iter_pages(category_url, max_pages, prefetch)
+        with closing(pages):
+            for page, url, response in pages:
+                if not response:
+                    logger.warning(f"Échec page {page}")
+                    continue
+
+                page_products = self._extract_and_store(
+                    url, response, partial(self._extract_page, page=page)
+                )
+                if page_products is None:
+                    break
+                page_products = self._filter_brands(page_products, brands)
+                products.extend(page_products)
+
+                # Une page sans produit des marques suivies ne dit rien du
+                # crawl : elle ne relance ni ne rapproche l'arrêt
+                if known is not None and page_products:
+                    unchanged = 0 if self._has_changes(page_products, known) else unchanged + 1
+                    if unchanged >= stop_after:
+                        logger.info(f"{unchanged} page(s) sans changement, arrêt page {page}")
+                        break
+
+        logger.info(f"Total {self.site_name}: {len(products)} produits")
+        return products
+
+    async def scrape_products_async(self, category: str = 'nouveautes',
+                                    max_pages: int = 3,
+                                    brands: Optional[List[str]] = None,
+                                    prefetch: int = PREFETCH_PAGES,
+                                    known: Optional[Set[Tuple[str, str, Optional[float]]]] = None,
+                                    stop_after: int = INCREMENTAL_STOP_PAGES) -> List[Dict]:
+        """Version awaitable de `scrape_products`.
+
+        Les requêtes d'un même site restent séquentielles (politesse), mais
+        plusieurs sites peuvent être scrapés en parallèle sur la même boucle.
+
+        Args:
+            category: Catégorie à scraper
+            max_pages: Nombre max de pages à scraper
+            brands: Liste de marques à filtrer (optionnel)
+            prefetch: Pages téléchargées d'avance pendant le parsing
+                (0 = séquentiel)
+            known: Tuples (site, product_id, prix) déjà en base (crawl
+                incrémental)
+            stop_after: Pages consécutives inchangées avant arrêt
 
         Returns:
             Liste de produits
         """
+        products = []
+        unchanged = 0
+        logger.info(f"Scraping {self.site_name} - catégorie: {category}")
+        category_url = self._category_url(category)
+
+        pages = self._aiter_pages(category_url, max_pages, prefetch)
+        async with aclosing(pages):
+            async for page, url, response in pages:
+                if not response:
+                    logger.warning(f"Échec page {page}")
+                    continue
+
+                page_products = await asyncio.to_thread(
+                    self._extract_and_store, url, response, partial(self._extract_page, page=page)
+                )
+                if page_products is None:
+                    break
+                page_products = self._filter_brands(page_products, brands)
+                products.extend(page_products)
+
+                # Une page sans produit des marques suivies ne dit rien du
+                # crawl : elle ne relance ni ne rapproche l'arrêt
+                if known is not None and page_products:
+                    unchanged = 0 if self._has_changes(page_products, known) else unchanged + 1
+                    if unchanged >= stop_after:
+                        logger.info(f"{unchanged} page(s) sans changement, arrêt page {page}")
+                        break
+
+        logger.info(f"Total {self.site_name}: {len(products)} produits")
+        return products
+
+    def _parse_product_details(self, soup: BeautifulSoup, product_url: str) -> Optional[Dict]:
+        """Extrait les détails d'une fiche produit. À implémenter dans les sous-classes.
+
+        Args:
+            soup: Fiche produit parsée
+            product_url: URL du produit
+
+        Returns:
+            Dictionnaire avec les détails du produit
+        """
         raise NotImplementedError("À implémenter dans les sous-classes")
 
+    def _extract_product_details(self, html: str, product_url: str) -> Optional[Dict]:
+        """Parse une fiche produit puis en extrait les détails."""
+        soup = self._parse_html(html)
+        if not soup:
+            return None
+        return self._parse_product_details(soup, product_url)
+
     def scrape_product_details(self, product_url: str) -> Optional[Dict]:
-        """Scrape les détails d'un produit. À implémenter dans les sous-classes.
+        """Scrape les détails d'un produit.
 
         Args:
             product_url: URL du produit
@@ -166,7 +698,26 @@ class BaseScraper:
         Returns:
             Dictionnaire avec les détails du produit
         """
-        raise NotImplementedError("À implémenter dans les sous-classes")
+        logger.info(f"Scraping détails: {product_url}")
+        ok, details = self._fetch_extracted(
+            product_url, partial(self._extract_product_details, product_url=product_url)
+        )
+        return details if ok else None
+
+    async def scrape_product_details_async(self, product_url: str) -> Optional[Dict]:
+        """Version awaitable de `scrape_product_details`.
+
+        Args:
+            product_url: URL du produit
+
+        Returns:
+            Dictionnaire avec les détails du produit
+        """
+        logger.info(f"Scraping détails: {product_url}")
+        ok, details = await self._fetch_extracted_async(
+            product_url, partial(self._extract_product_details, product_url=product_url)
+        )
+        return details if ok else None
 
     def close(self):
         """Ferme la session."""
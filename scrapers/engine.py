@@ -0,0 +1,137 @@
+"""Exécution concurrente des scrapers (asyncio)."""
+
+import asyncio
+import logging
+from typing import Dict, Iterator, List, Union
+from urllib.parse import urldefrag
+
+from config import DETAILS_WORKERS_PER_SITE
+from .base import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+
+async def scrape_sites_async(scrapers: List[BaseScraper],
+                             **kwargs) -> Dict[str, Union[List[Dict], Exception]]:
+    """Scrape plusieurs sites en parallèle.
+
+    Chaque site garde ses propres délais (rate limiting par hôte), le temps
+    total est donc proche de celui du site le plus lent.
+
+    Args:
+        scrapers: Scrapers à lancer
+        **kwargs: Arguments transmis à `scrape_products_async`
+            (category, max_pages, brands, prefetch, known, stop_after)
+
+    Returns:
+        Dictionnaire {site: produits}, ou l'exception levée pour ce site
+    """
+    results = await asyncio.gather(
+        *(scraper.scrape_products_async(**kwargs) for scraper in scrapers),
+        return_exceptions=True
+    )
+
+    by_site = {}
+    for scraper, result in zip(scrapers, results):
+        if isinstance(result, Exception):
+            logger.error(f"Erreur scraping {scraper.site_name}: {result}", exc_info=result)
+        by_site[scraper.site_name] = result
+
+    return by_site
+
+
+def scrape_sites(scrapers: List[BaseScraper],
+                 **kwargs) -> Dict[str, Union[List[Dict], Exception]]:
+    """Point d'entrée synchrone de `scrape_sites_async`.
+
+    Args:
+        scrapers: Scrapers à lancer
+        **kwargs: Arguments transmis à `scrape_products_async`
+
+    Returns:
+        Dictionnaire {site: produits}, ou l'exception levée pour ce site
+    """
+    return asyncio.run(scrape_sites_async(scrapers, **kwargs))
+
+
+async def enrich_products_async(scrapers: Dict[str, BaseScraper],
+                                products: Dict[str, Union[List[Dict], Exception]],
+                                workers_per_site: int = DETAILS_WORKERS_PER_SITE) -> Dict[str, Dict]:
+    """Complète les produits avec le détail de leur fiche.
+
+    Les URLs sont dédupliquées (un même produit listé dans plusieurs
+    catégories n'est téléchargé qu'une fois), puis réparties entre
+    `workers_per_site` tâches par site : les sites avancent en parallèle et
+    chacun reste soumis au rate limiting de son hôte.
+
+    Les détails ne remplacent pas les valeurs déjà connues du listing
+    (nom, prix...), ils complètent les champs manquants (description...).
+
+    Args:
+        scrapers: Scrapers par site ({site: scraper})
+        products: Produits par site, tels que renvoyés par `scrape_sites`
+            (les sites en erreur ou sans scraper sont ignorés)
+        workers_per_site: Requêtes de fiches simultanées par site
+
+    Returns:
+        Détails par URL ({url: détails})
+    """
+    urls_by_site: Dict[str, List[str]] = {}
+    seen = set()
+    for site, site_products in products.items():
+        if isinstance(site_products, Exception) or site not in scrapers:
+            continue
+        for product in site_products:
+            if not product.get('url'):
+                continue
+            url = urldefrag(product['url']).url
+            if url not in seen:
+                seen.add(url)
+                urls_by_site.setdefault(site, []).append(url)
+
+    logger.info(f"Enrichissement: {len(seen)} fiches sur {len(urls_by_site)} sites")
+    details: Dict[str, Dict] = {}
+
+    async def worker(scraper: BaseScraper, urls: Iterator[str]):
+        # L'itérateur est partagé par les tâches du site
+        for url in urls:
+            try:
+                result = await scraper.scrape_product_details_async(url)
+            except Exception as e:
+                logger.error(f"Erreur détails {url}: {e}")
+                continue
+            if result:
+                details[url] = result
+
+    workers = []
+    for site, urls in urls_by_site.items():
+        shared = iter(urls)
+        workers += [worker(scrapers[site], shared) for _ in range(workers_per_site)]
+    await asyncio.gather(*workers)
+
+    for site_products in products.values():
+        if isinstance(site_products, Exception):
+            continue
+        for product in site_products:
+            found = details.get(urldefrag(product.get('url') or '').url)
+            for key, value in (found or {}).items():
+                if value is not None and product.get(key) is None:
+                    product[key] = value
+
+    return details
+
+
+def enrich_products(scrapers: Dict[str, BaseScraper],
+                    products: Dict[str, Union[List[Dict], Exception]],
+                    workers_per_site: int = DETAILS_WORKERS_PER_SITE) -> Dict[str, Dict]:
+    """Point d'entrée synchrone de `enrich_products_async`.
+
+    Args:
+        scrapers: Scrapers par site ({site: scraper})
+        products: Produits par site, complétés sur place
+        workers_per_site: Requêtes de fiches simultanées par site
+
+    Returns:
+        Détails par URL ({url: détails})
+    """
+    return asyncio.run(enrich_products_async(scrapers, products, workers_per_site))
@@ -0,0 +1,186 @@
+"""Extraction déclarative des tuiles produits, compilée en XPath lxml.
+
+Chaque scraper décrit ses tuiles par une `ExtractionSpec` (XPath des tuiles,
+puis champ -> XPath + post-traitement). Les XPath sont compilés une seule
+fois à l'import du module du scraper et évalués directement sur l'arbre lxml,
+sans construire d'arbre BeautifulSoup ni évaluer de regex sur les classes.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from lxml import etree, html as lxml_html
+
+_PRICE_PATTERN = re.compile(r'(\d+[,.]?\d*)')
+
+
+def has_class(name: str) -> str:
+    """Prédicat XPath équivalent au sélecteur CSS `.name`.
+
+    Args:
+        name: Nom de classe exact
+
+    Returns:
+        Expression XPath à placer entre crochets
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def class_contains(*fragments: str) -> str:
+    """Prédicat XPath équivalent à `class_=re.compile(r'a|b')` (BeautifulSoup).
+
+    Args:
+        *fragments: Sous-chaînes recherchées dans l'attribut class
+
+    Returns:
+        Expression XPath à placer entre crochets
+    """
+    return ' or '.join(f"contains(@class, '{fragment}')" for fragment in fragments)
+
+
+def normalize_text(text: Optional[str]) -> Optional[str]:
+    """Normalise les espaces d'un texte.
+
+    Args:
+        text: Texte brut
+
+    Returns:
+        Texte normalisé, ou None s'il est vide
+    """
+    if not text:
+        return None
+    return ' '.join(text.split()) or None
+
+
+def parse_price(text: Optional[str]) -> Optional[float]:
+    """Extrait un montant d'un texte de prix (ex: "29,99 €" -> 29.99).
+
+    Args:
+        text: Texte du prix
+
+    Returns:
+        Prix en float ou None
+    """
+    if not text:
+        return None
+    match = _PRICE_PATTERN.search(text.replace(',', '.'))
+    return float(match.group(1)) if match else None
+
+
+# Post-traitements : reçoivent la liste des résultats XPath d'un champ
+
+def first_text(results: Sequence) -> Optional[str]:
+    """Texte du premier résultat (élément ou chaîne)."""
+    if not results:
+        return None
+    result = results[0]
+    return normalize_text(result if isinstance(result, str) else result.text_content())
+
+
+def first_price(results: Sequence) -> Optional[float]:
+    """Prix contenu dans le texte du premier résultat."""
+    return parse_price(first_text(results))
+
+
+def attribute(*names: str) -> Callable[[Sequence], Optional[str]]:
+    """Post-traitement lisant le premier attribut non vide du premier élément.
+
+    Args:
+        *names: Attributs essayés dans l'ordre (ex: 'src', 'data-src')
+
+    Returns:
+        Fonction de post-traitement
+    """
+    def post(results: Sequence) -> Optional[str]:
+        if not results:
+            return None
+        for name in names:
+            value = results[0].get(name)
+            if value:
+                return value
+        return None
+    return post
+
+
+class Field(NamedTuple):
+    """Champ d'une tuile : XPaths essayés dans l'ordre + post-traitement."""
+
+    xpaths: Sequence[str]
+    post: Callable[[Sequence], Any] = first_text
+
+
+def field(*xpaths: str, post: Callable[[Sequence], Any] = first_text) -> Field:
+    """Raccourci de construction d'un `Field`."""
+    return Field(xpaths, post)
+
+
+class ExtractionSpec:
+    """Spécification d'extraction des tuiles d'un site, compilée une fois."""
+
+    def __init__(self, items: Sequence[str], fields: Dict[str, Field]):
+        """Compile la spécification.
+
+        Args:
+            items: XPaths des tuiles produits, par ordre de préférence (le
+                premier qui trouve des tuiles l'emporte)
+            fields: Champs à extraire, évalués relativement à chaque tuile
+        """
+        self.items = [etree.XPath(xpath) for xpath in items]
+        self.fields = [
+            (name, [etree.XPath(xpath) for xpath in spec.xpaths], spec.post)
+            for name, spec in fields.items()
+        ]
+
+    @staticmethod
+    def parse(html: str) -> Optional[etree._Element]:
+        """Parse une page HTML avec lxml.
+
+        Args:
+            html: HTML de la page
+
+        Returns:
+            Racine du document, ou None si la page est vide
+        """
+        try:
+            return lxml_html.fromstring(html)
+        except ValueError:
+            # Chaîne unicode portant une déclaration d'encodage XML
+            return lxml_html.fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            return None
+
+    def find_items(self, root: Optional[etree._Element]) -> List[etree._Element]:
+        """Trouve les tuiles produits d'un document.
+
+        Args:
+            root: Racine du document
+
+        Returns:
+            Tuiles trouvées (vide si aucune)
+        """
+        if root is None:
+            return []
+        for xpath in self.items:
+            items = xpath(root)
+            if items:
+                return items
+        return []
+
+    def extract_item(self, item: etree._Element) -> Dict[str, Any]:
+        """Extrait les champs bruts d'une tuile.
+
+        Args:
+            item: Tuile produit
+
+        Returns:
+            Dictionnaire {champ: valeur post-traitée}
+        """
+        fields = {}
+        for name, xpaths, post in self.fields:
+            results = []
+            for xpath in xpaths:
+                results = xpath(item)
+                if results:
+                    break
+            fields[name] = post(results)
+        return fields
@@ -0,0 +1,253 @@
+"""Récupération hybride des pages : HTTP simple d'abord, navigateur si besoin."""
+
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from lxml import etree, html as lxml_html
+
+from config import FETCH_MODE, FETCH_MODES_PATH, RENDER_WORKERS
+from .rate_limiter import rate_limiter
+
+if TYPE_CHECKING:
+    from .base import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+# Marqueurs des applications rendues côté client (Next.js, Nuxt, React, Angular...)
+SHELL_MARKERS = re.compile(
+    r'id="__next"|__NEXT_DATA__|window\.__NUXT__|__INITIAL_STATE__|data-reactroot'
+    r'|ng-version=|id="(?:root|app)"\s*>\s*</div>|enable javascript|activer javascript',
+    re.IGNORECASE
+)
+
+# En dessous de ce nombre de caractères visibles, une page balisée est une coquille vide
+SHELL_MAX_TEXT = 500
+
+HTTP = 'http'
+BROWSER = 'browser'
+
+
+def url_pattern(url: str) -> str:
+    """Motif d'une URL : hôte et chemin, segments variables remplacés par '*'.
+
+    Les pages d'un même gabarit (listing paginé, fiches produit) partagent
+    un motif, et donc la même décision HTTP / navigateur.
+
+    Args:
+        url: URL de la page
+
+    Returns:
+        Motif (ex: 'www.sephora.fr/p/*' pour '/p/creme-P123456?skuId=1')
+    """
+    parts = urlsplit(url)
+    segments = ['*' if re.search(r'\d', segment) else segment
+                for segment in parts.path.split('/')]
+    return parts.netloc + '/'.join(segments)
+
+
+def visible_text_length(html: str) -> int:
+    """Nombre de caractères visibles du body (scripts et styles exclus)."""
+    try:
+        root = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return 0
+    etree.strip_elements(root, 'script', 'style', 'noscript', 'template', with_tail=False)
+    body = root.find('body')
+    return len(''.join((body if body is not None else root).text_content().split()))
+
+
+def _render_page(page, url: str) -> Tuple[Optional[int], Optional[str], str]:
+    """Charge une page dans le navigateur du pool.
+
+    Returns:
+        Tuple (statut HTTP de la navigation, en-tête Retry-After, DOM rendu)
+    """
+    response = page.goto(url, wait_until='networkidle')
+    if response is None:
+        return None, None, page.content()
+    return response.status, response.headers.get('retry-after'), page.content()
+
+
+class HybridFetcher:
+    """Récupère les pages en HTTP et ne les rend dans un navigateur que si
+    elles sont des coquilles JavaScript vides.
+
+    Une page est une coquille quand elle n'a aucune tuile produit, porte les
+    marqueurs d'un framework client et n'a presque pas de texte. Elle est
+    alors rendue par un `BrowserPool` (Playwright, démarré à la demande).
+    La décision est mémorisée par motif d'URL (`url_pattern`) dans une base
+    SQLite : les pages suivantes du même gabarit vont directement au bon
+    mode, sans nouvelle détection.
+    """
+
+    def __init__(self, db_path: Path = FETCH_MODES_PATH, mode: str = FETCH_MODE,
+                 workers: int = RENDER_WORKERS):
+        """Initialise le fetcher (base et navigateurs ouverts à la demande).
+
+        Args:
+            db_path: Chemin du fichier SQLite des décisions
+            mode: 'hybrid' (escalade vers le navigateur) ou 'http' (jamais)
+            workers: Navigateurs du pool de rendu
+        """
+        self.db_path = Path(db_path)
+        self.mode = mode
+        self.workers = workers
+        self._modes: Optional[Dict[str, str]] = None
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        """Charge les décisions mémorisées (une fois)."""
+        with self._lock:
+            if self._modes is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS fetch_modes (
+                            pattern TEXT PRIMARY KEY,
+                            mode TEXT NOT NULL,
+                            decided_at TIMESTAMP NOT NULL
+                        )
+                    """)
+                    self._modes = dict(conn.execute("SELECT pattern, mode FROM fetch_modes"))
+            return self._modes
+
+    def _remember(self, pattern: str, mode: str):
+        """Mémorise le mode d'un motif d'URL."""
+        with self._lock:
+            if self._modes.get(pattern) == mode:
+                return
+            self._modes[pattern] = mode
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO fetch_modes (pattern, mode, decided_at) VALUES (?, ?, ?)",
+                    (pattern, mode, datetime.now().isoformat())
+                )
+        logger.info(f"Mode {mode} retenu pour {pattern}")
+
+    def http_only(self, url: str) -> bool:
+        """Indique si une page se récupère en HTTP simple, sans détection.
+
+        Vrai en mode 'http' ou si le motif de l'URL a été mémorisé en HTTP :
+        l'appelant peut alors faire la requête lui-même (ex: en asynchrone).
+
+        Args:
+            url: URL de la page
+        """
+        return self.mode != 'hybrid' or self._load().get(url_pattern(url)) == HTTP
+
+    def is_js_shell(self, scraper: 'BaseScraper', html: str) -> bool:
+        """Indique si une page doit être rendue par un navigateur.
+
+        Args:
+            scraper: Scraper du site (fournit l'extraction des tuiles)
+            html: HTML reçu en HTTP
+
+        Returns:
+            True si la page n'a ni tuiles ni texte mais porte des marqueurs
+            de framework client
+        """
+        if not SHELL_MARKERS.search(html):
+            return False
+        if scraper._extract_items(html)[0]:
+            return False
+        return visible_text_length(html) < SHELL_MAX_TEXT
+
+    def _render(self, scraper: 'BaseScraper', url: str) -> Optional[str]:
+        """Rend une page dans le pool de navigateurs.
+
+        La navigation passe par le rate limiter de l'hôte, comme les
+        requêtes HTTP du scraper.
+
+        Returns:
+            DOM rendu, None si le navigateur est indisponible ou si la page
+            répond par une erreur (4xx/5xx)
+        """
+        with self._lock:
+            if self._pool is None:
+                try:
+                    from src.scrapers.pool import BrowserPool
+                except ImportError as e:
+                    logger.warning(f"Rendu navigateur indisponible (Playwright absent) : {e}")
+                    self.mode = HTTP
+                    return None
+                self._pool = BrowserPool(workers=self.workers)
+            pool = self._pool
+
+        host = urlsplit(url).netloc
+        rate_limiter.acquire(host, scraper.request_delay)
+        logger.info(f"Rendu navigateur : {url}")
+        try:
+            status, retry_after, html = pool.submit(scraper.site_name, _render_page, url).result()
+        except Exception as e:
+            logger.error(f"Erreur rendu navigateur {url}: {e}")
+            return None
+
+        if status is not None:
+            rate_limiter.observe(host, status, retry_after)
+            if status >= 400:
+                logger.error(f"Rendu navigateur {url}: HTTP {status}")
+                return None
+        return html
+
+    @staticmethod
+    def _rendered_response(url: str, html: str) -> requests.Response:
+        """Enveloppe un DOM rendu dans une réponse HTTP 200 (sans validateurs)."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = html.encode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        return response
+
+    def fetch(self, scraper: 'BaseScraper', url: str) -> Optional[requests.Response]:
+        """Récupère une page par le mode le moins coûteux qui fonctionne.
+
+        Args:
+            scraper: Scraper du site (requêtes HTTP, rate limiting, cache)
+            url: URL de la page
+
+        Returns:
+            Réponse HTTP (ou DOM rendu enveloppé), None si échec
+        """
+        if self.mode != 'hybrid':
+            return scraper._request_http(url)
+
+        pattern = url_pattern(url)
+        known = self._load().get(pattern)
+
+        response = None
+        if known != BROWSER:
+            response = scraper._request_http(url)
+            if response is None or known == HTTP or response.status_code == 304:
+                return response
+            if not self.is_js_shell(scraper, response.text):
+                self._remember(pattern, HTTP)
+                return response
+            logger.info(f"Page rendue côté client, passage au navigateur : {url}")
+
+        html = self._render(scraper, url)
+        if html is None:
+            return response
+        if known is None and not self.is_js_shell(scraper, html):
+            self._remember(pattern, BROWSER)
+        return self._rendered_response(url, html)
+
+    def close(self):
+        """Ferme les navigateurs du pool de rendu."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.close()
+
+
+# Instance unique partagée par les scrapers
+hybrid_fetcher = HybridFetcher()
@@ -0,0 +1,124 @@
+"""Cache HTTP conditionnel (ETag / Last-Modified) persistant sur disque."""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Mémorise les validateurs HTTP et le résultat extrait de chaque page.
+
+    Au prochain passage, les validateurs sont renvoyés (`If-None-Match`,
+    `If-Modified-Since`) ; si le serveur répond 304, le résultat extrait
+    la dernière fois est réutilisé sans télécharger ni parser la page.
+    """
+
+    def __init__(self, db_path: Path, max_age_days: int = 7):
+        """Initialise le cache.
+
+        Args:
+            db_path: Chemin du fichier SQLite du cache
+            max_age_days: Âge au-delà duquel une entrée n'est plus
+                revalidée (la page est retéléchargée en entier)
+        """
+        self.db_path = Path(db_path)
+        self.max_age = timedelta(days=max_age_days)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    payload TEXT NOT NULL,
+                    stored_at TIMESTAMP NOT NULL
+                )
+            """)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Retourne les en-têtes conditionnels à envoyer pour une URL.
+
+        Args:
+            url: URL de la page
+
+        Returns:
+            En-têtes `If-None-Match` / `If-Modified-Since` (vide si pas
+            d'entrée exploitable)
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, stored_at FROM http_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+
+        if not row:
+            return {}
+
+        etag, last_modified, stored_at = row
+        if datetime.now() - datetime.fromisoformat(stored_at) > self.max_age:
+            return {}
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, url: str) -> Tuple[bool, Any]:
+        """Récupère le résultat extrait mémorisé pour une URL.
+
+        Args:
+            url: URL de la page
+
+        Returns:
+            (trouvé, résultat)
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT payload FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+        if not row:
+            return False, None
+        return True, json.loads(row[0])
+
+    def store(self, url: str, response: requests.Response, result: Any):
+        """Mémorise le résultat extrait d'une réponse si elle est revalidable.
+
+        Args:
+            url: URL de la page
+            response: Réponse HTTP complète (200)
+            result: Résultat extrait, sérialisable en JSON
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO http_cache
+                (url, etag, last_modified, payload, stored_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (url, etag, last_modified, json.dumps(result), datetime.now().isoformat()))
+
+    def clear(self) -> int:
+        """Vide le cache.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            deleted = conn.execute("DELETE FROM http_cache").rowcount
+
+        logger.info(f"Cache HTTP vidé : {deleted} entrées")
+        return deleted
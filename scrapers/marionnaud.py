@@ -5,6 +5,10 @@ import re
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 from .base import BaseScraper
+from .extraction import (
+    ExtractionSpec, attribute, class_contains, field, first_price, normalize_text,
+    parse_price
+)
 
 logger = logging.getLogger(__name__)
 
@@ -12,156 +16,133 @@ logger = logging.getLogger(__name__)
 class MarionnaudScraper(BaseScraper):
     """Scraper pour Marionnaud.fr"""
 
+    EXTRACTION_SPEC = ExtractionSpec(
+        items=[
+            f"//div[{class_contains('product-item', 'product-card')}]",
+            f"//li[{class_contains('product')}]",
+        ],
+        fields={
+            'name': field(
+                ".//*[self::h2 or self::h3 or self::span]"
+                f"[{class_contains('product-name', 'product-title', 'title')}]"
+            ),
+            'title': field(".//a[@title]", post=attribute('title')),
+            'brand': field(
+                f".//*[self::span or self::div][{class_contains('brand', 'marque', 'manufacturer')}]"
+            ),
+            'href': field(".//a[@href]", post=attribute('href')),
+            'data_id': field(
+                ".", post=attribute('data-product-id', 'data-id', 'data-productid')
+            ),
+            'image_url': field(".//img", post=attribute('src', 'data-src', 'data-lazy')),
+            'price': field(
+                f".//*[self::span or self::div][{class_contains('price', 'prix')}]",
+                post=first_price
+            ),
+        }
+    )
+
     def __init__(self):
         super().__init__(
             site_name='marionnaud',
             base_url='https://www.marionnaud.fr'
         )
 
-    def scrape_products(self, category: str = 'nouveautes',
-                       max_pages: int = 3) -> List[Dict]:
-        """Scrape les produits d'une catégorie.
-
-        Args:
-            category: Catégorie à scraper
-            max_pages: Nombre max de pages à scraper
-
-        Returns:
-            Liste de produits
-        """
-        products = []
-        logger.info(f"Scraping Marionnaud - catégorie: {category}")
-
-        # URL de la catégorie
-        category_url = f"{self.base_url}/{category}"
-
-        for page in range(1, max_pages + 1):
-            url = f"{category_url}?page={page}"
-            logger.info(f"Scraping page {page}/{max_pages}: {url}")
-
-            response = self._make_request(url)
-            if not response:
-                logger.warning(f"Échec page {page}")
-                continue
-
-            soup = self._parse_html(response.text)
-            if not soup:
-                continue
+    def _find_product_items(self, soup) -> List:
+        """Trouve les tuiles produits d'une page Marionnaud."""
+        product_items = soup.find_all('div', class_=re.compile(r'product-item|product-card'))
 
-            # Trouver les produits (adapter les sélecteurs)
-            product_items = soup.find_all('div', class_=re.compile(r'product-item|product-card'))
+        if not product_items:
+            # Essayer d'autres sélecteurs
+            product_items = soup.find_all('li', class_=re.compile(r'product'))
 
-            if not product_items:
-                # Essayer d'autres sélecteurs
-                product_items = soup.find_all('li', class_=re.compile(r'product'))
+        return product_items
 
-            if not product_items:
-                logger.info(f"Aucun produit trouvé page {page}")
-                break
-
-            logger.info(f"Trouvé {len(product_items)} produits page {page}")
-
-            for item in product_items:
-                try:
-                    product = self._parse_product_item(item)
-                    if product:
-                        products.append(product)
-                except Exception as e:
-                    logger.error(f"Erreur parsing produit: {e}")
-                    continue
-
-        logger.info(f"Total produits scrapés: {len(products)}")
-        return products
-
-    def _parse_product_item(self, item) -> Optional[Dict]:
-        """Parse un élément produit de la liste.
+    def _extract_item_fields(self, item) -> Dict:
+        """Extrait les champs bruts d'une tuile (moteur BeautifulSoup).
 
         Args:
             item: Élément BeautifulSoup du produit
 
         Returns:
-            Dictionnaire avec les données du produit
+            Mêmes champs que `EXTRACTION_SPEC`
         """
-        try:
-            # Nom du produit
-            name_elem = item.find(['h2', 'h3', 'span'], class_=re.compile(r'product-name|product-title|title'))
-            if not name_elem:
-                name_elem = item.find('a', title=True)
-            if not name_elem:
-                return None
-
-            name = name_elem.get_text(strip=True) if hasattr(name_elem, 'get_text') else name_elem.get('title')
-
-            # Marque
-            brand_elem = item.find(['span', 'div'], class_=re.compile(r'brand|marque|manufacturer'))
-            brand = brand_elem.get_text(strip=True) if brand_elem else None
-
-            # URL
-            link_elem = item.find('a', href=True)
-            product_url = urljoin(self.base_url, link_elem['href']) if link_elem else None
-
-            # ID produit
-            product_id = item.get('data-product-id') or item.get('data-id') or item.get('data-productid')
-            if not product_id and product_url:
-                # Essayer d'extraire de l'URL
-                match = re.search(r'[-_/](\d+)(?:\.html|$)', product_url)
-                if match:
-                    product_id = match.group(1)
-
-            # Image
-            img_elem = item.find('img')
-            image_url = None
-            if img_elem:
-                image_url = img_elem.get('src') or img_elem.get('data-src') or img_elem.get('data-lazy')
-            if image_url and image_url.startswith('//'):
-                image_url = 'https:' + image_url
-
-            # Prix
-            price = None
-            price_elem = item.find(['span', 'div'], class_=re.compile(r'price|prix'))
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                # Extraire le nombre
-                match = re.search(r'(\d+[,.]?\d*)', price_text.replace(',', '.'))
-                if match:
-                    price = float(match.group(1))
-
-            if not product_id:
-                logger.warning(f"Pas d'ID pour: {name}")
-                # Générer un ID basé sur le nom et l'URL
-                product_id = re.sub(r'[^a-z0-9]', '', name.lower())[:50]
+        name_elem = item.find(['h2', 'h3', 'span'],
+                              class_=re.compile(r'product-name|product-title|title'))
+        title_elem = item.find('a', title=True)
+        brand_elem = item.find(['span', 'div'], class_=re.compile(r'brand|marque|manufacturer'))
+        link_elem = item.find('a', href=True)
+        img_elem = item.find('img')
+        price_elem = item.find(['span', 'div'], class_=re.compile(r'price|prix'))
+
+        image_url = None
+        if img_elem:
+            image_url = img_elem.get('src') or img_elem.get('data-src') or img_elem.get('data-lazy')
+
+        return {
+            'name': normalize_text(name_elem.get_text()) if name_elem else None,
+            'title': title_elem['title'] if title_elem else None,
+            'brand': normalize_text(brand_elem.get_text()) if brand_elem else None,
+            'href': link_elem['href'] if link_elem else None,
+            'data_id': (item.get('data-product-id') or item.get('data-id')
+                        or item.get('data-productid')),
+            'image_url': image_url,
+            'price': parse_price(price_elem.get_text()) if price_elem else None,
+        }
+
+    def _build_product(self, fields: Dict) -> Optional[Dict]:
+        """Construit un produit à partir des champs d'une tuile.
 
-            return {
-                'product_id': str(product_id),
-                'name': name,
-                'brand': brand,
-                'url': product_url,
-                'image_url': image_url,
-                'price': price,
-                'category': 'nouveautes'
-            }
+        Args:
+            fields: Champs extraits de la tuile
 
-        except Exception as e:
-            logger.error(f"Erreur parsing produit: {e}")
+        Returns:
+            Dictionnaire avec les données du produit
+        """
+        # Nom du produit (à défaut, attribut title du lien)
+        name = fields['name'] or fields['title']
+        if not name:
             return None
 
-    def scrape_product_details(self, product_url: str) -> Optional[Dict]:
-        """Scrape les détails complets d'un produit.
+        product_url = urljoin(self.base_url, fields['href']) if fields['href'] else None
+
+        # ID produit
+        product_id = fields['data_id']
+        if not product_id and product_url:
+            # Essayer d'extraire de l'URL
+            match = re.search(r'[-_/](\d+)(?:\.html|$)', product_url)
+            if match:
+                product_id = match.group(1)
+
+        image_url = fields['image_url']
+        if image_url and image_url.startswith('//'):
+            image_url = 'https:' + image_url
+
+        if not product_id:
+            logger.warning(f"Pas d'ID pour: {name}")
+            # Générer un ID basé sur le nom et l'URL
+            product_id = re.sub(r'[^a-z0-9]', '', name.lower())[:50]
+
+        return {
+            'product_id': str(product_id),
+            'name': name,
+            'brand': fields['brand'],
+            'url': product_url,
+            'image_url': image_url,
+            'price': fields['price'],
+            'category': 'nouveautes'
+        }
+
+    def _parse_product_details(self, soup, product_url: str) -> Optional[Dict]:
+        """Extrait les détails complets d'une fiche produit.
 
         Args:
+            soup: Fiche produit parsée
             product_url: URL du produit
 
         Returns:
             Dictionnaire avec tous les détails
         """
-        response = self._make_request(product_url)
-        if not response:
-            return None
-
-        soup = self._parse_html(response.text)
-        if not soup:
-            return None
-
         try:
             # Nom
             name_elem = soup.find(['h1', 'h2'], class_=re.compile(r'product-name|title'))
@@ -0,0 +1,175 @@
+"""Rate limiting par hôte (token bucket), partagé par tout le processus."""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from config import (
+    REQUEST_DELAY, RATE_LIMIT_BURST, RATE_LIMIT_HOSTS,
+    RATE_LIMIT_MAX_BACKOFF
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuts HTTP signalant que le serveur nous freine
+THROTTLE_STATUSES = (429, 503)
+
+
+@dataclass
+class _Bucket:
+    """État du token bucket d'un hôte."""
+
+    rate: float  # Jetons par seconde actuellement accordés
+    max_rate: float  # Débit configuré, vers lequel on remonte
+    burst: int
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+    strikes: int = 0  # Réponses 429/503 consécutives
+
+
+class HostRateLimiter:
+    """Token bucket par hôte, thread-safe et utilisable depuis asyncio.
+
+    Chaque hôte dispose de `burst` jetons rechargés au débit configuré.
+    Une réponse 429/503 divise le débit par deux et bloque l'hôte pendant
+    la durée du `Retry-After` (ou un backoff exponentiel à défaut) ; les
+    réponses suivantes réussies remontent progressivement le débit.
+    """
+
+    def __init__(self, delay: float = REQUEST_DELAY, burst: int = RATE_LIMIT_BURST,
+                 hosts: Optional[Dict[str, Dict]] = None,
+                 max_backoff: float = RATE_LIMIT_MAX_BACKOFF):
+        """Initialise le limiteur.
+
+        Args:
+            delay: Délai moyen entre requêtes par défaut (secondes)
+            burst: Nombre de requêtes autorisées d'affilée par défaut
+            hosts: Surcharges par hôte ({hôte: {'delay': ..., 'burst': ...}})
+            max_backoff: Blocage maximal après un 429/503 (secondes)
+        """
+        self.delay = delay
+        self.burst = burst
+        self.hosts = RATE_LIMIT_HOSTS if hosts is None else hosts
+        self.max_backoff = max_backoff
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, now: float, delay: Optional[float] = None) -> _Bucket:
+        """Retourne (en le créant si besoin) le bucket d'un hôte."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            settings = self.hosts.get(host, {})
+            rate = 1 / settings.get('delay', delay or self.delay)
+            burst = settings.get('burst', self.burst)
+            bucket = _Bucket(rate=rate, max_rate=rate, burst=burst,
+                             tokens=burst, updated_at=now)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, host: str, delay: Optional[float] = None) -> float:
+        """Réserve un jeton pour l'hôte.
+
+        Le jeton est consommé immédiatement ; l'appelant doit attendre le
+        délai retourné avant d'envoyer sa requête.
+
+        Args:
+            host: Hôte visé
+            delay: Délai par défaut si l'hôte n'est pas encore connu
+                (ignoré si `RATE_LIMIT_HOSTS` le configure)
+
+        Returns:
+            Temps d'attente en secondes
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, now, delay)
+            # Pendant une pause, updated_at est la fin de la pause : pas de
+            # recharge avant, et les requêtes en attente s'étalent après elle
+            elapsed = max(0.0, now - bucket.updated_at)
+            bucket.tokens = min(bucket.burst, bucket.tokens + elapsed * bucket.rate)
+            bucket.updated_at = max(now, bucket.updated_at)
+            bucket.tokens -= 1
+
+            wait = bucket.updated_at - now
+            if bucket.tokens < 0:
+                wait += -bucket.tokens / bucket.rate
+            return wait
+
+    def acquire(self, host: str, delay: Optional[float] = None):
+        """Attend (bloquant) un jeton pour l'hôte."""
+        time.sleep(self.reserve(host, delay))
+
+    async def acquire_async(self, host: str, delay: Optional[float] = None):
+        """Attend (awaitable) un jeton pour l'hôte."""
+        await asyncio.sleep(self.reserve(host, delay))
+
+    def observe(self, host: str, status_code: int, retry_after: Optional[str] = None):
+        """Ajuste le débit d'un hôte selon la réponse reçue.
+
+        Args:
+            host: Hôte ayant répondu
+            status_code: Statut HTTP
+            retry_after: Valeur brute de l'en-tête `Retry-After` (optionnel)
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, now)
+
+            if status_code in THROTTLE_STATUSES or retry_after:
+                bucket.strikes += 1
+                bucket.rate = max(bucket.rate / 2, 1 / self.max_backoff)
+                # Un seul jeton à la reprise, les suivants au débit réduit
+                bucket.tokens = min(bucket.tokens, 1)
+
+                pause = _parse_retry_after(retry_after)
+                if pause is None:
+                    pause = 2 ** bucket.strikes
+                pause = min(pause, self.max_backoff)
+                bucket.blocked_until = max(bucket.blocked_until, now + pause)
+                bucket.updated_at = max(bucket.updated_at, bucket.blocked_until)
+
+                logger.warning(
+                    f"{host} ralentit (HTTP {status_code}) : pause {pause:.0f}s, "
+                    f"1 requête / {1 / bucket.rate:.1f}s"
+                )
+
+            elif status_code < 400 and bucket.rate < bucket.max_rate:
+                # Remontée progressive vers le débit configuré
+                bucket.strikes = 0
+                bucket.rate = min(bucket.max_rate, bucket.rate * 1.25)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convertit un en-tête `Retry-After` (secondes ou date HTTP) en secondes.
+
+    Args:
+        value: Valeur de l'en-tête
+
+    Returns:
+        Durée en secondes ou None si absente/illisible
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Instance unique partagée par tous les scrapers et threads
+rate_limiter = HostRateLimiter()
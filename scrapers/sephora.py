@@ -5,6 +5,10 @@ import re
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 from .base import BaseScraper
+from .extraction import (
+    ExtractionSpec, attribute, class_contains, field, first_price, normalize_text,
+    parse_price
+)
 
 logger = logging.getLogger(__name__)
 
@@ -12,148 +16,107 @@ logger = logging.getLogger(__name__)
 class SephoraScraper(BaseScraper):
     """Scraper pour Sephora.fr"""
 
+    EXTRACTION_SPEC = ExtractionSpec(
+        items=[f"//div[{class_contains('ProductTile')}]"],
+        fields={
+            'name': field(f".//span[{class_contains('ProductName')}]"),
+            'brand': field(f".//span[{class_contains('BrandName')}]"),
+            'href': field(".//a[@href]", post=attribute('href')),
+            'data_id': field(".", post=attribute('data-product-id', 'data-id')),
+            'image_url': field(".//img[@src]", post=attribute('src')),
+            'price': field(f".//span[{class_contains('Price')}]", post=first_price),
+        }
+    )
+
     def __init__(self):
         super().__init__(
             site_name='sephora',
             base_url='https://www.sephora.fr'
         )
 
-    def scrape_products(self, category: str = 'nouveautes',
-                       max_pages: int = 3) -> List[Dict]:
-        """Scrape les produits d'une catégorie.
+    def _category_url(self, category: str) -> str:
+        """Construit l'URL d'une catégorie Sephora."""
+        return f"{self.base_url}/{category}/"
+
+    def _find_product_items(self, soup) -> List:
+        """Trouve les tuiles produits d'une page Sephora."""
+        return soup.find_all('div', class_=re.compile(r'ProductTile'))
+
+    def _extract_item_fields(self, item) -> Dict:
+        """Extrait les champs bruts d'une tuile (moteur BeautifulSoup).
 
         Args:
-            category: Catégorie à scraper (nouveautes, maquillage, soins, etc.)
-            max_pages: Nombre max de pages à scraper
+            item: Élément BeautifulSoup du produit
 
         Returns:
-            Liste de produits
+            Mêmes champs que `EXTRACTION_SPEC`
         """
-        products = []
-        logger.info(f"Scraping Sephora - catégorie: {category}")
-
-        # URL de la catégorie
-        category_url = f"{self.base_url}/{category}/"
-
-        for page in range(1, max_pages + 1):
-            url = f"{category_url}?page={page}"
-            logger.info(f"Scraping page {page}/{max_pages}: {url}")
-
-            response = self._make_request(url)
-            if not response:
-                logger.warning(f"Échec page {page}")
-                continue
-
-            soup = self._parse_html(response.text)
-            if not soup:
-                continue
-
-            # Trouver les produits
-            product_items = soup.find_all('div', class_=re.compile(r'ProductTile'))
-
-            if not product_items:
-                logger.info(f"Aucun produit trouvé page {page}")
-                break
-
-            logger.info(f"Trouvé {len(product_items)} produits page {page}")
-
-            for item in product_items:
-                try:
-                    product = self._parse_product_item(item)
-                    if product:
-                        products.append(product)
-                except Exception as e:
-                    logger.error(f"Erreur parsing produit: {e}")
-                    continue
-
-        logger.info(f"Total produits scrapés: {len(products)}")
-        return products
-
-    def _parse_product_item(self, item) -> Optional[Dict]:
-        """Parse un élément produit de la liste.
+        name_elem = item.find('span', class_=re.compile(r'ProductName'))
+        brand_elem = item.find('span', class_=re.compile(r'BrandName'))
+        link_elem = item.find('a', href=True)
+        img_elem = item.find('img', src=True)
+        price_elem = item.find('span', class_=re.compile(r'Price'))
+
+        return {
+            'name': normalize_text(name_elem.get_text()) if name_elem else None,
+            'brand': normalize_text(brand_elem.get_text()) if brand_elem else None,
+            'href': link_elem['href'] if link_elem else None,
+            'data_id': item.get('data-product-id') or item.get('data-id'),
+            'image_url': img_elem['src'] if img_elem else None,
+            'price': parse_price(price_elem.get_text()) if price_elem else None,
+        }
+
+    def _build_product(self, fields: Dict) -> Optional[Dict]:
+        """Construit un produit à partir des champs d'une tuile.
 
         Args:
-            item: Élément BeautifulSoup du produit
+            fields: Champs extraits de la tuile
 
         Returns:
             Dictionnaire avec les données du produit
         """
-        try:
-            # Nom du produit
-            name_elem = item.find('span', class_=re.compile(r'ProductName'))
-            if not name_elem:
-                return None
-            name = name_elem.get_text(strip=True)
-
-            # Marque
-            brand_elem = item.find('span', class_=re.compile(r'BrandName'))
-            brand = brand_elem.get_text(strip=True) if brand_elem else None
-
-            # URL
-            link_elem = item.find('a', href=True)
-            product_url = urljoin(self.base_url, link_elem['href']) if link_elem else None
-
-            # ID produit (extrait de l'URL)
-            product_id = None
-            if product_url:
-                # Format: /p/nom-produit-12345
-                match = re.search(r'/p/[^/]+-(\d+)', product_url)
-                if match:
-                    product_id = match.group(1)
-
-            if not product_id:
-                # Essayer de trouver un data-id
-                product_id = item.get('data-product-id') or item.get('data-id')
-
-            # Image
-            img_elem = item.find('img', src=True)
-            image_url = img_elem['src'] if img_elem else None
+        name = fields['name']
+        if not name:
+            return None
 
-            # Prix
-            price = None
-            price_elem = item.find('span', class_=re.compile(r'Price'))
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                # Extraire le nombre
-                match = re.search(r'(\d+[,.]?\d*)', price_text.replace(',', '.'))
-                if match:
-                    price = float(match.group(1))
+        product_url = urljoin(self.base_url, fields['href']) if fields['href'] else None
 
-            if not product_id:
-                logger.warning(f"Pas d'ID pour: {name}")
-                return None
+        # ID produit (extrait de l'URL)
+        product_id = None
+        if product_url:
+            # Format: /p/nom-produit-12345
+            match = re.search(r'/p/[^/]+-(\d+)', product_url)
+            if match:
+                product_id = match.group(1)
 
-            return {
-                'product_id': str(product_id),
-                'name': name,
-                'brand': brand,
-                'url': product_url,
-                'image_url': image_url,
-                'price': price,
-                'category': 'nouveautes'  # À adapter selon le scraping
-            }
+        if not product_id:
+            # Essayer de trouver un data-id
+            product_id = fields['data_id']
 
-        except Exception as e:
-            logger.error(f"Erreur parsing produit: {e}")
+        if not product_id:
+            logger.warning(f"Pas d'ID pour: {name}")
             return None
 
-    def scrape_product_details(self, product_url: str) -> Optional[Dict]:
-        """Scrape les détails complets d'un produit.
+        return {
+            'product_id': str(product_id),
+            'name': name,
+            'brand': fields['brand'],
+            'url': product_url,
+            'image_url': fields['image_url'],
+            'price': fields['price'],
+            'category': 'nouveautes'  # À adapter selon le scraping
+        }
+
+    def _parse_product_details(self, soup, product_url: str) -> Optional[Dict]:
+        """Extrait les détails complets d'une fiche produit.
 
         Args:
+            soup: Fiche produit parsée
             product_url: URL du produit
 
         Returns:
             Dictionnaire avec tous les détails
         """
-        response = self._make_request(product_url)
-        if not response:
-            return None
-
-        soup = self._parse_html(response.text)
-        if not soup:
-            return None
-
         try:
             # Nom
             name_elem = soup.find('h1', class_=re.compile(r'ProductName'))
@@ -0,0 +1,237 @@
+"""Scraper des catalogues Shopify (products.json) des marques."""
+
+import asyncio
+import codecs
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from config import SITES, PREFETCH_PAGES, INCREMENTAL_STOP_PAGES
+from .base import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+# Taille des blocs lus sur le flux HTTP
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Décode au fil de l'eau les éléments d'un tableau JSON.
+
+    Seul l'élément en cours de lecture est gardé en mémoire : chaque élément
+    est rendu dès que ses octets sont arrivés, sans attendre la fin du
+    document.
+
+    Args:
+        chunks: Blocs d'octets du document (ex: `response.iter_content()`)
+        key: Clé du tableau dans l'objet racine (ex: 'products')
+
+    Yields:
+        Éléments du tableau, décodés
+
+    Raises:
+        ValueError: Document tronqué ou tableau introuvable
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    chunks = iter(chunks)
+    buffer = ''
+    pos = None
+
+    def read() -> bool:
+        nonlocal buffer
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        buffer += text.decode(chunk)
+        return True
+
+    # Début du tableau
+    while pos is None:
+        match = start.search(buffer)
+        if match:
+            pos = match.end()
+        elif not read():
+            raise ValueError(f"Tableau JSON '{key}' introuvable")
+
+    while True:
+        # Séparateurs entre éléments
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos == len(buffer):
+            buffer, pos = '', 0
+            if not read():
+                raise ValueError("Document JSON tronqué")
+            continue
+        if buffer[pos] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Élément incomplet : attendre la suite du flux
+            buffer, pos = buffer[pos:], 0
+            if not read():
+                raise ValueError("Document JSON tronqué")
+            continue
+
+        if not isinstance(item, (dict, list)):
+            # Un nombre n'est complet qu'une fois suivi d'un séparateur
+            rest = buffer[end:].lstrip()
+            if (not rest or rest[0] not in ',]') and read():
+                continue
+
+        yield item
+        pos = end
+
+
+class ShopifyScraper(BaseScraper):
+    """Scraper des catalogues Shopify déclarés dans config.SITES
+    (`'method': 'shopify_json'`).
+
+    Les pages de `products.json` (250 produits max) sont parcourues jusqu'à
+    la dernière et décodées en flux. Chaque variante (contenance, format)
+    donne un produit avec son propre prix.
+    """
+
+    def __init__(self, site_name: str):
+        """Initialise le scraper depuis la configuration du site.
+
+        Args:
+            site_name: Clé du site dans config.SITES
+        """
+        site = SITES[site_name]
+        if site['method'] != 'shopify_json':
+            raise ValueError(f"{site_name} n'est pas un catalogue Shopify")
+
+        super().__init__(site_name=site_name, base_url=site['base_url'])
+        self.catalog_url = site['catalog_url']
+        self.brand = site['brand']
+        self.currency = site['currency']
+        self.page_size = int(dict(parse_qsl(urlsplit(self.catalog_url).query)).get('limit', 30))
+
+    def _page_url(self, category_url: str, page: int) -> str:
+        """Ajoute le numéro de page aux paramètres existants (`?limit=250`)."""
+        parts = urlsplit(category_url)
+        query = dict(parse_qsl(parts.query))
+        query['page'] = page
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def _parse_catalog_product(self, product: Dict) -> List[Dict]:
+        """Convertit un produit Shopify en un produit par variante.
+
+        Args:
+            product: Produit tel que renvoyé par products.json
+
+        Returns:
+            Produits (un par variante ayant un prix)
+        """
+        images = product.get('images') or []
+        image_url = images[0].get('src') if images else None
+        url = f"{self.base_url}/products/{product['handle']}"
+        variants = product.get('variants') or []
+
+        products = []
+        for variant in variants:
+            if variant.get('price') in (None, ''):
+                continue
+
+            name = product['title']
+            product_id = str(product['id'])
+            if len(variants) > 1:
+                product_id = f"{product_id}-{variant['id']}"
+                if variant.get('title') and variant['title'] != 'Default Title':
+                    name = f"{name} - {variant['title']}"
+
+            products.append({
+                'product_id': product_id,
+                'name': name,
+                'brand': product.get('vendor') or self.brand,
+                'url': f"{url}?variant={variant['id']}" if len(variants) > 1 else url,
+                'image_url': image_url,
+                'price': float(variant['price']),
+                'currency': self.currency,
+                'category': product.get('product_type') or None
+            })
+
+        return products
+
+    def iter_catalog(self, max_pages: Optional[int] = None) -> Iterator[Dict]:
+        """Parcourt le catalogue page par page, produit par produit.
+
+        Args:
+            max_pages: Nombre max de pages (None = tout le catalogue)
+
+        Yields:
+            Produits (un par variante)
+        """
+        page = 1
+        while max_pages is None or page <= max_pages:
+            url = self._page_url(self.catalog_url, page)
+            logger.info(f"Catalogue {self.site_name} page {page}: {url}")
+
+            response = self._make_request(url, stream=True, headers={'Accept': 'application/json'})
+            if not response:
+                logger.warning(f"Échec page {page}")
+                return
+
+            count = 0
+            try:
+                with response:
+                    for product in iter_json_array(response.iter_content(CHUNK_SIZE), 'products'):
+                        count += 1
+                        try:
+                            yield from self._parse_catalog_product(product)
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.error(f"Erreur parsing produit {product.get('id')}: {e}")
+            except (ValueError, requests.exceptions.RequestException) as e:
+                # Flux tronqué ou interrompu : on garde les produits déjà lus
+                logger.error(f"Catalogue {self.site_name} interrompu page {page} "
+                             f"après {count} produits: {e}")
+                return
+
+            logger.info(f"Trouvé {count} produits page {page}")
+            if count < self.page_size:
+                return
+            page += 1
+
+    def scrape_products(self, category: Optional[str] = None,
+                        max_pages: Optional[int] = None,
+                        brands: Optional[List[str]] = None,
+                        prefetch: int = PREFETCH_PAGES,
+                        known: Optional[Set[Tuple[str, str, Optional[float]]]] = None,
+                        stop_after: int = INCREMENTAL_STOP_PAGES) -> List[Dict]:
+        """Scrape le catalogue complet.
+
+        Args:
+            category: Ignoré (la collection est fixée par catalog_url)
+            max_pages: Nombre max de pages de 250 produits (None = tout)
+            brands: Liste de marques à filtrer (optionnel)
+            prefetch: Ignoré (les pages sont lues en flux)
+            known: Ignoré : le catalogue n'est pas trié par nouveauté, il
+                est toujours lu en entier
+            stop_after: Ignoré
+
+        Returns:
+            Liste de produits
+        """
+        logger.info(f"Scraping catalogue {self.site_name}")
+        products = self._filter_brands(list(self.iter_catalog(max_pages)), brands)
+        logger.info(f"Total {self.site_name}: {len(products)} produits")
+        return products
+
+    async def scrape_products_async(self, category: Optional[str] = None,
+                                    max_pages: Optional[int] = None,
+                                    brands: Optional[List[str]] = None,
+                                    prefetch: int = PREFETCH_PAGES,
+                                    known: Optional[Set[Tuple[str, str, Optional[float]]]] = None,
+                                    stop_after: int = INCREMENTAL_STOP_PAGES) -> List[Dict]:
+        """Version awaitable de `scrape_products` (lecture du flux dans un thread)."""
+        return await asyncio.to_thread(
+            self.scrape_products, category, max_pages, brands, prefetch, known, stop_after
+        )
@@ -1,10 +1,12 @@
 """Module d'analyse comparative des produits et marques."""
 
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 from statistics import mean, median
-from config import TARGET_BRANDS, BRAND_ALIASES
+from config import TARGET_BRANDS
+from brands import brand_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,11 @@ class ProductAnalyzer:
             products: Liste de produits à analyser
         """
         self.products = products
+        # Marque normalisée de chaque produit (même ordre que products)
+        self._product_brands = [self._normalize_brand(p.get('brand', '')) for p in products]
         self.brands_data = self._group_by_brand()
+        self._brand_stats: Dict[Optional[str], Dict] = {}
+        self._build_price_index()
 
     def _normalize_brand(self, brand: str) -> str:
         """Normalise le nom d'une marque.
@@ -33,15 +39,7 @@ class ProductAnalyzer:
         if not brand:
             return 'unknown'
 
-        brand_lower = brand.lower().strip()
-
-        # Chercher dans les alias
-        for canonical, aliases in BRAND_ALIASES.items():
-            for alias in aliases:
-                if alias.lower() in brand_lower or brand_lower in alias.lower():
-                    return canonical
-
-        return brand_lower
+        return brand_matcher.resolve(brand) or brand.lower().strip()
 
     def _group_by_brand(self) -> Dict[str, List[Dict]]:
         """Groupe les produits par marque.
@@ -51,12 +49,60 @@ class ProductAnalyzer:
         """
         grouped = defaultdict(list)
 
-        for product in self.products:
-            brand = self._normalize_brand(product.get('brand', ''))
+        for product, brand in zip(self.products, self._product_brands):
             grouped[brand].append(product)
 
         return dict(grouped)
 
+    def _build_price_index(self):
+        """Indexe les produits avec prix, triés par prix.
+
+        Les ex aequo restent dans l'ordre de `products` (tri stable). Les
+        prix triés de chaque marque permettent de compter ses produits dans
+        une fourchette par bisection.
+        """
+        positions = sorted(
+            (i for i, p in enumerate(self.products) if p.get('current_price')),
+            key=lambda i: self.products[i]['current_price']
+        )
+        self._sorted_positions = positions
+        self._sorted_prices = [self.products[i]['current_price'] for i in positions]
+
+        self._brand_prices: Dict[str, List[float]] = defaultdict(list)
+        for i, price in zip(positions, self._sorted_prices):
+            self._brand_prices[self._product_brands[i]].append(price)
+
+        self._global_avg = mean(self._sorted_prices) if self._sorted_prices else 0
+
+    @staticmethod
+    def _price_window(prices: List[float], ref_price: float,
+                      price_tolerance: float) -> Tuple[int, int]:
+        """Bornes [lo, hi) des prix triés tels que |prix - ref| <= tolérance.
+
+        Args:
+            prices: Prix triés
+            ref_price: Prix de référence
+            price_tolerance: Tolérance de prix en €
+
+        Returns:
+            Tuple (lo, hi)
+        """
+        lo = bisect_left(prices, ref_price - price_tolerance)
+        hi = bisect_right(prices, ref_price + price_tolerance)
+
+        # Les bornes calculées peuvent différer de |prix - ref| <= tolérance
+        # d'un arrondi flottant : on les ajuste sur ce critère exact
+        while lo > 0 and abs(prices[lo - 1] - ref_price) <= price_tolerance:
+            lo -= 1
+        while lo < hi and abs(prices[lo] - ref_price) > price_tolerance:
+            lo += 1
+        while hi < len(prices) and abs(prices[hi] - ref_price) <= price_tolerance:
+            hi += 1
+        while hi > lo and abs(prices[hi - 1] - ref_price) > price_tolerance:
+            hi -= 1
+
+        return lo, hi
+
     def get_brand_stats(self, brand: str = None) -> Dict:
         """Calcule les statistiques pour une marque.
 
@@ -66,12 +112,25 @@ class ProductAnalyzer:
         Returns:
             Dictionnaire de statistiques
         """
-        if brand:
-            brand_normalized = self._normalize_brand(brand)
-            products = self.brands_data.get(brand_normalized, [])
-        else:
-            products = self.products
+        key = self._normalize_brand(brand) if brand else None
+        if key not in self._brand_stats:
+            self._brand_stats[key] = self._compute_stats(
+                self.brands_data.get(key, []) if key else self.products
+            )
+
+        # Copie : les appelants peuvent enrichir le dictionnaire
+        return dict(self._brand_stats[key])
 
+    @staticmethod
+    def _compute_stats(products: List[Dict]) -> Dict:
+        """Calcule les statistiques de prix d'une liste de produits.
+
+        Args:
+            products: Produits de la marque (ou tous)
+
+        Returns:
+            Dictionnaire de statistiques
+        """
         if not products:
             return {
                 'count': 0,
@@ -128,30 +187,80 @@ class ProductAnalyzer:
         ref_price = product['current_price']
         ref_brand = self._normalize_brand(product.get('brand', ''))
 
-        competitors = []
-
-        for p in self.products:
-            if not p.get('current_price'):
-                continue
+        # Produits dans la fourchette de prix, hors même marque, dans
+        # l'ordre de la liste
+        lo, hi = self._price_window(self._sorted_prices, ref_price, price_tolerance)
+        positions = sorted(i for i in self._sorted_positions[lo:hi]
+                           if self._product_brands[i] != ref_brand)
 
-            # Même marque = ignorer
-            if self._normalize_brand(p.get('brand', '')) == ref_brand:
-                continue
+        competitors = []
 
-            # Dans la fourchette de prix
+        for i in positions:
+            p = self.products[i]
             price_diff = abs(p['current_price'] - ref_price)
-            if price_diff <= price_tolerance:
-                competitors.append({
-                    **p,
-                    'price_diff': round(price_diff, 2),
-                    'price_diff_percent': round((price_diff / ref_price) * 100, 1)
-                })
+            competitors.append({
+                **p,
+                'price_diff': round(price_diff, 2),
+                'price_diff_percent': round((price_diff / ref_price) * 100, 1)
+            })
 
         # Trier par différence de prix
         competitors.sort(key=lambda x: x['price_diff'])
 
         return competitors
 
+    def _competitors_summary(self, position: int,
+                             price_tolerance: float) -> Tuple[int, Optional[Dict]]:
+        """Compte les concurrents d'un produit et trouve le plus proche en prix,
+        sans construire la liste de `find_price_competitors`.
+
+        Args:
+            position: Position du produit dans `products`
+            price_tolerance: Tolérance de prix en €
+
+        Returns:
+            Tuple (nombre de concurrents, concurrent le plus proche ou None)
+        """
+        product = self.products[position]
+        if not product.get('current_price'):
+            return 0, None
+
+        ref_price = product['current_price']
+        ref_brand = self._product_brands[position]
+        prices = self._sorted_prices
+
+        # Fourchette globale moins les produits de la même marque
+        lo, hi = self._price_window(prices, ref_price, price_tolerance)
+        brand_lo, brand_hi = self._price_window(self._brand_prices[ref_brand], ref_price,
+                                                price_tolerance)
+        count = (hi - lo) - (brand_hi - brand_lo)
+        if not count:
+            return 0, None
+
+        # Plus proche d'une autre marque de chaque côté du prix de référence ;
+        # à écart égal, le premier dans l'ordre de la liste (comme le tri stable)
+        candidates = []
+        start = bisect_left(prices, ref_price, lo, hi)
+        for k in range(start, hi):
+            i = self._sorted_positions[k]
+            if self._product_brands[i] != ref_brand:
+                candidates.append(i)
+                break
+        found = None
+        for k in range(start - 1, lo - 1, -1):
+            # En descendant, continuer parmi les ex aequo du premier trouvé
+            if found is not None and prices[k] != prices[found]:
+                break
+            if self._product_brands[self._sorted_positions[k]] != ref_brand:
+                found = k
+        if found is not None:
+            candidates.append(self._sorted_positions[found])
+
+        nearest = min(candidates, key=lambda i: (
+            round(abs(self.products[i]['current_price'] - ref_price), 2), i
+        ))
+        return count, self.products[nearest]
+
     def get_price_positioning(self, brand: str) -> str:
         """Détermine le positionnement prix d'une marque.
 
@@ -167,9 +276,8 @@ class ProductAnalyzer:
         if avg_price == 0:
             return 'unknown'
 
-        # Calculer la moyenne globale
-        all_prices = [p['current_price'] for p in self.products if p.get('current_price')]
-        global_avg = mean(all_prices) if all_prices else 0
+        # Moyenne globale (calculée une fois à l'initialisation)
+        global_avg = self._global_avg
 
         if avg_price > global_avg * 1.5:
             return 'premium'
@@ -265,12 +373,12 @@ class ProductAnalyzer:
         """
         enhanced = []
 
-        for product in self.products:
+        for position, product in enumerate(self.products):
             # Copier le produit original
             enhanced_product = product.copy()
 
-            # Ajouter stats de la marque
-            brand = self._normalize_brand(product.get('brand', ''))
+            # Ajouter stats de la marque (calculées une fois par marque)
+            brand = self._product_brands[position]
             brand_stats = self.get_brand_stats(brand)
 
             enhanced_product['brand_avg_price'] = brand_stats['avg_price']
@@ -285,11 +393,11 @@ class ProductAnalyzer:
                 )
 
             # Trouver concurrents directs
-            competitors = self.find_price_competitors(product, price_tolerance=5.0)
-            if competitors:
-                enhanced_product['competitors_count'] = len(competitors)
-                enhanced_product['cheapest_competitor'] = competitors[0]['name'] if competitors else None
-                enhanced_product['cheapest_competitor_price'] = competitors[0]['current_price'] if competitors else None
+            count, nearest = self._competitors_summary(position, price_tolerance=5.0)
+            if count:
+                enhanced_product['competitors_count'] = count
+                enhanced_product['cheapest_competitor'] = nearest['name']
+                enhanced_product['cheapest_competitor_price'] = nearest['current_price']
 
             enhanced.append(enhanced_product)
 
@@ -56,6 +56,25 @@ class Database:
 
         logger.info(f"Base de données initialisée : {self.db_path}")
 
+    # Upsert d'un produit (la nouvelle version remplace l'ancienne)
+    _UPSERT = """
+        INSERT OR REPLACE INTO products
+        (id, source, product_id, name, brand, price, currency,
+         url, image_url, category, is_new, scraped_at, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _product_row(product: Product) -> tuple:
+        """Paramètres de `_UPSERT` pour un produit."""
+        data = product.to_dict()
+        return (
+            data['id'], data['source'], data['product_id'],
+            data['name'], data['brand'], data['price'], data['currency'],
+            data['url'], data['image_url'], data['category'],
+            1 if data['is_new'] else 0, data['scraped_at'], data['metadata']
+        )
+
     def add_product(self, product: Product) -> bool:
         """Ajoute un produit à la base de données.
 
@@ -67,21 +86,7 @@ class Database:
         """
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                data = product.to_dict()
-
-                cursor.execute("""
-                    INSERT OR REPLACE INTO products
-                    (id, source, product_id, name, brand, price, currency,
-                     url, image_url, category, is_new, scraped_at, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data['id'], data['source'], data['product_id'],
-                    data['name'], data['brand'], data['price'], data['currency'],
-                    data['url'], data['image_url'], data['category'],
-                    1 if data['is_new'] else 0, data['scraped_at'], data['metadata']
-                ))
-
+                conn.execute(self._UPSERT, self._product_row(product))
                 conn.commit()
                 logger.debug(f"Produit ajouté : {product.brand} - {product.name[:30]}")
                 return True
@@ -91,7 +96,7 @@ class Database:
             return False
 
     def add_products(self, products: List[Product]) -> int:
-        """Ajoute plusieurs produits en batch.
+        """Ajoute plusieurs produits en batch (une seule transaction).
 
         Args:
             products: Liste de produits
@@ -99,10 +104,15 @@ class Database:
         Returns:
             Nombre de produits ajoutés
         """
-        count = 0
-        for product in products:
-            if self.add_product(product):
-                count += 1
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(self._UPSERT, [self._product_row(p) for p in products])
+                conn.commit()
+            count = len(products)
+
+        except Exception as e:
+            logger.error(f"Erreur lors de l'ajout des produits : {e}")
+            count = 0
 
         logger.info(f"{count}/{len(products)} produits ajoutés à la base")
         return count
@@ -1,12 +1,16 @@
 """Scrapers pour les différents sites."""
 
+from typing import Optional
+
 from .base import BaseScraper
+from .pool import BrowserPool
 from .sephora import SephoraScraper
 from .nocibe import NocibeScraper
 from .marionnaud import MarionnaudScraper
 
 __all__ = [
     "BaseScraper",
+    "BrowserPool",
     "SephoraScraper",
     "NocibeScraper",
     "MarionnaudScraper",
@@ -20,12 +24,14 @@ SCRAPERS = {
 }
 
 
-def get_scraper(source: str, headless: bool = True) -> BaseScraper:
+def get_scraper(source: str, headless: bool = True,
+                pool: Optional[BrowserPool] = None) -> BaseScraper:
     """Factory pour obtenir le scraper approprié.
 
     Args:
         source: Source du scraper (sephora, nocibe, marionnaud)
         headless: Mode headless
+        pool: Pool de navigateurs partagé (optionnel)
 
     Returns:
         Instance du scraper
@@ -37,4 +43,4 @@ def get_scraper(source: str, headless: bool = True) -> BaseScraper:
     if not scraper_class:
         raise ValueError(f"Source invalide : {source}. Sources disponibles : {list(SCRAPERS.keys())}")
 
-    return scraper_class(headless=headless)
+    return scraper_class(headless=headless, pool=pool)
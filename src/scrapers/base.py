@@ -1,38 +1,87 @@
 """Classe de base abstraite pour tous les scrapers."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import re
 import time
-from playwright.sync_api import sync_playwright, Browser, Page
+from urllib.parse import urlsplit
+from playwright.sync_api import sync_playwright, Browser, Page, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from ..database import Product
-from ..utils import setup_logger, PLAYWRIGHT_CONFIG, SCRAPER_CONFIG
+from ..utils import setup_logger, PLAYWRIGHT_CONFIG, SCRAPER_CONFIG, CATEGORIES
+from .pool import BrowserPool
+from .routing import ResourceBlocker
+from scrapers.rate_limiter import rate_limiter
 
 logger = setup_logger("scrapers")
 
+# Sérialise en un seul appel les champs de toutes les tuiles du listing
+BULK_EXTRACT_SCRIPT = """
+({selector, fields, badge}) => Array.from(document.querySelectorAll(selector), tile => {
+    const data = {};
+    for (const [name, [css, attribute]] of Object.entries(fields)) {
+        const element = tile.querySelector(css);
+        data[name] = !element ? null
+            : attribute ? element.getAttribute(attribute)
+            : element.innerText.trim();
+    }
+    data.is_new = badge ? tile.innerText.toLowerCase().includes(badge.toLowerCase()) : false;
+    return data;
+})
+"""
+
 
 class BaseScraper(ABC):
     """Classe abstraite de base pour tous les scrapers."""
 
-    def __init__(self, headless: bool = True):
+    # Sélecteur CSS d'une tuile produit dans les listings
+    TILE_SELECTOR = ''
+    # Champs d'une tuile : {champ: (sélecteur CSS, attribut ou None pour le texte)}
+    TILE_FIELDS: Dict[str, Tuple[str, Optional[str]]] = {}
+    # Texte du badge des nouveautés
+    NEW_BADGE = 'Nouveau'
+    # Clés possibles de chaque champ dans les produits JSON des API de listing
+    API_FIELDS: Dict[str, Tuple[str, ...]] = {
+        'product_id': ('productId', 'product_id', 'sku', 'id'),
+        'name': ('name', 'productName', 'displayName', 'title'),
+        'brand': ('brand', 'brandName', 'manufacturer'),
+        'price': ('price', 'salePrice', 'currentPrice', 'finalPrice'),
+        'url': ('url', 'productUrl', 'link', 'href'),
+        'image_url': ('imageUrl', 'image_url', 'image', 'thumbnail'),
+    }
+
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
         """Initialise le scraper.
 
         Args:
             headless: Exécuter en mode headless
+            pool: Pool de navigateurs partagé (sinon, un navigateur dédié est
+                démarré à l'entrée du context manager)
         """
         self.headless = headless
+        self.pool = pool
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self.blocker: Optional[ResourceBlocker] = None
+        self.max_scrolls: Optional[int] = PLAYWRIGHT_CONFIG['max_scrolls']
+        self.bulk_extraction: bool = PLAYWRIGHT_CONFIG['bulk_extraction']
+        self.api_interception: bool = PLAYWRIGHT_CONFIG['api_interception']
+        # Le site répond-il par une API JSON ? (None = pas encore observé)
+        self.api_available: Optional[bool] = None
         self.products: List[Product] = []
 
     def __enter__(self):
         """Context manager entry."""
-        self._setup_browser()
+        if not self.pool:
+            self._setup_browser()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self._cleanup()
+        if not self.pool:
+            self._cleanup()
 
     def _setup_browser(self):
         """Configure et démarre le navigateur Playwright."""
@@ -47,6 +96,8 @@ class BaseScraper(ABC):
             user_agent=SCRAPER_CONFIG['user_agent'],
             viewport={'width': 1920, 'height': 1080}
         )
+        self.blocker = ResourceBlocker(self.source)
+        self.blocker.attach(context)
 
         self.page = context.new_page()
         self.page.set_default_timeout(PLAYWRIGHT_CONFIG['timeout'])
@@ -55,15 +106,305 @@ class BaseScraper(ABC):
 
     def _cleanup(self):
         """Nettoie les ressources."""
+        if self.blocker:
+            self.blocker.report()
         if self.browser:
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
         logger.info("Navigateur fermé")
 
-    def _rate_limit(self):
-        """Applique un délai entre les requêtes."""
-        time.sleep(SCRAPER_CONFIG['rate_limit_delay'])
+    def _goto(self, page: Page, url: str, **kwargs) -> Optional[Response]:
+        """Navigue vers une URL au rythme de l'hôte.
+
+        Le rate limiter par hôte est partagé par les workers du pool (et par
+        les scrapers HTTP) : une navigation attend son jeton, et une réponse
+        429/503 ralentit les suivantes.
+
+        Args:
+            page: Page Playwright à utiliser
+            url: URL à charger
+            **kwargs: Arguments de `page.goto`
+
+        Returns:
+            Réponse de la navigation (None si aucune)
+        """
+        host = urlsplit(url).netloc
+        rate_limiter.acquire(host, SCRAPER_CONFIG['rate_limit_delay'])
+        response = page.goto(url, **kwargs)
+        if response is not None:
+            rate_limiter.observe(host, response.status, response.headers.get('retry-after'))
+        return response
+
+    def _load_tiles(self, page: Page, target: Optional[int] = None) -> int:
+        """Scrolle le listing tant que de nouvelles tuiles apparaissent.
+
+        Après chaque scroll, attend que le nombre de tuiles augmente ; le
+        chargement s'arrête dès qu'aucune tuile n'arrive pendant
+        `scroll_idle_timeout`, que `target` tuiles sont chargées ou que
+        `self.max_scrolls` est atteint (None = listing complet).
+
+        Args:
+            page: Page Playwright du listing
+            target: Nombre de tuiles suffisant (ex: limite de produits)
+
+        Returns:
+            Nombre de tuiles chargées
+        """
+        count = page.locator(self.TILE_SELECTOR).count()
+        scrolls = 0
+        while ((target is None or count < target)
+               and (self.max_scrolls is None or scrolls < self.max_scrolls)):
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            scrolls += 1
+            try:
+                page.wait_for_function(
+                    "([selector, count]) => document.querySelectorAll(selector).length > count",
+                    arg=[self.TILE_SELECTOR, count],
+                    timeout=PLAYWRIGHT_CONFIG['scroll_idle_timeout']
+                )
+            except PlaywrightTimeoutError:
+                break
+            count = page.locator(self.TILE_SELECTOR).count()
+
+        logger.debug(f"{count} tuiles chargées en {scrolls} scroll(s)")
+        return count
+
+    def _api_pattern(self) -> Optional[re.Pattern]:
+        """Motif des URLs d'API de listing du site (None si désactivé)."""
+        pattern = PLAYWRIGHT_CONFIG['api_patterns'].get(self.source)
+        if not (self.api_interception and pattern):
+            return None
+        return re.compile(pattern)
+
+    def _is_api_response(self, response: Response) -> bool:
+        """Vrai si la réponse est un JSON d'API de listing du site."""
+        pattern = self._api_pattern()
+        return (pattern is not None and pattern.search(response.url) is not None
+                and 'json' in response.headers.get('content-type', ''))
+
+    @contextmanager
+    def _capture_api(self, page: Page) -> Iterator[List[Response]]:
+        """Collecte les réponses JSON des API de listing pendant le bloc.
+
+        Args:
+            page: Page Playwright du listing
+
+        Yields:
+            Liste (remplie au fil de l'eau) des réponses correspondant au
+            motif du site
+        """
+        responses: List[Response] = []
+        if not self._api_pattern():
+            yield responses
+            return
+
+        def on_response(response: Response):
+            if self._is_api_response(response):
+                responses.append(response)
+
+        # La page du pool est réutilisée : l'écouteur est retiré en sortie
+        page.on('response', on_response)
+        try:
+            yield responses
+        finally:
+            page.remove_listener('response', on_response)
+
+    def _api_products(self, page: Page, responses: List[Response],
+                      limit: Optional[int] = None) -> List[Product]:
+        """Produits lus dans les réponses JSON interceptées.
+
+        Attend la première réponse si aucune n'est encore arrivée (sauf si
+        le listing précédent n'a rien donné : `api_available`), puis
+        scrolle pour déclencher les pages suivantes tant que `limit` n'est
+        pas atteint, comme `_load_tiles` pour le DOM.
+
+        Args:
+            page: Page Playwright du listing (après navigation)
+            responses: Réponses collectées par `_capture_api`
+            limit: Nombre maximum de produits
+
+        Returns:
+            Liste de produits (vide si aucune réponse exploitable : il faut
+            alors extraire le DOM)
+        """
+        if not self._api_pattern():
+            return []
+
+        products: List[Product] = []
+        seen = set()
+        parsed = 0
+
+        def wait_response(timeout: int) -> bool:
+            count = len(responses)
+            try:
+                page.wait_for_event('response', predicate=self._is_api_response, timeout=timeout)
+            except PlaywrightTimeoutError:
+                return len(responses) > count
+            return True
+
+        def parse_new():
+            nonlocal parsed
+            for response in responses[parsed:]:
+                try:
+                    payload = response.json()
+                except Exception as e:
+                    logger.debug(f"Réponse JSON illisible {response.url} : {e}")
+                    continue
+                for product in self._products_from_payload(payload):
+                    if product.product_id not in seen:
+                        seen.add(product.product_id)
+                        products.append(product)
+            parsed = len(responses)
+
+        # Attendre la première réponse sauf si un listing précédent n'en a
+        # reçu aucune : les réponses déjà capturées restent exploitées
+        if not responses and self.api_available is not False:
+            wait_response(PLAYWRIGHT_CONFIG['api_wait_timeout'])
+        parse_new()
+        self.api_available = bool(products)
+
+        scrolls = 0
+        while (products and (not limit or len(products) < limit)
+               and (self.max_scrolls is None or scrolls < self.max_scrolls)):
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            scrolls += 1
+            if not wait_response(PLAYWRIGHT_CONFIG['scroll_idle_timeout']):
+                break
+            parse_new()
+
+        if products:
+            logger.info(f"{len(products)} produits lus dans {len(responses)} réponse(s) API")
+        return products[:limit] if limit else products
+
+    def _products_from_payload(self, payload: Any) -> List[Product]:
+        """Cherche les produits dans un document JSON d'API de listing.
+
+        Parcourt le document et retient chaque objet qui a un nom et un prix
+        (clés de API_FIELDS). Les sous-classes peuvent surcharger cette
+        méthode pour une API dont la structure est connue.
+
+        Args:
+            payload: Document JSON décodé
+
+        Returns:
+            Liste de produits
+        """
+        products = []
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+            elif isinstance(node, dict):
+                fields = {field: self._api_value(node, keys) for field, keys in self.API_FIELDS.items()}
+                if fields['name'] and fields['price'] is not None:
+                    product = self._product_from_tile(fields)
+                    if product:
+                        products.append(product)
+                        continue
+                stack.extend(reversed(list(node.values())))
+        return products
+
+    @staticmethod
+    def _api_value(node: Dict, keys: Tuple[str, ...]) -> Optional[str]:
+        """Première valeur scalaire trouvée parmi `keys` (déplie {'name'|'value'|'url': ...})."""
+        for key in keys:
+            value = node.get(key)
+            if isinstance(value, dict):
+                value = next((value[k] for k in ('name', 'value', 'amount', 'url', 'src')
+                              if k in value), None)
+            elif isinstance(value, list):
+                value = value[0] if value and not isinstance(value[0], (dict, list)) else None
+            if value not in (None, '') and not isinstance(value, (dict, list, bool)):
+                return str(value)
+        return None
+
+    def _extract_listing(self, page: Page, limit: Optional[int] = None) -> List[Product]:
+        """Extrait les produits des tuiles chargées.
+
+        En mode bulk, un seul script exécuté dans la page renvoie les champs
+        (TILE_FIELDS) de toutes les tuiles ; sinon chaque tuile est lue
+        élément par élément avec `_extract_product_data`.
+
+        Args:
+            page: Page Playwright du listing
+            limit: Nombre maximum de produits
+
+        Returns:
+            Liste de produits
+        """
+        products = []
+
+        if self.bulk_extraction and self.TILE_FIELDS:
+            tiles = page.evaluate(BULK_EXTRACT_SCRIPT, {
+                'selector': self.TILE_SELECTOR,
+                'fields': self.TILE_FIELDS,
+                'badge': self.NEW_BADGE,
+            })
+            logger.info(f"Trouvé {len(tiles)} produits sur la page")
+
+            for fields in tiles:
+                if limit and len(products) >= limit:
+                    break
+                product = self._product_from_tile(fields)
+                if product:
+                    products.append(product)
+            return products
+
+        product_elements = page.locator(self.TILE_SELECTOR).all()
+        logger.info(f"Trouvé {len(product_elements)} produits sur la page")
+
+        for element in product_elements:
+            if limit and len(products) >= limit:
+                break
+
+            product = self._extract_product_data(element)
+            if product:
+                products.append(product)
+
+        return products
+
+    def _product_from_tile(self, fields: Dict) -> Optional[Product]:
+        """Construit un produit depuis les champs sérialisés d'une tuile.
+
+        Args:
+            fields: Champs de la tuile (name, brand, price, url, image_url,
+                is_new et, pour les API, product_id)
+
+        Returns:
+            Instance de Product ou None si la tuile n'a pas de nom
+        """
+        name = (fields.get('name') or '').strip()
+        if not name:
+            return None
+
+        price_text = fields.get('price') or "0"
+        price_match = re.search(r'(\d+[,.]?\d*)', price_text.replace(',', '.'))
+        price = float(price_match.group(1)) if price_match else 0.0
+
+        url = fields.get('url') or ""
+        if url and not url.startswith('http'):
+            url = f"{self.base_url}{url}"
+
+        return Product(
+            source=self.source,
+            product_id=fields.get('product_id') or self._extract_product_id(url),
+            name=name,
+            brand=fields.get('brand') or "Inconnu",
+            price=price,
+            currency="EUR",
+            url=url,
+            image_url=fields.get('image_url') or "",
+            is_new=bool(fields.get('is_new')),
+            metadata={
+                "raw_price": price_text
+            }
+        )
+
+    def _extract_product_id(self, url: str) -> str:
+        """Extrait l'ID du produit depuis l'URL (défaut: dernier segment)."""
+        return url.split('/')[-1][:50]
 
     def _retry_on_failure(self, func, *args, **kwargs):
         """Réessaye une fonction en cas d'échec.
@@ -89,6 +430,77 @@ class BaseScraper(ABC):
                     logger.error(f"Échec après {max_retries} tentatives")
                     return None
 
+    def _listing(self, url: str, limit: Optional[int] = None) -> List[Product]:
+        """Scrape une page de listing, sur une page du pool s'il y en a un.
+
+        Args:
+            url: URL du listing
+            limit: Nombre maximum de produits
+
+        Returns:
+            Produits du listing (aussi ajoutés à `self.products`)
+        """
+        if self.pool:
+            products = self.pool.submit(self.source, self._scrape_listing, url, limit).result()
+        else:
+            products = self._scrape_listing(self.page, url, limit)
+
+        self.products.extend(products)
+        return products
+
+    def scrape_categories(self, categories: Optional[List[str]] = None,
+                          limit: Optional[int] = None) -> List[Product]:
+        """Scrape plusieurs catégories, en parallèle si un pool est fourni.
+
+        Args:
+            categories: Catégories à scraper (défaut: CATEGORIES)
+            limit: Nombre maximum de produits par catégorie
+
+        Returns:
+            Liste de produits scrapés
+        """
+        categories = categories or CATEGORIES
+        urls = [self._category_url(category) for category in categories]
+
+        if self.pool:
+            results = self.pool.map(self.source, self._scrape_listing, urls, limit)
+        else:
+            results = [self._scrape_listing(self.page, url, limit) for url in urls]
+
+        for category, products in zip(categories, results):
+            for product in products or []:
+                product.category = product.category or category
+                self.products.append(product)
+
+        logger.info(f"✓ {len(self.products)} produits sur {len(categories)} catégories")
+        return self.products
+
+    @abstractmethod
+    def _category_url(self, category: str) -> str:
+        """Construit l'URL d'une catégorie.
+
+        Args:
+            category: Catégorie (ex: soins-visage)
+
+        Returns:
+            URL du listing
+        """
+        pass
+
+    @abstractmethod
+    def _scrape_listing(self, page: Page, url: str, limit: Optional[int] = None) -> List[Product]:
+        """Scrape une page de listing avec une page Playwright donnée.
+
+        Args:
+            page: Page Playwright à utiliser
+            url: URL du listing
+            limit: Nombre maximum de produits
+
+        Returns:
+            Liste de produits
+        """
+        pass
+
     @abstractmethod
     def scrape_products(self, limit: Optional[int] = None, new_only: bool = False) -> List[Product]:
         """Scrape les produits du site.
@@ -3,6 +3,7 @@
 from typing import List, Optional
 
 from .base import BaseScraper
+from .pool import BrowserPool
 from ..database import Product
 from ..utils import setup_logger, BASE_URLS
 
@@ -12,8 +13,8 @@ logger = setup_logger("marionnaud_scraper")
 class MarionnaudScraper(BaseScraper):
     """Scraper pour Marionnaud (structure à adapter)."""
 
-    def __init__(self, headless: bool = True):
-        super().__init__(headless)
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
+        super().__init__(headless, pool)
         self.base_url = BASE_URLS['marionnaud']
         self.source = "marionnaud"
 
@@ -36,6 +37,26 @@ class MarionnaudScraper(BaseScraper):
 
         return self.products
 
+    def _category_url(self, category: str) -> str:
+        """Construit l'URL d'une catégorie Marionnaud."""
+        return f"{self.base_url}/{category}"
+
+    def _scrape_listing(self, page, url: str, limit: Optional[int] = None) -> List[Product]:
+        """Scrape une page de listing Marionnaud.
+
+        Note: Implementation à compléter selon la structure du site.
+
+        Args:
+            page: Page Playwright à utiliser
+            url: URL du listing
+            limit: Nombre maximum de produits
+
+        Returns:
+            Liste de produits (vide pour l'instant)
+        """
+        logger.warning(f"Listing Marionnaud non implémenté : {url}")
+        return []
+
     def _extract_product_data(self, element) -> Optional[Product]:
         """Extrait les données d'un produit Marionnaud.
 
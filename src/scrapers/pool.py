@@ -0,0 +1,170 @@
+"""Pool de navigateurs Chromium partagé par les scrapers Playwright."""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List
+
+from playwright.sync_api import sync_playwright, BrowserContext, Page
+
+from ..utils import setup_logger, PLAYWRIGHT_CONFIG, SCRAPER_CONFIG
+from .routing import ResourceBlocker
+
+logger = setup_logger("browser_pool")
+
+
+class BrowserPool:
+    """Pool de workers Playwright, chacun avec son propre Chromium.
+
+    L'API sync de Playwright lie chaque objet (navigateur, contexte, page)
+    au thread qui l'a créé : chaque worker est donc un thread qui démarre
+    son Chromium une seule fois, puis exécute les tâches qu'on lui confie.
+    Dans un worker, chaque site a son propre contexte (cookies, consentement)
+    et sa page, réutilisés d'une catégorie à l'autre.
+
+    Exemple:
+        with BrowserPool(workers=3) as pool:
+            with get_scraper('sephora', pool=pool) as scraper:
+                products = scraper.scrape_categories(['maquillage', 'parfum'])
+    """
+
+    def __init__(self, workers: int = PLAYWRIGHT_CONFIG['pool_workers'],
+                 headless: bool = True):
+        """Initialise le pool (les navigateurs démarrent à la première tâche).
+
+        Args:
+            workers: Nombre de navigateurs Chromium (pages simultanées)
+            headless: Exécuter en mode headless
+        """
+        self.workers = workers
+        self.headless = headless
+        self._tasks: queue.Queue = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.blockers: Dict[str, ResourceBlocker] = {}
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def _start(self):
+        """Démarre les workers s'ils ne tournent pas encore."""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"browser-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        """Boucle d'un worker : un Chromium, un contexte et une page par site."""
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=PLAYWRIGHT_CONFIG['slow_mo']
+            )
+        except Exception as e:
+            logger.error(f"Démarrage du navigateur impossible : {e}")
+            playwright.stop()
+            # Sans navigateur, les tâches reçues échouent au lieu de bloquer
+            while (task := self._tasks.get()) is not None:
+                if task[0].set_running_or_notify_cancel():
+                    task[0].set_exception(e)
+            return
+
+        logger.info(f"Navigateur prêt ({threading.current_thread().name})")
+
+        contexts: Dict[str, BrowserContext] = {}
+        pages: Dict[str, Page] = {}
+        try:
+            while (task := self._tasks.get()) is not None:
+                future, site, func, args = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if site not in contexts:
+                        contexts[site] = self._new_context(browser, site)
+                    if site not in pages or pages[site].is_closed():
+                        pages[site] = contexts[site].new_page()
+                        pages[site].set_default_timeout(PLAYWRIGHT_CONFIG['timeout'])
+                    future.set_result(func(pages[site], *args))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            for context in contexts.values():
+                context.close()
+            browser.close()
+            playwright.stop()
+            logger.info(f"Navigateur fermé ({threading.current_thread().name})")
+
+    def _new_context(self, browser, site: str) -> BrowserContext:
+        """Crée un contexte de navigation isolé pour un site."""
+        context = browser.new_context(
+            user_agent=SCRAPER_CONFIG['user_agent'],
+            viewport={'width': 1920, 'height': 1080}
+        )
+        self.blocker(site).attach(context)
+        return context
+
+    def blocker(self, site: str) -> ResourceBlocker:
+        """Politique de blocage d'un site, partagée par tous les workers."""
+        with self._lock:
+            if site not in self.blockers:
+                self.blockers[site] = ResourceBlocker(site)
+            return self.blockers[site]
+
+    def submit(self, site: str, func: Callable[..., Any], *args) -> Future:
+        """Confie une tâche au premier worker libre.
+
+        Args:
+            site: Site visité (choisit le contexte du worker)
+            func: Fonction appelée avec une page du site puis `args`
+            *args: Arguments de la fonction
+
+        Returns:
+            Future du résultat
+        """
+        self._start()
+        future: Future = Future()
+        self._tasks.put((future, site, func, args))
+        return future
+
+    def map(self, site: str, func: Callable[..., Any], items: Iterable,
+            *args) -> List[Any]:
+        """Exécute `func(page, item, *args)` pour chaque élément, en parallèle.
+
+        Args:
+            site: Site visité
+            func: Fonction appelée avec une page du site, l'élément puis `args`
+            items: Éléments à traiter (ex: URLs de catégories)
+            *args: Arguments supplémentaires
+
+        Returns:
+            Résultats dans l'ordre des éléments (None pour une tâche en échec)
+        """
+        futures = [self.submit(site, func, item, *args) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Erreur tâche {site} : {e}")
+                results.append(None)
+        return results
+
+    def close(self):
+        """Arrête les workers et ferme leurs navigateurs."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._tasks.put(None)
+        for thread in threads:
+            thread.join()
+        for blocker in self.blockers.values():
+            blocker.report()
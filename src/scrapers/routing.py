@@ -0,0 +1,131 @@
+"""Blocage des ressources inutiles au scraping (images, polices, traqueurs)."""
+
+import threading
+from collections import Counter
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from ..utils import setup_logger, PLAYWRIGHT_CONFIG
+
+logger = setup_logger("routing")
+
+# Taille moyenne estimée d'une ressource bloquée, par type (octets).
+# Une requête annulée n'a pas de réponse : les octets économisés sont estimés.
+ESTIMATED_SIZES: Dict[str, int] = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "stylesheet": 20_000,
+    "script": 25_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+}
+DEFAULT_ESTIMATED_SIZE = 5_000
+
+
+def blocking_policy(site: str) -> Dict:
+    """Politique de blocage d'un site.
+
+    Args:
+        site: Site visité (clé de PLAYWRIGHT_CONFIG['blocking']['sites'])
+
+    Returns:
+        Politique effective ({'enabled', 'resource_types', 'domains'}),
+        les valeurs du site remplaçant les valeurs par défaut
+    """
+    config = PLAYWRIGHT_CONFIG['blocking']
+    policy = {
+        'enabled': config['enabled'],
+        'resource_types': config['resource_types'],
+        'domains': config['domains'],
+    }
+    policy.update(config['sites'].get(site, {}))
+    return policy
+
+
+class ResourceBlocker:
+    """Politique de routage d'un contexte Playwright.
+
+    Annule les requêtes dont le type de ressource (image, police...) ou le
+    domaine (analytics, publicité) est bloqué pour le site, et compte les
+    requêtes et octets économisés. Une instance peut être attachée à
+    plusieurs contextes (un par worker du pool).
+    """
+
+    def __init__(self, site: str, policy: Optional[Dict] = None):
+        """Initialise la politique.
+
+        Args:
+            site: Site visité
+            policy: Politique explicite (défaut: `blocking_policy(site)`)
+        """
+        policy = policy or blocking_policy(site)
+        self.site = site
+        self.enabled = policy['enabled']
+        self.resource_types = frozenset(policy['resource_types'])
+        self.domains = tuple(domain.lower().lstrip('.') for domain in policy['domains'])
+        self.requests = 0
+        self.blocked: Counter = Counter()
+        self.saved_bytes = 0
+        self._lock = threading.Lock()
+
+    def attach(self, context: BrowserContext):
+        """Installe la politique sur un contexte de navigation."""
+        if self.enabled:
+            context.route("**/*", self._handle)
+
+    def _is_tracker(self, url: str) -> bool:
+        """Vrai si l'URL appartient à un domaine bloqué (ou sous-domaine)."""
+        host = (urlsplit(url).hostname or '').lower()
+        return any(host == domain or host.endswith('.' + domain) for domain in self.domains)
+
+    def _handle(self, route: Route):
+        """Annule ou laisse passer une requête."""
+        request = route.request
+        resource_type = request.resource_type
+
+        if resource_type in self.resource_types:
+            reason = resource_type
+        elif self._is_tracker(request.url):
+            reason = 'tracker'
+        else:
+            reason = None
+
+        with self._lock:
+            self.requests += 1
+            if reason:
+                self.blocked[reason] += 1
+                self.saved_bytes += ESTIMATED_SIZES.get(resource_type, DEFAULT_ESTIMATED_SIZE)
+
+        if reason:
+            route.abort('blockedbyclient')
+        else:
+            route.continue_()
+
+    def stats(self) -> Dict:
+        """Statistiques de la session.
+
+        Returns:
+            Dictionnaire {'requests', 'blocked', 'saved_bytes', 'by_reason'}
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'blocked': sum(self.blocked.values()),
+                'saved_bytes': self.saved_bytes,
+                'by_reason': dict(self.blocked),
+            }
+
+    def report(self):
+        """Journalise les requêtes et octets économisés."""
+        if not self.enabled:
+            return
+        stats = self.stats()
+        details = ', '.join(f"{reason}: {count}" for reason, count in
+                            sorted(stats['by_reason'].items())) or 'aucune'
+        logger.info(
+            f"{self.site} : {stats['blocked']}/{stats['requests']} requêtes bloquées "
+            f"(~{stats['saved_bytes'] / 1_000_000:.1f} Mo économisés ; {details})"
+        )
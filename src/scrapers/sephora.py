@@ -4,6 +4,7 @@ from typing import List, Optional
 import re
 
 from .base import BaseScraper
+from .pool import BrowserPool
 from ..database import Product
 from ..utils import setup_logger, BASE_URLS
 
@@ -13,8 +14,17 @@ logger = setup_logger("sephora_scraper")
 class SephoraScraper(BaseScraper):
     """Scraper spécialisé pour Sephora France."""
 
-    def __init__(self, headless: bool = True):
-        super().__init__(headless)
+    TILE_SELECTOR = '[data-comp="ProductTile"]'
+    TILE_FIELDS = {
+        'name': ('[data-comp="ProductName"]', None),
+        'brand': ('[data-comp="BrandName"]', None),
+        'price': ('[data-comp="Price"]', None),
+        'url': ('a', 'href'),
+        'image_url': ('img', 'src'),
+    }
+
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
+        super().__init__(headless, pool)
         self.base_url = BASE_URLS['sephora']
         self.source = "sephora"
 
@@ -34,50 +44,57 @@ class SephoraScraper(BaseScraper):
             url = f"{self.base_url}/recherche?q=*"  # Tous les produits
 
         logger.info(f"Scraping Sephora : {url}")
+        self._listing(url, limit)
+        return self.products
 
-        try:
-            self.page.goto(url, wait_until='domcontentloaded')
-            self.page.wait_for_selector('[data-comp="ProductTile"]', timeout=10000)
+    def _category_url(self, category: str) -> str:
+        """Construit l'URL d'une catégorie Sephora."""
+        return f"{self.base_url}/{category}/"
+
+    def _scrape_listing(self, page, url: str, limit: Optional[int] = None) -> List[Product]:
+        """Scrape une page de listing Sephora.
+
+        Args:
+            page: Page Playwright à utiliser
+            url: URL du listing
+            limit: Nombre maximum de produits
 
-            # Accepter les cookies si nécessaire
-            try:
-                cookie_btn = self.page.locator('button:has-text("Accepter")')
-                if cookie_btn.is_visible(timeout=2000):
-                    cookie_btn.click()
-            except:
-                pass
+        Returns:
+            Liste de produits
+        """
+        logger.info(f"Listing Sephora : {url}")
 
-            # Scroll pour charger plus de produits
-            self._scroll_page(3)
+        products = []
+        try:
+            with self._capture_api(page) as responses:
+                self._goto(page, url, wait_until='domcontentloaded')
+                # Produits lus directement dans les réponses de l'API de listing
+                products = self._api_products(page, responses, limit)
 
-            # Récupérer tous les produits
-            product_elements = self.page.locator('[data-comp="ProductTile"]').all()
-            logger.info(f"Trouvé {len(product_elements)} produits sur la page")
+            # Sinon, extraction depuis le DOM
+            if not products:
+                page.wait_for_selector(self.TILE_SELECTOR, timeout=10000)
 
-            count = 0
-            for element in product_elements:
-                if limit and count >= limit:
-                    break
+                # Accepter les cookies si nécessaire
+                try:
+                    cookie_btn = page.locator('button:has-text("Accepter")')
+                    if cookie_btn.is_visible(timeout=2000):
+                        cookie_btn.click()
+                except:
+                    pass
 
-                product = self._extract_product_data(element)
-                if product:
-                    self.products.append(product)
-                    count += 1
+                # Scroll pour charger plus de produits
+                self._load_tiles(page, limit)
 
-                self._rate_limit()
+                # Récupérer les produits
+                products = self._extract_listing(page, limit)
 
-            logger.info(f"✓ {len(self.products)} produits scrapés depuis Sephora")
+            logger.info(f"✓ {len(products)} produits scrapés depuis Sephora")
 
         except Exception as e:
             logger.error(f"Erreur lors du scraping Sephora : {e}")
 
-        return self.products
-
-    def _scroll_page(self, times: int = 3):
-        """Scroll la page pour charger plus de produits."""
-        for _ in range(times):
-            self.page.evaluate("window.scrollBy(0, window.innerHeight)")
-            self.page.wait_for_timeout(1000)
+        return products
 
     def _extract_product_data(self, element) -> Optional[Product]:
         """Extrait les données d'un produit Sephora.
@@ -19,15 +19,51 @@ DATABASE_PATH = DATA_DIR / "products.db"
 # Configuration Playwright
 PLAYWRIGHT_CONFIG: Dict[str, Any] = {
     "headless": True,
-    "slow_mo": 100,  # Délai en ms entre actions (éviter détection bot)
+    "slow_mo": 0,  # Délai en ms entre actions (le rythme par hôte est donné par rate_limit_delay à chaque navigation)
     "timeout": 30000,  # 30 secondes
+    "scroll_idle_timeout": 2000,  # ms sans nouvelle tuile avant d'arrêter le scroll
+    "max_scrolls": 10,  # Scrolls max par listing (None = listing complet)
+    "bulk_extraction": True,  # Tuiles extraites en un seul page.evaluate (sinon élément par élément)
+    # Interception des réponses JSON des API de listing (repli sur le DOM
+    # si aucune réponse ne correspond au motif du site)
+    "api_interception": True,
+    "api_wait_timeout": 5000,  # ms d'attente de la première réponse JSON
+    "api_patterns": {
+        "sephora": r"/api/.*(search|catalog|products?)\b",
+        "nocibe": r"/api/.*(search|catalog|products?)\b",
+    },
+    "pool_workers": 3,  # Navigateurs Chromium du pool partagé (BrowserPool)
+    # Ressources annulées avant chargement (seuls le texte et les attributs
+    # src sont lus). Les valeurs de "sites" remplacent celles par défaut.
+    "blocking": {
+        "enabled": True,
+        "resource_types": ["image", "media", "font"],
+        "domains": [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "googlesyndication.com",
+            "facebook.net",
+            "hotjar.com",
+            "criteo.com",
+            "criteo.net",
+            "contentsquare.net",
+            "tiktok.com",
+            "bat.bing.com",
+        ],
+        "sites": {
+            "sephora": {},
+            "nocibe": {},
+            "marionnaud": {},
+        },
+    },
 }
 
 # Configuration scraping
 SCRAPER_CONFIG: Dict[str, Any] = {
     "max_retries": 3,
     "retry_delay": 2,  # secondes
-    "rate_limit_delay": 1,  # secondes entre chaque requête
+    "rate_limit_delay": 1,  # secondes entre deux navigations sur un même hôte
     "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
 }
 
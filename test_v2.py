@@ -210,6 +210,165 @@ def test_exporters():
     print("\n✅ Exporters : OK\n")
 
 
+def test_database_migration():
+    """Test de la migration de l'ancien schéma des prix (un relevé par ligne)."""
+    print("\n🗄️  Test Migration base de données")
+    print("-" * 50)
+
+    import sqlite3
+    from tempfile import mkdtemp
+    from database import Database
+
+    temp_dir = Path(mkdtemp())
+    db_path = temp_dir / 'legacy.db'
+
+    # Ancien schéma, tel que créé par populate_db.py
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE products (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            site TEXT NOT NULL,
+            product_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            brand TEXT,
+            category TEXT,
+            url TEXT,
+            image_url TEXT,
+            first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(site, product_id)
+        );
+        CREATE TABLE prices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            product_id INTEGER NOT NULL,
+            price REAL NOT NULL,
+            currency TEXT DEFAULT 'EUR',
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (product_id) REFERENCES products (id)
+        );
+        CREATE INDEX idx_prices_product ON prices(product_id, timestamp);
+    """)
+    conn.executemany(
+        "INSERT INTO products (id, site, product_id, name, brand) VALUES (?, ?, ?, ?, ?)",
+        [(1, 'sephora', 'a', 'Crème', 'Dermalogica'),
+         (2, 'lookfantastic', 'b', 'Sérum', 'Murad'),
+         (3, 'nocibe', 'c', 'Lotion', 'Nuxe')],
+    )
+    conn.executemany(
+        "INSERT INTO prices (product_id, price, currency, timestamp) VALUES (?, ?, ?, ?)",
+        [(1, 10.0, 'EUR', '2024-01-01 10:00:00'),
+         (2, 20.0, 'EUR', '2024-01-01 10:00:00'),
+         (1, 10.0, 'EUR', '2024-01-02 10:00:00'),
+         (2, 25.0, 'USD', '2024-01-02 10:00:00'),
+         (1, 12.0, 'EUR', '2024-01-03 10:00:00'),
+         (1, 12.0, 'EUR', '2024-01-04 10:00:00'),
+         (1, 10.0, 'EUR', '2024-01-05 10:00:00')],
+    )
+    conn.commit()
+    conn.close()
+
+    # Deux ouvertures : la seconde ne doit rien modifier
+    for _ in range(2):
+        Database(db_path).close()
+
+        conn = sqlite3.connect(db_path)
+        runs = conn.execute("""
+            SELECT product_id, price, currency, valid_from, last_seen
+            FROM prices ORDER BY product_id, valid_from
+        """).fetchall()
+        current = conn.execute("""
+            SELECT id, current_price, current_currency, price_updated_at
+            FROM products ORDER BY id
+        """).fetchall()
+        changes = conn.execute("""
+            SELECT product_id, old_price, new_price, percent, detected_at
+            FROM price_changes ORDER BY detected_at, id
+        """).fetchall()
+        conn.close()
+
+        assert runs == [
+            (1, 10.0, 'EUR', '2024-01-01 10:00:00', '2024-01-02 10:00:00'),
+            (1, 12.0, 'EUR', '2024-01-03 10:00:00', '2024-01-04 10:00:00'),
+            (1, 10.0, 'EUR', '2024-01-05 10:00:00', '2024-01-05 10:00:00'),
+            (2, 20.0, 'EUR', '2024-01-01 10:00:00', '2024-01-01 10:00:00'),
+            (2, 25.0, 'USD', '2024-01-02 10:00:00', '2024-01-02 10:00:00'),
+        ], f"Plages de prix inattendues : {runs}"
+        assert current == [
+            (1, 10.0, 'EUR', '2024-01-05 10:00:00'),
+            (2, 25.0, 'USD', '2024-01-02 10:00:00'),
+            (3, None, None, None),
+        ], f"Prix courants inattendus : {current}"
+        # Le changement de devise du produit 2 n'est pas une variation de prix
+        assert changes == [
+            (1, 10.0, 12.0, 20.0, '2024-01-03 10:00:00'),
+            (1, 12.0, 10.0, -16.67, '2024-01-05 10:00:00'),
+        ], f"Changements de prix inattendus : {changes}"
+
+    print(f"✓ 7 relevés compactés en {len(runs)} plages")
+    print("✓ Prix courant rempli depuis l'historique")
+    print(f"✓ {len(changes)} changements de prix reconstruits")
+    print("✓ Réouverture sans effet")
+
+    # Nettoyage
+    import shutil
+    shutil.rmtree(temp_dir)
+
+    print("\n✅ Migration : OK\n")
+
+
+def test_rate_limiter():
+    """Test du limiteur de débit par hôte."""
+    print("\n⏱️  Test Rate limiter")
+    print("-" * 50)
+
+    from scrapers.rate_limiter import HostRateLimiter
+
+    limiter = HostRateLimiter(delay=2, burst=3)
+    waits = [limiter.reserve('example.com') for _ in range(4)]
+    assert waits[:3] == [0, 0, 0], "Les 3 premières requêtes passent en rafale"
+    assert abs(waits[3] - 2) < 0.1, "La 4e requête attend le délai configuré"
+    print("✓ Rafale puis délai configuré")
+
+    # Après un 429, l'hôte est bloqué puis les requêtes sont espacées
+    # au débit réduit de moitié, sans nouvelle rafale
+    limiter.observe('example.com', 429, '30')
+    waits = [limiter.reserve('example.com') for _ in range(4)]
+    assert waits[0] >= 30, "Pas de requête avant la fin du Retry-After"
+    gaps = [b - a for a, b in zip(waits, waits[1:])]
+    assert all(abs(gap - 4) < 0.1 for gap in gaps), f"Requêtes mal espacées : {waits}"
+    print("✓ Pause Retry-After puis débit réduit")
+
+    assert limiter.reserve('other.com') == 0, "Les autres hôtes ne sont pas ralentis"
+    print("✓ Hôtes indépendants")
+
+    print("\n✅ Rate limiter : OK\n")
+
+
+def test_json_stream():
+    """Test du décodage en flux des catalogues Shopify."""
+    print("\n🌊 Test Décodage JSON en flux")
+    print("-" * 50)
+
+    from scrapers.shopify import iter_json_array
+
+    chunks = [b'{"products": [{"id": 1, "tags": ["a]"', b'], "title": "x"}, {"id"', b': 2}]}']
+    items = list(iter_json_array(chunks, 'products'))
+    assert items == [{'id': 1, 'tags': ['a]'], 'title': 'x'}, {'id': 2}], f"Éléments inattendus : {items}"
+    print("✓ Éléments découpés entre plusieurs blocs")
+
+    decoded = []
+    try:
+        for item in iter_json_array([b'{"products": [{"id": 1}, {"id'], 'products'):
+            decoded.append(item)
+        raise AssertionError("Un document tronqué doit lever ValueError")
+    except ValueError:
+        pass
+    assert decoded == [{'id': 1}], "Les éléments complets sont rendus avant l'erreur"
+    print("✓ Document tronqué détecté après les éléments complets")
+
+    print("\n✅ Décodage JSON : OK\n")
+
+
 def main():
     """Lance tous les tests."""
     print("=" * 50)
@@ -222,6 +381,9 @@ def main():
         test_brand_matching()
         test_analyzer()
         test_exporters()
+        test_database_migration()
+        test_rate_limiter()
+        test_json_stream()
 
         print("=" * 50)
         print("✅ TOUS LES TESTS RÉUSSIS")